@@ -0,0 +1,74 @@
+"""Compare peak memory of the eager, chunked and streaming ingest paths.
+
+Each mode runs in a fresh subprocess so its peak RSS is measured in
+isolation; the figure reported is the growth over the RSS after imports.
+
+Usage: python benchmarks/bench_ingest_memory.py [--drafts 100000] [--chunksize 100000]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from legacy import legacy_load  # noqa: E402
+from synthetic import write_export  # noqa: E402
+from udexposures.ingest import load_drafts  # noqa: E402
+from udexposures.profiling import peak_rss_bytes  # noqa: E402
+from udexposures.streaming import StreamingExposures  # noqa: E402
+
+MODES = ('legacy', 'eager', 'chunked', 'stream')
+
+
+def run_mode(mode, path, chunksize):
+    """Run one ingest mode in this process and print its timing and peak RSS."""
+    baseline = peak_rss_bytes()
+    start = time.perf_counter()
+    if mode == 'legacy':
+        rows = len(legacy_load(path))
+    elif mode == 'eager':
+        rows = len(load_drafts(path))
+    elif mode == 'chunked':
+        rows = len(load_drafts(path, chunksize=chunksize))
+    else:
+        rows = len(StreamingExposures.from_source(path, chunksize).exposures())
+    elapsed = time.perf_counter() - start
+    peak = peak_rss_bytes()
+    print(f'{rows} {elapsed:.3f} {(peak - baseline) / 1024 ** 2:.1f}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--drafts', type=int, default=100_000)
+    parser.add_argument('--sport', default='NFL', choices=['NFL', 'NBA', 'NHL', 'mixed'])
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    parser.add_argument('--modes', nargs='+', default=list(MODES), choices=MODES)
+    parser.add_argument('--run', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--path', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run_mode(args.run, args.path, args.chunksize)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'export.csv')
+        picks = len(write_export(path, args.sport, args.drafts))
+        size_mb = os.path.getsize(path) / 1024 ** 2
+        print(f'{args.sport}: {args.drafts} drafts per sport, {picks} picks, {size_mb:.0f} MB CSV')
+        print(f"{'mode':<9}{'rows out':>10}{'time (s)':>10}{'peak RSS (MB)':>15}")
+        for mode in args.modes:
+            output = subprocess.run(
+                [sys.executable, __file__, '--run', mode, '--path', path,
+                 '--chunksize', str(args.chunksize)],
+                check=True, capture_output=True, text=True,
+            ).stdout.split()
+            rows, elapsed, peak = output
+            print(f'{mode:<9}{rows:>10}{float(elapsed):>10.2f}{float(peak):>15.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""Fixtures for the pytest-benchmark suite.
+
+Every pipeline benchmark runs once per sport and export size in picks
+(``--bench-rows``). The legacy comparisons are sized in drafts instead
+(``--bench-drafts``, default 1k/10k/100k drafts, i.e. 6k/60k/600k picks), as
+the per-draft apply path they time scales with the number of drafts. The
+synthetic exports and the indexes built from them are made once per size and
+shared by all benchmarks, so only the call under test is timed.
+
+Usage:
+    pytest benchmarks --benchmark-autosave
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=min:20%
+    pytest benchmarks --bench-rows 1000 --bench-sports NFL -k stacks
+    pytest benchmarks/test_bench_legacy.py --bench-drafts 1000 --bench-drafts 10000
+"""
+import functools
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from synthetic import make_export
+from udexposures.adp import PickDistribution
+from udexposures.engine import ExposureReport
+from udexposures.entries import summarize_entries
+from udexposures.ingest import ROSTER_SIZE, load_drafts, normalize_drafts
+from udexposures.paging import TablePager
+from udexposures.player_index import PlayerIndex
+from udexposures.sports import get_sport
+from udexposures.timeline import ExposureTimeline
+
+SPORTS = ('NFL', 'NBA', 'NHL')
+ROWS = (10_000, 100_000)
+DRAFTS = (1_000, 10_000, 100_000)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('udexposures', 'udexposures benchmarks')
+    group.addoption('--bench-rows', type=int, action='append',
+                    help=f'export size in picks; repeat for several (default: {ROWS})')
+    group.addoption('--bench-drafts', type=int, action='append',
+                    help=f'export size in drafts for the legacy comparisons (default: {DRAFTS})')
+    group.addoption('--bench-sports', action='append', choices=SPORTS,
+                    help='sport to benchmark; repeat for several (default: all)')
+
+
+def pytest_generate_tests(metafunc):
+    config = metafunc.config
+    if 'sport' in metafunc.fixturenames:
+        metafunc.parametrize('sport', config.getoption('bench_sports') or SPORTS)
+    if 'rows' in metafunc.fixturenames:
+        metafunc.parametrize('rows', config.getoption('bench_rows') or ROWS)
+    if 'drafts' in metafunc.fixturenames:
+        metafunc.parametrize('drafts', config.getoption('bench_drafts') or DRAFTS)
+
+
+@functools.lru_cache(maxsize=None)
+def prepared(sport, rows):
+    """One synthetic export and everything built from it ahead of the timed calls."""
+    csv = make_export(sport, max(1, rows // ROSTER_SIZE)).to_csv(index=False).encode()
+    df = load_drafts(csv)
+    summary = summarize_entries(df, sport)
+    index = PlayerIndex(df)
+    # The two most drafted players make a search that matches some drafts
+    players = list(index.players[np.argsort(-index.player_drafts)[:2]])
+    picks = PickDistribution(df)
+
+    def report(**filters):
+        return ExposureReport(df, sport=sport, entry_summary=summary, player_index=index,
+                              pick_distribution=picks, **filters)
+
+    exposures = report().exposures
+    # A floor on the two searched players and a cap on the most drafted team
+    targets = pd.DataFrame({
+        'Type': ['Player', 'Player', 'Team'],
+        'Name': players + [df['Team'].value_counts().index[0]],
+        'Floor %': [5.0, 5.0, None],
+        'Cap %': [None, None, 10.0],
+    })
+    planned = report()
+    planned.exposures, planned.filtered_entries
+
+    return SimpleNamespace(
+        sport=sport,
+        csv=csv,
+        df=df,
+        summary=summary,
+        index=index,
+        players=players,
+        rules=get_sport(sport),
+        picks=picks,
+        report=report,
+        exposures=exposures,
+        pager=TablePager(exposures),
+        targets=targets,
+        planned=planned,
+        timeline=ExposureTimeline(df),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def prepared_drafts(sport, n_drafts):
+    """Picks of ``n_drafts`` complete drafts, plus a player index for searching them."""
+    df = normalize_drafts(make_export(sport, n_drafts, invalid_pools=0, full_schema=False))
+    index = PlayerIndex(df)
+    return SimpleNamespace(
+        sport=sport,
+        df=df,
+        index=index,
+        players=list(index.players[np.argsort(-index.player_drafts)[:2]]),
+        rules=get_sport(sport),
+        # Only the columns the stack classifiers read, typed as after ingest
+        stack_df=df[['Draft Entry', 'Team', 'Position']].copy(),
+    )
+
+
+@pytest.fixture
+def data(sport, rows):
+    return prepared(sport, rows)
+
+
+@pytest.fixture
+def drafts_data(sport, drafts):
+    return prepared_drafts(sport, drafts)
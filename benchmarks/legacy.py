@@ -0,0 +1,108 @@
+"""What the dashboard did before each optimization, kept as references.
+
+The tests check the optimized paths against these, and the benchmarks time
+them side by side. They are copies of the original code and should not be
+changed to match newer behaviour.
+"""
+import pandas as pd
+
+
+def legacy_load(path):
+    # What the dashboard did before the ingest module
+    df = pd.read_csv(path)
+    df['Player'] = df['First Name'] + ' ' + df['Last Name']
+    draft_counts = df.groupby('Draft Pool').size()
+    valid_drafts = draft_counts[draft_counts % 6 == 0].index
+    return df[df['Draft Pool'].isin(valid_drafts)]
+
+
+def legacy_player_search(df, players):
+    """Rows of drafts containing every one of ``players``, one string scan per player."""
+    draft_mask = None
+    for player in players:
+        player_drafts = set(df[df['Player'].str.strip() == player.strip()]['Draft Entry'])
+        if draft_mask is None:
+            draft_mask = df['Draft Entry'].isin(player_drafts)
+        else:
+            draft_mask &= df['Draft Entry'].isin(player_drafts)
+    return df[draft_mask]
+
+
+# Per-draft callbacks as they ran inside the dashboard before vectorizing
+def legacy_nfl_stacks(group):
+    qb_row = group[group['Position'] == 'QB']
+    if len(qb_row) != 1:
+        return 'Invalid'
+    qb_team = qb_row.iloc[0]['Team']
+    stack_count = len(group[(group['Position'] != 'QB') & (group['Team'] == qb_team)])
+    if stack_count == 0:
+        return 'Naked QB'
+    elif stack_count == 1:
+        return 'Skinny'
+    elif stack_count == 2:
+        return 'Double'
+    else:
+        return 'Triple+'
+
+
+def legacy_nba_stacks(group):
+    team_counts = group['Team'].value_counts()
+    team_counts = team_counts[team_counts > 0]
+    if len(team_counts) == 6:
+        return '6 Unique'
+    elif team_counts.iloc[0] == 3:
+        if team_counts.iloc[1] == 3:
+            return '3-3'
+        elif team_counts.iloc[1] == 2:
+            return '3-2-1'
+        else:
+            return '3-1-1-1'
+    elif team_counts.iloc[0] == 2:
+        if team_counts.iloc[1] == 2:
+            if team_counts.iloc[2] == 2:
+                return '2-2-2'
+            else:
+                return '2-2-1-1'
+        else:
+            return '2-1-1-1-1'
+    else:
+        return 'Other'
+
+
+def legacy_nhl_stacks(group):
+    group['Position'] = group['Position'].astype(str).replace({'LW': 'W', 'RW': 'W'})
+    team_positions = group.groupby('Team', observed=True)['Position'].agg(list)
+    team_stacks = []
+    for team, positions in team_positions.items():
+        if 'G' in positions:
+            positions.remove('G')
+        pos_count = {
+            'C': positions.count('C'),
+            'W': positions.count('W'),
+            'D': positions.count('D')
+        }
+        if pos_count['C'] >= 1 and pos_count['W'] >= 1 and pos_count['D'] == 0:
+            team_stacks.append('C-W')
+        elif pos_count['C'] >= 1 and pos_count['W'] >= 1 and pos_count['D'] >= 1:
+            team_stacks.append('C-W-D')
+        elif pos_count['C'] >= 1 and pos_count['D'] >= 1 and pos_count['W'] == 0:
+            team_stacks.append('C-D')
+        elif pos_count['C'] == 0 and pos_count['W'] >= 1 and pos_count['D'] >= 1:
+            team_stacks.append('W-D')
+        elif pos_count['C'] == 0 and pos_count['W'] >= 2 and pos_count['D'] >= 1:
+            team_stacks.append('W-W-D')
+    if team_stacks:
+        return max(team_stacks, key=len)
+    return 'No Stack'
+
+
+LEGACY_STACKS = {
+    'NFL': legacy_nfl_stacks,
+    'NBA': legacy_nba_stacks,
+    'NHL': legacy_nhl_stacks,
+}
+
+
+def legacy_stack_labels(df, sport):
+    """Stack label per ``Draft Entry`` from the per-draft groupby-apply path."""
+    return df.groupby('Draft Entry', observed=True).apply(LEGACY_STACKS[sport])
@@ -0,0 +1,288 @@
+"""Load-test the dashboard with concurrent browser sessions.
+
+Starts the app on a local Streamlit server (or targets a running one with
+``--url``) and drives N sessions over the same websocket protocol the
+browser uses. Each session loads the page, uploads a synthetic export
+through the upload endpoint, then changes the Position and Team filters a
+few times. Rerun latency is reported per step (p50/p95/max over all
+sessions), with the peak RSS of the server when this script started it.
+Any error the app shows (``st.error`` or an exception) fails the run.
+
+``--uploads`` sets how many distinct exports the sessions share between
+them: the default gives every session its own, ``--uploads 1`` has them all
+look at the same one (so all but the first hit the shared caches).
+
+Usage:
+    python benchmarks/load_test.py [--sessions 10] [--drafts 2000] [--reruns 5]
+    python benchmarks/load_test.py --url http://localhost:8501 --sessions 20
+    UDEXPOSURES_SESSION_MB=64 python benchmarks/load_test.py --sessions 50 --uploads 5
+"""
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+import requests
+import websockets
+from streamlit.proto.Alert_pb2 import Alert
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic import make_export  # noqa: E402
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'exposures.py')
+FILTERS = ('Filter by Position', 'Filter by Team')
+
+
+def start_server(port):
+    """Run the app headless on ``port``; returns the server process."""
+    command = [
+        sys.executable, '-m', 'streamlit', 'run', APP,
+        '--server.headless', 'true',
+        '--server.port', str(port),
+        # The harness does not carry the browser's XSRF cookie
+        '--server.enableXsrfProtection', 'false',
+        '--browser.gatherUsageStats', 'false',
+    ]
+    return subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def wait_ready(url, server=None, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server is not None and server.poll() is not None:
+            raise RuntimeError(f'server exited with status {server.returncode} (is {url} in use?)')
+        try:
+            with urllib.request.urlopen(f'{url}/_stcore/health', timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.25)
+    raise RuntimeError(f'no server at {url} after {timeout}s')
+
+
+class RssSampler(threading.Thread):
+    """Peak resident memory of a process, sampled from /proc."""
+
+    def __init__(self, pid, interval=0.1):
+        super().__init__(daemon=True)
+        self.path = f'/proc/{pid}/status'
+        self.interval = interval
+        self.peak = 0
+        self._done = threading.Event()
+
+    def rss(self):
+        try:
+            with open(self.path) as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+        return 0
+
+    def run(self):
+        while not self._done.is_set():
+            rss = self.rss()
+            self.peak = max(self.peak, rss)
+            self._done.wait(self.interval)
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+
+class Session:
+    """One browser tab: a websocket to the app and the widget states it sends."""
+
+    def __init__(self, url):
+        self.url = url
+        self.widgets = {}
+        self.elements = {}
+        self.session_id = None
+        self.page_hash = ''
+        self.errors = []
+
+    async def __aenter__(self):
+        self.ws = await websockets.connect(
+            self.url.replace('http', 'ws', 1) + '/_stcore/stream',
+            subprotocols=['streamlit'],
+            max_size=None,
+        )
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.ws.close()
+
+    async def send(self, msg):
+        await self.ws.send(msg.SerializeToString())
+
+    async def receive(self):
+        msg = ForwardMsg()
+        msg.ParseFromString(await self.ws.recv())
+        if msg.HasField('new_session'):
+            self.session_id = msg.new_session.initialize.session_id or self.session_id
+            self.page_hash = msg.new_session.page_script_hash
+        return msg
+
+    async def rerun(self):
+        """Rerun the script with the current widget states; returns seconds taken."""
+        msg = BackMsg()
+        msg.rerun_script.page_script_hash = self.page_hash
+        msg.rerun_script.widget_states.widgets.extend(self.widgets.values())
+        start = time.perf_counter()
+        await self.send(msg)
+        while True:
+            reply = await self.receive()
+            if reply.HasField('delta') and reply.delta.HasField('new_element'):
+                element = reply.delta.new_element
+                kind = element.WhichOneof('type')
+                # The app reports failures with st.error; st.exception only when profiling
+                if kind == 'exception':
+                    self.errors.append(element.exception.message)
+                elif kind == 'alert' and element.alert.format == Alert.ERROR:
+                    self.errors.append(element.alert.body)
+                elif kind in ('selectbox', 'file_uploader'):
+                    widget = getattr(element, kind)
+                    self.elements[widget.label or kind] = widget
+            if reply.HasField('script_finished'):
+                return time.perf_counter() - start
+
+    async def upload(self, name, data):
+        """Send a file to the page's uploader, as dropping it on the page would."""
+        uploader = self.elements['file_uploader']
+        msg = BackMsg()
+        msg.file_urls_request.request_id = name
+        msg.file_urls_request.file_names.append(name)
+        msg.file_urls_request.session_id = self.session_id
+        await self.send(msg)
+        while True:
+            reply = await self.receive()
+            if reply.HasField('file_urls_response') and reply.file_urls_response.response_id == name:
+                urls = reply.file_urls_response.file_urls[0]
+                break
+        response = await asyncio.to_thread(
+            requests.put, self.url + urls.upload_url, files={'file': (name, data, 'text/csv')}
+        )
+        response.raise_for_status()
+
+        state = self.widgets.setdefault(uploader.id, WidgetState(id=uploader.id))
+        info = state.file_uploader_state_value.uploaded_file_info.add()
+        info.name, info.size, info.file_id = name, len(data), urls.file_id
+        info.file_urls.CopyFrom(urls)
+
+    def choose(self, label, rng):
+        """Pick another option of a select box at random."""
+        widget = self.elements.get(label)
+        if widget is None:
+            return False
+        state = self.widgets.setdefault(widget.id, WidgetState(id=widget.id))
+        state.string_value = rng.choice(list(widget.options))
+        return True
+
+
+async def run_session(url, index, export, reruns, timings, seed):
+    rng = random.Random(seed + index)
+    async with Session(url) as session:
+        timings['load'].append(await session.rerun())
+        await session.upload(f'export_{index}.csv', export)
+        timings['upload'].append(await session.rerun())
+        for _ in range(reruns):
+            if session.choose(rng.choice(FILTERS), rng):
+                timings['filter'].append(await session.rerun())
+        timings['unchanged'].append(await session.rerun())
+    return session.errors
+
+
+async def run_sessions(url, exports, sessions, reruns, ramp, seed):
+    timings = {'load': [], 'upload': [], 'filter': [], 'unchanged': []}
+
+    async def start(index):
+        await asyncio.sleep(index * ramp)
+        return await run_session(url, index, exports[index % len(exports)], reruns, timings, seed)
+
+    results = await asyncio.gather(*(start(index) for index in range(sessions)), return_exceptions=True)
+    return timings, results
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(int(q / 100 * len(values)), len(values) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', help='running server to test (default: start one)')
+    parser.add_argument('--port', type=int, default=8599, help='port of the server this script starts')
+    parser.add_argument('--sessions', type=int, default=10)
+    parser.add_argument('--uploads', type=int, help='distinct exports (default: one per session)')
+    parser.add_argument('--sport', default='NFL', choices=('NFL', 'NBA', 'NHL'))
+    parser.add_argument('--drafts', type=int, default=2000, help='drafts per export')
+    parser.add_argument('--reruns', type=int, default=5, help='filter changes per session')
+    parser.add_argument('--ramp', type=float, default=0.1, help='seconds between session starts')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    uploads = min(args.uploads or args.sessions, args.sessions)
+    exports = [make_export(args.sport, args.drafts, seed=args.seed + i).to_csv(index=False).encode()
+               for i in range(uploads)]
+    print(f'{args.sessions} sessions, {uploads} distinct {args.sport} exports of {args.drafts} drafts '
+          f'({len(exports[0]) / 1024 ** 2:.1f} MB each)')
+
+    server = sampler = None
+    url = args.url
+    if url is None:
+        url = f'http://localhost:{args.port}'
+        server = start_server(args.port)
+    try:
+        wait_ready(url, server)
+        if server is not None:
+            sampler = RssSampler(server.pid)
+            idle_rss = sampler.rss()
+            sampler.start()
+        start = time.perf_counter()
+        timings, results = asyncio.run(
+            run_sessions(url, exports, args.sessions, args.reruns, args.ramp, args.seed)
+        )
+        elapsed = time.perf_counter() - start
+    finally:
+        end_rss = sampler.rss() if sampler is not None else 0
+        if server is not None:
+            server.terminate()
+            server.wait()
+        if sampler is not None:
+            sampler.stop()
+
+    print(f"\n{'step':<12}{'reruns':>8}{'p50 (ms)':>11}{'p95 (ms)':>11}{'max (ms)':>11}")
+    for step, values in timings.items():
+        if values:
+            print(f'{step:<12}{len(values):>8}{percentile(values, 50) * 1000:>11.0f}'
+                  f'{percentile(values, 95) * 1000:>11.0f}{max(values) * 1000:>11.0f}')
+    reruns = sum(len(values) for values in timings.values())
+    print(f'\n{reruns} reruns in {elapsed:.1f}s ({reruns / elapsed:.1f}/s)')
+    if sampler is not None:
+        print(f'server RSS: {idle_rss / 1024 ** 2:.0f} MB idle, {sampler.peak / 1024 ** 2:.0f} MB peak, '
+              f'{end_rss / 1024 ** 2:.0f} MB at the end')
+
+    failures = [result for result in results if isinstance(result, BaseException)]
+    errors = [error for result in results if isinstance(result, list) for error in result]
+    for failure in failures[:5]:
+        print(f'session failed: {failure!r}')
+    if errors:
+        # Timings above include these reruns, which stop early
+        print(f'{len(errors)} errors shown by the app:')
+    for error in sorted(set(errors))[:5]:
+        print(f'app error: {error}')
+    return 1 if failures or errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,334 @@
+"""Synthetic Underdog draft exports for benchmarks and demos.
+
+Exports follow the column schema of a real Underdog export (the README
+columns plus the tournament and weekly-winner fields). Every generated
+draft is a 6-pick snake draft from one draft pool's slate of teams:
+
+- players have a stable name, team, position and depth chart slot per sport,
+  and better players go earlier, so pick numbers give each player an ADP
+- picks lean towards one team per draft (NFL stacks build around the QB)
+- NFL drafts follow the usual builds, with the odd two-QB draft
+- a few extra pools hold an unfinished draft, so their pick count is not a
+  multiple of the roster size and ingest drops them
+
+Usage: python benchmarks/synthetic.py NFL --rows 1000000 -o nfl.csv
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from udexposures.ingest import REQUIRED_COLUMNS, ROSTER_SIZE  # noqa: E402
+from udexposures.teams import team_metadata  # noqa: E402
+
+# Column order of a real export
+EXPORT_COLUMNS = [
+    'Picked At',
+    'Pick Number',
+    'Appearance',
+    'First Name',
+    'Last Name',
+    'Team',
+    'Position',
+    'Draft',
+    'Draft Entry',
+    'Draft Entry Fee',
+    'Draft Size',
+    'Draft Total Prizes',
+    'Tournament Title',
+    'Tournament',
+    'Tournament Entry Fee',
+    'Tournament Total Prizes',
+    'Tournament Size',
+    'Draft Pool Title',
+    'Draft Pool',
+    'Draft Pool Entry Fee',
+    'Draft Pool Total Prizes',
+    'Draft Pool Size',
+    'Weekly Winner Title',
+    'Weekly Winner',
+    'Weekly Winner Entry Fee',
+    'Weekly Winner Total Prizes',
+    'Weekly Winner Size',
+]
+
+# Players per team at each position, and how early the position goes
+DEPTH_CHARTS = {
+    'NFL': {'QB': 2, 'RB': 3, 'WR': 5, 'TE': 2},
+    'NBA': {'PG': 2, 'SG': 2, 'SF': 2, 'PF': 2, 'C': 2},
+    'NHL': {'C': 4, 'LW': 4, 'RW': 4, 'D': 6, 'G': 2},
+}
+POSITION_VALUE = {
+    'NFL': {'QB': 1.0, 'RB': 1.1, 'WR': 1.1, 'TE': 0.8},
+    'NBA': {'PG': 1.0, 'SG': 0.9, 'SF': 0.9, 'PF': 0.9, 'C': 1.0},
+    'NHL': {'C': 1.0, 'LW': 0.9, 'RW': 0.9, 'D': 0.7, 'G': 0.8},
+}
+
+# NFL rosters: one QB plus one of the common builds; the last one is invalid
+NFL_BUILDS = [
+    ['QB', 'RB', 'RB', 'WR', 'WR', 'TE'],
+    ['QB', 'RB', 'WR', 'WR', 'WR', 'TE'],
+    ['QB', 'RB', 'WR', 'WR', 'TE', 'TE'],
+    ['QB', 'RB', 'RB', 'WR', 'WR', 'WR'],
+    ['QB', 'QB', 'RB', 'WR', 'WR', 'TE'],
+]
+NFL_BUILD_WEIGHTS = [0.35, 0.35, 0.1, 0.19, 0.01]
+
+FIRST_NAMES = [
+    'Aaron', 'Adrian', 'Alex', 'Andre', 'Austin', 'Ben', 'Brandon', 'Brian', 'Caleb', 'Cam',
+    'Carlos', 'Chris', 'Cole', 'Connor', 'Dallas', 'Darius', 'David', 'Derek', 'Devin', 'Drew',
+    'Dylan', 'Eli', 'Evan', 'Gabe', 'Grant', 'Isaiah', 'Jake', 'Jalen', 'Jamal', 'Jason',
+    'Jaylen', 'Joe', 'Jordan', 'Josh', 'Justin', 'Kyle', 'Lamar', 'Logan', 'Marcus', 'Mason',
+    'Matt', 'Mike', 'Nick', 'Noah', 'Patrick', 'Ryan', 'Sam', 'Trey', 'Tyler', 'Zach',
+]
+LAST_NAMES = [
+    'Adams', 'Allen', 'Bailey', 'Baker', 'Bell', 'Brooks', 'Brown', 'Carter', 'Clark', 'Collins',
+    'Cook', 'Cooper', 'Davis', 'Edwards', 'Evans', 'Fisher', 'Ford', 'Foster', 'Gray', 'Green',
+    'Hall', 'Harris', 'Hayes', 'Hill', 'Howard', 'Hughes', 'Jackson', 'James', 'Johnson', 'Jones',
+    'Kelly', 'King', 'Lewis', 'Long', 'Martin', 'Miller', 'Mitchell', 'Moore', 'Morgan', 'Murphy',
+    'Nelson', 'Parker', 'Perry', 'Phillips', 'Powell', 'Price', 'Reed', 'Rivera', 'Roberts', 'Rogers',
+    'Ross', 'Russell', 'Scott', 'Smith', 'Stewart', 'Taylor', 'Thomas', 'Turner', 'Walker', 'Ward',
+    'Watson', 'White', 'Williams', 'Wilson', 'Wood', 'Wright', 'Young',
+]
+
+DRAFTS_PER_POOL = 40
+STACK_RATE = 0.4
+ENTRY_FEES = [1.0, 3.0, 5.0, 10.0, 25.0]
+START_DATE = pd.Timestamp('2024-09-01')
+
+
+def _uuids(rng, n):
+    digits = rng.bytes(16 * n).hex()
+    return [
+        f'{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}'
+        for h in (digits[i:i + 32] for i in range(0, 32 * n, 32))
+    ]
+
+
+def _export_timestamps(values):
+    # Exports write '2024-09-08 17:03:21 UTC'; numpy formats far faster than strftime
+    iso = np.datetime_as_string(values.to_numpy().astype('datetime64[s]'), unit='s')
+    return np.char.add(np.char.replace(iso, 'T', ' '), ' UTC')
+
+
+def player_pool(sport):
+    """Every player of a sport: name, team, position, depth slot and draft value.
+
+    The pool depends only on the sport, so the same players appear in every
+    export generated for it.
+    """
+    rng = np.random.default_rng(list(DEPTH_CHARTS).index(sport))
+    teams = team_metadata(sport).index.to_numpy()
+    rows = []
+    for position, depth in DEPTH_CHARTS[sport].items():
+        for team in teams:
+            for slot in range(depth):
+                rows.append((team, position, slot))
+    players = pd.DataFrame(rows, columns=['Team', 'Position', 'Depth'])
+
+    # Unique first/last name combinations
+    names = rng.permutation(len(FIRST_NAMES) * len(LAST_NAMES))[:len(players)]
+    players['First Name'] = np.asarray(FIRST_NAMES)[names % len(FIRST_NAMES)]
+    players['Last Name'] = np.asarray(LAST_NAMES)[names // len(FIRST_NAMES)]
+
+    # Starters and stronger teams go first
+    team_strength = pd.Series(rng.normal(1.0, 0.15, len(teams)), index=teams)
+    players['Value'] = (
+        players['Position'].map(POSITION_VALUE[sport])
+        * team_strength.reindex(players['Team']).to_numpy()
+        / (1 + players['Depth'])
+    )
+    return players
+
+
+def _draft_positions(sport, rng, n_drafts):
+    """Position codes (into ``DEPTH_CHARTS[sport]``) of every pick, drafts x picks."""
+    positions = list(DEPTH_CHARTS[sport])
+    if sport == 'NFL':
+        builds = np.array([[positions.index(pos) for pos in build] for build in NFL_BUILDS])
+        return builds[rng.choice(len(builds), size=n_drafts, p=NFL_BUILD_WEIGHTS)]
+    if sport == 'NHL':
+        # Skaters, plus a goalie in about half of the drafts
+        picks = rng.integers(positions.index('G'), size=(n_drafts, ROSTER_SIZE))
+        with_goalie = rng.random(n_drafts) < 0.5
+        picks[with_goalie, -1] = positions.index('G')
+        return picks
+    return rng.integers(len(positions), size=(n_drafts, ROSTER_SIZE))
+
+
+def make_export(sport='NFL', n_drafts=1000, seed=0, invalid_pools=2, full_schema=True):
+    """A synthetic export with ``n_drafts`` complete drafts (6 rows each).
+
+    ``invalid_pools`` extra pools hold one unfinished draft each. With
+    ``full_schema=False`` only ``REQUIRED_COLUMNS`` are returned.
+    """
+    if sport not in DEPTH_CHARTS:
+        raise KeyError(f'No synthetic players for sport {sport!r}')
+    rng = np.random.default_rng(seed)
+    players = player_pool(sport)
+    positions = list(DEPTH_CHARTS[sport])
+    teams = players['Team'].unique()
+    n_teams = len(teams)
+
+    # Pools: a slate of teams, an entry fee, a draft size and a date each
+    n_valid_pools = max(1, n_drafts // DRAFTS_PER_POOL)
+    n_pools = n_valid_pools + invalid_pools
+    slates = np.argsort(rng.random((n_pools, n_teams)), axis=1)
+    slate_size = rng.integers(min(4, n_teams), n_teams + 1, size=n_pools)
+    pool_fee = rng.choice(ENTRY_FEES, size=n_pools)
+    pool_draft_size = rng.integers(2, 7, size=n_pools)
+    pool_date = START_DATE + pd.to_timedelta(rng.integers(0, 120, size=n_pools), unit='D')
+
+    # Drafts: the unfinished drafts come last, one per invalid pool
+    total_drafts = n_drafts + invalid_pools
+    draft_pool = np.concatenate([
+        rng.integers(n_valid_pools, size=n_drafts),
+        np.arange(n_valid_pools, n_pools),
+    ])
+    draft_slot = np.floor(rng.random(total_drafts) * pool_draft_size[draft_pool]).astype(np.int64) + 1
+
+    # Picks: position from the roster shape, team from the pool's slate with a
+    # lean towards the draft's stack team, depth skewed towards starters
+    position = _draft_positions(sport, rng, total_drafts)
+    slate_pick = lambda shape: np.floor(rng.random(shape) * slate_size[draft_pool, None]).astype(np.int64)
+    stack_team = slates[draft_pool, slate_pick((total_drafts, 1))[:, 0]]
+    team = slates[draft_pool[:, None], slate_pick((total_drafts, ROSTER_SIZE))]
+    stacked = rng.random((total_drafts, ROSTER_SIZE)) < STACK_RATE
+    if sport == 'NFL':
+        stacked |= position == positions.index('QB')
+    team = np.where(stacked, stack_team[:, None], team)
+
+    # Player rows are ordered position -> team -> depth slot
+    depth = np.array([DEPTH_CHARTS[sport][pos] for pos in positions])
+    offsets = np.concatenate([[0], np.cumsum(depth * n_teams)[:-1]])
+
+    def draw(mask):
+        slot = np.floor(rng.random(mask.sum()) ** 2 * depth[position[mask]]).astype(np.int64)
+        return offsets[position[mask]] + team[mask] * depth[position[mask]] + slot
+
+    player = draw(np.ones_like(position, dtype=bool)).reshape(position.shape)
+    # A player can only be picked once per draft: redraw repeats from anywhere on the slate
+    for _ in range(20):
+        order = np.argsort(player, axis=1, kind='stable')
+        ordered = np.take_along_axis(player, order, axis=1)
+        repeat_sorted = np.zeros_like(player, dtype=bool)
+        repeat_sorted[:, 1:] = ordered[:, 1:] == ordered[:, :-1]
+        if not repeat_sorted.any():
+            break
+        repeated = np.zeros_like(repeat_sorted)
+        np.put_along_axis(repeated, order, repeat_sorted, axis=1)
+        pools = draft_pool[np.nonzero(repeated)[0]]
+        team[repeated] = slates[pools, np.floor(rng.random(len(pools)) * slate_size[pools]).astype(np.int64)]
+        player[repeated] = draw(repeated)
+
+    # Better players go earlier: order each draft's picks by noisy value
+    value = players['Value'].to_numpy()[player] * rng.lognormal(0, 0.25, player.shape)
+    order = np.argsort(-value, axis=1)
+    player = np.take_along_axis(player, order, axis=1)
+
+    # Snake draft pick numbers from the draft seat
+    rounds = np.arange(ROSTER_SIZE)
+    size = pool_draft_size[draft_pool][:, None]
+    seat = draft_slot[:, None]
+    pick_number = rounds * size + np.where(rounds % 2 == 0, seat, size + 1 - seat)
+
+    # Each unfinished draft keeps only its first 1-5 picks
+    keep = np.ones_like(player, dtype=bool)
+    cut = rng.integers(1, ROSTER_SIZE, size=invalid_pools)
+    keep[n_drafts:] = rounds[None, :] < cut[:, None]
+
+    entry = np.repeat(np.arange(total_drafts), ROSTER_SIZE)[keep.ravel()]
+    player = player[keep]
+    pool = draft_pool[entry]
+    started = pool_date[pool] + pd.to_timedelta(rng.integers(0, 16 * 3600, size=total_drafts)[entry], unit='s')
+    picked_at = started + pd.to_timedelta(pick_number[keep] * 30, unit='s')
+
+    pool_ids = _uuids(rng, n_pools)
+    entry_ids = _uuids(rng, total_drafts)
+    draft_ids = _uuids(rng, total_drafts)
+    pool_titles = [
+        f'{sport} {date:%b} {date.day} Daily {size}-Team ${fee:g}'
+        for date, size, fee in zip(pool_date, pool_draft_size, pool_fee)
+    ]
+
+    df = pd.DataFrame({
+        'Picked At': _export_timestamps(picked_at),
+        'Pick Number': pick_number[keep],
+        'Appearance': pd.Categorical.from_codes(player, _uuids(np.random.default_rng(seed), len(players))),
+        'First Name': players['First Name'].to_numpy()[player],
+        'Last Name': players['Last Name'].to_numpy()[player],
+        'Team': players['Team'].to_numpy()[player],
+        'Position': players['Position'].to_numpy()[player],
+        'Draft': pd.Categorical.from_codes(entry, draft_ids),
+        'Draft Entry': pd.Categorical.from_codes(entry, entry_ids),
+        'Draft Entry Fee': pool_fee[pool],
+        'Draft Size': pool_draft_size[pool],
+        'Draft Total Prizes': pool_fee[pool] * pool_draft_size[pool] * 0.9,
+        'Tournament Title': '',
+        'Tournament': '',
+        'Tournament Entry Fee': '',
+        'Tournament Total Prizes': '',
+        'Tournament Size': '',
+        # Titles repeat across pools that share a date, size and fee
+        'Draft Pool Title': pd.Categorical(np.asarray(pool_titles)[pool]),
+        'Draft Pool': pd.Categorical.from_codes(pool, pool_ids),
+        'Draft Pool Entry Fee': pool_fee[pool],
+        'Draft Pool Total Prizes': pool_fee[pool] * DRAFTS_PER_POOL * 0.9,
+        'Draft Pool Size': DRAFTS_PER_POOL * pool_draft_size[pool],
+        'Weekly Winner Title': '',
+        'Weekly Winner': '',
+        'Weekly Winner Entry Fee': '',
+        'Weekly Winner Total Prizes': '',
+        'Weekly Winner Size': '',
+    })
+    return df[EXPORT_COLUMNS if full_schema else REQUIRED_COLUMNS]
+
+
+def make_mixed_export(n_drafts, seed=0, invalid_pools=2, full_schema=True):
+    """One export holding ``n_drafts`` drafts of every sport."""
+    return pd.concat(
+        [make_export(sport, n_drafts, seed + i, invalid_pools, full_schema)
+         for i, sport in enumerate(DEPTH_CHARTS)],
+        ignore_index=True,
+    )
+
+
+def write_export(path, sport='NFL', n_drafts=1000, seed=0, invalid_pools=2, full_schema=True):
+    """Write ``make_export`` (or ``make_mixed_export`` for sport 'mixed') as CSV."""
+    if sport == 'mixed':
+        df = make_mixed_export(n_drafts, seed, invalid_pools, full_schema)
+    else:
+        df = make_export(sport, n_drafts, seed, invalid_pools, full_schema)
+    df.to_csv(path, index=False)
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('sport', choices=list(DEPTH_CHARTS) + ['mixed'])
+    parser.add_argument('--rows', type=int, default=6000,
+                        help='about this many picks (rounded down to whole drafts)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--invalid-pools', type=int, default=2)
+    parser.add_argument('--required-only', action='store_true',
+                        help='write only the columns the dashboard reads')
+    parser.add_argument('-o', '--output', default='-')
+    args = parser.parse_args()
+
+    df = write_export(
+        sys.stdout if args.output == '-' else args.output,
+        args.sport,
+        max(1, args.rows // ROSTER_SIZE),
+        args.seed,
+        args.invalid_pools,
+        not args.required_only,
+    )
+    print(f'{len(df)} picks written', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+"""Optimized paths timed next to the code they replaced.
+
+Each pair shares a benchmark group, so the report shows the speedup
+directly. Sizes are in drafts (``--bench-drafts``); the legacy paths are
+slow on large exports and run a single round.
+"""
+from legacy import legacy_player_search, legacy_stack_labels
+from udexposures.engine import select_players
+
+LEGACY_ROUNDS = 1
+
+
+def test_stacks_apply(benchmark, drafts_data, drafts):
+    benchmark.group = f'stacks-{drafts_data.sport}-{drafts}-drafts'
+    benchmark.pedantic(legacy_stack_labels, (drafts_data.stack_df, drafts_data.sport), rounds=LEGACY_ROUNDS)
+
+
+def test_stacks_vectorized(benchmark, drafts_data, drafts):
+    benchmark.group = f'stacks-{drafts_data.sport}-{drafts}-drafts'
+    benchmark(drafts_data.rules.stack_classifier, drafts_data.stack_df)
+
+
+def test_player_search_scan(benchmark, drafts_data, drafts):
+    benchmark.group = f'player-search-{drafts_data.sport}-{drafts}-drafts'
+    benchmark.pedantic(legacy_player_search, (drafts_data.df, drafts_data.players), rounds=LEGACY_ROUNDS)
+
+
+def test_player_search_index(benchmark, drafts_data, drafts):
+    benchmark.group = f'player-search-{drafts_data.sport}-{drafts}-drafts'
+    benchmark(select_players, drafts_data.df, drafts_data.players, drafts_data.index)
@@ -0,0 +1,108 @@
+"""Timings of each pipeline stage, per sport and export size.
+
+Covers ingest, player search, exposure aggregation, pick distributions,
+paging, rebalancing plans, roster composition, stack classification and
+exposure over time. Results are compared across commits with
+``--benchmark-autosave`` and ``--benchmark-compare``.
+"""
+import io
+
+from udexposures.adp import PickDistribution
+from udexposures.entries import summarize_entries
+from udexposures.ingest import CHUNKSIZE, load_drafts
+from udexposures.paging import TablePager
+from udexposures.player_index import PlayerIndex
+from udexposures.rebalance import plan_rebalance
+from udexposures.sports import split_sports
+from udexposures.timeline import ExposureTimeline
+
+
+def test_ingest(benchmark, data):
+    benchmark(load_drafts, data.csv)
+
+
+def test_ingest_chunked(benchmark, data):
+    benchmark(lambda: load_drafts(io.BytesIO(data.csv), chunksize=CHUNKSIZE))
+
+
+def test_split_sports(benchmark, data):
+    benchmark(split_sports, data.df)
+
+
+def test_entry_summary(benchmark, data):
+    benchmark(summarize_entries, data.df, data.sport)
+
+
+def test_player_index(benchmark, data):
+    benchmark(PlayerIndex, data.df)
+
+
+def test_player_search(benchmark, data):
+    benchmark(data.index.row_mask, data.players)
+
+
+def test_exposures(benchmark, data):
+    benchmark(lambda: data.report().exposures)
+
+
+def test_exposures_players(benchmark, data):
+    benchmark(lambda: data.report(players=data.players).exposures)
+
+
+def test_pick_distribution(benchmark, data):
+    benchmark(PickDistribution, data.df)
+
+
+def test_pick_percentiles(benchmark, data):
+    benchmark(lambda: [data.picks.percentile(q) for q in (10, 25, 50, 75, 90)])
+
+
+def test_pick_histogram(benchmark, data):
+    benchmark(data.picks.histogram)
+
+
+def test_exposures_pager(benchmark, data):
+    benchmark(lambda: TablePager(data.exposures).view('Avg Pick'))
+
+
+def test_exposures_page(benchmark, data):
+    pager = data.pager
+    benchmark(lambda: pager.page(pager.view('Avg Pick', False, 'a'), 2, 50))
+
+
+def test_rebalance(benchmark, data):
+    benchmark(plan_rebalance, data.planned, 50, data.targets, player_cap=20)
+
+
+def test_co_drafted(benchmark, data):
+    benchmark(lambda: data.report(players=data.players).co_drafted)
+
+
+def test_composition(benchmark, data):
+    def composition():
+        report = data.report()
+        report.team_distribution
+        return report.build_distribution if data.rules.build_classifier else report.position_distribution
+
+    benchmark(composition)
+
+
+def test_stacks(benchmark, data):
+    benchmark(data.rules.stack_classifier, data.df)
+
+
+def test_timeline(benchmark, data):
+    benchmark(ExposureTimeline, data.df)
+
+
+def test_timeline_weekly(benchmark, data):
+    benchmark(data.timeline.buckets, 'W')
+
+
+def test_timeline_rolling(benchmark, data):
+    benchmark(data.timeline.rolling, data.players, window=100)
+
+
+def test_timeline_snapshot(benchmark, data):
+    timeline = data.timeline
+    benchmark(timeline.snapshot, timeline.entry_times[timeline.n_entries // 2])
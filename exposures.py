@@ -1,9 +1,29 @@
 #exposures
+import functools
+import uuid
+from contextlib import contextmanager
+
 import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
 import altair as alt  # Import Altair for bar charts
+from udexposures import engine
+from udexposures.adp import PickDistribution, read_field_adp
+from udexposures.cache import ResultCache
+from udexposures.correlation import CoExposure
+from udexposures.encoding import DraftEncoding
+from udexposures.paging import TablePager, page_count
+from udexposures.entries import summarize_sports
+from udexposures.ingest import CHUNKSIZE, upload_digest
+from udexposures.player_index import PlayerIndex
+from udexposures.portfolio import load_portfolio, portfolio_digest
+from udexposures.profiling import Profiler, peak_rss_bytes
+from udexposures.rebalance import TARGET_TYPES, plan_rebalance
+from udexposures.sessions import SessionTracker, session_limits
+from udexposures.sports import SPORTS, get_sport, split_sports
+from udexposures.teams import DEFAULT_COLOR, team_colors
+from udexposures.timeline import FREQUENCIES, ExposureTimeline
 
 # Set page to wide mode at the very top of the file
 st.set_page_config(layout="wide")
@@ -26,152 +46,749 @@ with col_feedback:
         </a>
     """, unsafe_allow_html=True)
 
+# Opt-in timing of every pipeline stage; each full rerun starts a fresh trace, and each
+# panel run (as part of a full rerun or on its own) gets one of its own
+profiling = st.sidebar.toggle("Profile reruns", help="Time each stage of the dashboard and show a waterfall below")
+st.session_state.profiler = Profiler(enabled=profiling, name="rerun")
+st.session_state.setdefault("panel_profilers", {})
+
+field_adp_file = st.sidebar.file_uploader(
+    "Field ADP (optional)",
+    type=['csv'],
+    help="Player ADPs to compare your picks against, e.g. Underdog's rankings export "
+         "(Player or firstName/lastName columns plus ADP)"
+)
+
+
+def span(name, **attrs):
+    """Timing span on this session's profiler (a no-op unless profiling is on)."""
+    return st.session_state.profiler.span(name, **attrs)
 
-# Define sport-specific configurations
-NFL_POSITIONS = ['QB', 'RB', 'WR', 'TE']
-NBA_POSITIONS = ['PG', 'SG', 'SF', 'PF', 'C']
-NHL_POSITIONS = ['C', 'LW', 'RW', 'D', 'G']
 
+@contextmanager
+def panel_profile(name):
+    """Time one run of a panel on its own profiler and show the total under the panel.
 
-uploaded_file = st.file_uploader("", type=['csv'])
-if uploaded_file is not None:
+    A panel rerun on its own never reaches the profiling panel, so the timing is
+    rendered inside the fragment; the last trace of each panel is also kept for
+    the profiling panel to list.
+    """
+    rerun_profiler = st.session_state.profiler
+    profiler = Profiler(enabled=rerun_profiler.enabled, name=name)
+    st.session_state.profiler = profiler
     try:
-        # Read the CSV file
-        df = pd.read_csv(uploaded_file)
+        with profiler.span(name):
+            yield
+    finally:
+        st.session_state.profiler = rerun_profiler
+        # Collapsed panels only record their own span
+        if len(profiler.spans) > 1:
+            st.session_state.panel_profilers[name] = profiler
+            st.caption(f"{name}: {profiler.total * 1000:.0f} ms")
+
+
+def dashboard_fragment(func):
+    """``st.fragment`` whose every run is timed by ``panel_profile``.
+
+    A panel rerun on its own skips the rest of the script, so it also marks the
+    session active here; otherwise a session only using panels would look idle.
+    """
+    @st.fragment
+    @functools.wraps(func)
+    def fragment(*args, **kwargs):
+        touch_session()
+        with panel_profile(func.__name__):
+            return func(*args, **kwargs)
+    return fragment
+
+
+# Parse each distinct set of uploads once (in parallel, in bounded-memory chunks);
+# later reruns hit the cache by content hash. Every session shares the one parsed
+# frame: nothing writes to it, and pandas copy-on-write keeps derived frames apart
+@st.cache_resource(show_spinner="Loading draft exports...", max_entries=8)
+def load_upload(digest, _uploads):
+    return load_portfolio(_uploads, chunksize=CHUNKSIZE)
+
+
+# Entry and player codes, factorized once per upload for every index built below
+@st.cache_resource(max_entries=8)
+def load_encoding(digest, _df):
+    return DraftEncoding(_df)
+
+
+# The player -> draft index is read-only, so one instance serves every rerun
+@st.cache_resource(max_entries=8)
+def load_player_index(digest, _df):
+    return PlayerIndex(_df, load_encoding(digest, _df))
+
+
+@st.cache_resource(max_entries=8)
+def load_co_exposure(digest, _df):
+    return CoExposure(_df, load_encoding(digest, _df))
+
+
+# Drafts sorted by time once per upload; every trend and snapshot reads from it
+@st.cache_resource(max_entries=8)
+def load_timeline(digest, _df):
+    return ExposureTimeline(_df, load_encoding(digest, _df))
+
+
+# Every player's pick number histogram, binned once per upload; the pick columns of
+# the exposures table are looked up from it for any filter combination
+@st.cache_resource(max_entries=8)
+def load_pick_distribution(digest, _df):
+    return PickDistribution(_df, load_encoding(digest, _df))
+
+
+@st.cache_data(max_entries=8)
+def load_field_adp(digest, _data):
+    return read_field_adp(_data)
+
+
+# Split by sport (detected per draft pool) and summarize each sport's entries in parallel;
+# every entry-level panel selects rows from these one-row-per-draft tables
+@st.cache_resource(max_entries=8)
+def load_sports(digest, _df):
+    sport_frames = split_sports(_df)
+    return sport_frames, summarize_sports(sport_frames)
+
+
+SESSION_BYTES, IDLE_SECONDS = session_limits()
+
+
+# Panel results per filter combination, shared by every session on this server; each
+# upload's results are capped at the per-session budget
+@st.cache_resource
+def load_result_cache():
+    return ResultCache(max_entries=128, max_bytes=256 * 1024 ** 2, max_owner_bytes=SESSION_BYTES)
+
+
+@st.cache_resource
+def load_session_tracker():
+    return SessionTracker(idle_seconds=IDLE_SECONDS)
+
+
+def touch_session():
+    """Mark this session as active on its current upload."""
+    session_id = st.session_state.setdefault("session_id", uuid.uuid4().hex)
+    load_session_tracker().touch(session_id, st.session_state.get("upload_digest"))
+
+
+def release_upload(digest):
+    """Drop an upload's frames, indexes and panel results from the shared caches."""
+    load_upload.clear(digest, None)
+    load_sports.clear(digest, None)
+    # Per-sport caches are keyed on "<digest>:<sport>"
+    for sport in SPORTS:
+        for loader in (load_encoding, load_player_index, load_co_exposure, load_timeline,
+                       load_pick_distribution):
+            loader.clear(f"{digest}:{sport}", None)
+    load_result_cache().evict_owner(digest)
+
+
+def cached(key, compute):
+    """Result cache lookup, billed to this session's upload."""
+    return load_result_cache().get_or_compute(key, compute, owner=st.session_state.get("upload_digest"))
+
+
+# Each panel below is a fragment: expanding/collapsing it or changing its own options
+# reruns just that panel, and a collapsed panel computes nothing. Results are cached on
+# the panel's name plus only the filters it depends on (engine.PANEL_DEPENDENCIES).
+def panel_result(report, report_key, name):
+    # "compute" only shows up under "panel" on a cache miss
+    def compute():
+        with span(f"compute {name}"):
+            return report.panel(name)
+
+    with span(f"panel {name}"):
+        return cached((report_key,) + report.panel_key(name), compute)
+
+
+# Above this many players the exposures table starts out paged on the server
+PAGED_ROWS = 100
+PAGE_SIZES = [25, 50, 100]
+
+
+def lazy_panel(label, key):
+    """Expander whose contents only run while it is open."""
+    return st.expander(label, expanded=True, key=key, on_change="rerun")
+
+
+@dashboard_fragment
+def co_drafted_panel(report, report_key):
+    panel = lazy_panel("Top Co-Drafted Players", "panel_co_drafted")
+    if panel.open:
+        with panel:
+            # Conditional exposure of every other player within the selected drafts
+            co_drafted = panel_result(report, report_key, 'co_drafted')
+            with span("render co_drafted"):
+                st.dataframe(
+                    co_drafted,
+                    hide_index=True,
+                    column_config={
+                        'Conditional Exposure %': st.column_config.NumberColumn(format="%.1f%%"),
+                        'Overall Exposure %': st.column_config.NumberColumn(format="%.1f%%")
+                    }
+                )
+
+
+def show_exposures(exposures, pick_distribution):
+    """Exposures table with a pick histogram column, for the rows given."""
+    with span("pick histograms"):
+        histograms, bin_starts = pick_distribution.histogram(exposures['Player'])
+        bin_width = bin_starts[1] - bin_starts[0] if len(bin_starts) > 1 else 1
+        exposures = exposures.assign(**{'Pick Histogram': histograms.tolist()})
+    with span("render exposures", rows=len(exposures)):
+        st.dataframe(
+            exposures,
+            hide_index=True,
+            column_config={
+                'Exposure %': st.column_config.NumberColumn(format="%.1f%%"),
+                'Total Entry Fees': st.column_config.NumberColumn(format="%.0f"),
+                'Avg Pick': st.column_config.NumberColumn(format="%.1f"),
+                'Median Pick': st.column_config.NumberColumn(format="%.0f"),
+                'Field ADP': st.column_config.NumberColumn(format="%.1f"),
+                'Reach': st.column_config.NumberColumn(
+                    format="%+.1f",
+                    help="Field ADP minus your average pick; positive means you take the player earlier"
+                ),
+                'Ahead of Field %': st.column_config.NumberColumn(
+                    format="%.1f%%",
+                    help="Share of your picks of the player made before the field ADP"
+                ),
+                'Pick Histogram': st.column_config.BarChartColumn(
+                    help=f"Your picks of the player in bins of {bin_width} pick numbers, "
+                         f"from pick 1 to {pick_distribution.max_pick}",
+                    y_min=0
+                )
+            }
+        )
+
+
+# The pre-sorted pager is cached next to the exposures result it pages through
+def exposures_pager(report, report_key, exposures):
+    key = (report_key,) + report.panel_key('exposures') + ('pager',)
+    return cached(key, lambda: TablePager(exposures))
+
+
+@dashboard_fragment
+def exposures_panel(report, report_key):
+    panel = lazy_panel("Player Exposures", "panel_exposures")
+    if not panel.open:
+        return
+    with panel:
+        exposures = panel_result(report, report_key, 'exposures')
+        # Histograms of the same filtered picks as the pick columns
+        picks = panel_result(report, report_key, 'filtered_pick_distribution')
+        paged = st.toggle(
+            "Page on server",
+            value=len(exposures) > PAGED_ROWS,
+            key="exposures_paged",
+            help="Sort, filter and page the table here and send only the visible rows to the browser"
+        )
+        if not paged:
+            show_exposures(exposures, picks)
+            return
+
+        pager = exposures_pager(report, report_key, exposures)
+        col_filter, col_sort = st.columns(2)
+        with col_filter:
+            text = st.text_input("Filter players", key="exposures_filter", placeholder="Player name...")
+        with col_sort:
+            columns = list(pager.table.columns)
+            sort_by = st.selectbox("Sort by", options=columns, index=columns.index('Exposure %'),
+                                   key="exposures_sort")
+        col_order, col_size, col_page = st.columns(3)
+        with col_order:
+            descending = st.toggle("Descending", value=True, key="exposures_descending")
+        with col_size:
+            page_size = st.selectbox("Rows per page", options=PAGE_SIZES, index=1, key="exposures_page_size")
+        with span("page exposures"):
+            view = pager.view(sort_by, not descending, text)
+        n_pages = page_count(len(view), page_size)
+        # A narrower filter or bigger pages can leave the current page past the end
+        if st.session_state.get("exposures_page", 1) > n_pages:
+            st.session_state.exposures_page = n_pages
+        with col_page:
+            page = st.number_input("Page", min_value=1, max_value=n_pages, key="exposures_page")
+
+        if len(view) == 0:
+            st.info("No players match the filter")
+            return
+        rows = pager.page(view, page, page_size)
+        show_exposures(rows, picks)
+        first = (page - 1) * page_size + 1
+        st.caption(f"Players {first}-{first + len(rows) - 1} of {len(view)}")
+
+
+@dashboard_fragment
+def team_panel(report, report_key, sport):
+    panel = lazy_panel("Teams", "panel_teams")
+    if not panel.open:
+        return
+    with panel:
+        # Team colors come from the bundled logo files, loaded once per process
+        team_color_map = team_colors(sport)
         
-        # Detect sport based on positions in the file
-        file_positions = set(df['Position'].unique())
+        # Create team distribution bar chart
+        team_percentages = panel_result(report, report_key, 'team_distribution')
         
-        if file_positions.issubset(set(NFL_POSITIONS)):
-            sport = "NFL"
-            POSITIONS = NFL_POSITIONS
-            
-            def analyze_team_composition(positions):
-                if positions.get('QB', 0) != 1:  # Must have exactly 1 QB
-                    return 'Invalid'
-                elif positions.get('RB', 0) == 2 and positions.get('WR', 0) == 2 and positions.get('TE', 0) == 1:
-                    return '2 RB Build'
-                elif positions.get('RB', 0) == 1 and positions.get('WR', 0) == 3 and positions.get('TE', 0) == 1:
-                    return '3 WR Build'
-                elif positions.get('TE', 0) == 2:
-                    return '2 TE Build'
-                else:
-                    return 'Other'
-            
-            def analyze_stacks(group):
-                qb_row = group[group['Position'] == 'QB']
-                if len(qb_row) != 1:
-                    return 'Invalid'
-                
-                qb_team = qb_row.iloc[0]['Team']
-                stack_count = len(group[
-                    (group['Position'] != 'QB') & 
-                    (group['Team'] == qb_team)
-                ])
-                
-                if stack_count == 0:
-                    return 'Naked QB'
-                elif stack_count == 1:
-                    return 'Skinny'
-                elif stack_count == 2:
-                    return 'Double'
-                else:
-                    return 'Triple+'
-                    
-        elif file_positions.issubset(set(NBA_POSITIONS)):
-            sport = "NBA"
-            POSITIONS = NBA_POSITIONS
-            
-            def analyze_team_composition(positions):
-                position_counts = {pos: 0 for pos in POSITIONS}
-                for pos, count in positions.items():
-                    position_counts[pos] += count
-                return position_counts
-            
-            def analyze_stacks(group):
-                team_counts = group['Team'].value_counts()
-                
-                if len(team_counts) == 6:
-                    return '6 Unique'
-                elif team_counts.iloc[0] == 3:
-                    if team_counts.iloc[1] == 3:
-                        return '3-3'
-                    elif team_counts.iloc[1] == 2:
-                        return '3-2-1'
-                    else:
-                        return '3-1-1-1'
-                elif team_counts.iloc[0] == 2:
-                    if team_counts.iloc[1] == 2:
-                        if team_counts.iloc[2] == 2:
-                            return '2-2-2'
-                        else:
-                            return '2-2-1-1'
-                    else:
-                        return '2-1-1-1-1'
-                else:
-                    return 'Other'
-        elif file_positions.issubset(set(NHL_POSITIONS)):
-            sport = "NHL"
-            POSITIONS = NHL_POSITIONS
+        # Create a color sequence for the bars based on the team colors
+        team_colors_dist = [team_color_map.get(team, DEFAULT_COLOR) for team in team_percentages.index]
+        
+        with span("render team_distribution"):
+            fig_team = px.bar(
+                y=team_percentages.index,
+                x=team_percentages.values,
+                title=f"{sport} Team Distribution",
+                labels={'x': 'Percentage (%)', 'y': 'Team'},
+                orientation='h',
+                color=team_percentages.index,  # Use team names for colors
+                color_discrete_sequence=team_colors_dist  # Use our custom color sequence
+            )
+        
+            # Adjust layout without logo space
+            fig_team.update_layout(
+                title=dict(text=f"{sport} Team Distribution", font=dict(size=24)),
+                showlegend=False,
+                height=600,
+                margin=dict(l=100)  # Adjust margin as needed
+            )
+        
+            st.plotly_chart(fig_team, use_container_width=True)
+
+
+@dashboard_fragment
+def position_panel(report, report_key, sport):
+    panel = lazy_panel("Positions", "panel_positions")
+    if not panel.open:
+        return
+    with panel:
+        if sport == "NFL":
+            # NFL Position distribution
+            dist_series = panel_result(report, report_key, 'build_distribution')
             
-            def analyze_team_composition(positions):
-                position_counts = {pos: 0 for pos in POSITIONS}
-                for pos, count in positions.items():
-                    position_counts[pos] += count
-                return position_counts
+            # Nothing to chart when no filtered draft matches a build
+            if not dist_series.empty:
+                with span("render build_distribution"):
+                    fig_pos = px.bar(
+                        y=dist_series.index,
+                        x=dist_series.values,
+                        title="Position Distribution",
+                        labels={'x': 'Number of Drafts', 'y': 'Build Type'},
+                        orientation='h',
+                        color=dist_series.index,
+                        color_discrete_sequence=px.colors.qualitative.Set3[:len(dist_series)]
+                    )
+                    fig_pos.update_layout(
+                        title=dict(text="Position Distribution", font=dict(size=24)),
+                        showlegend=False,
+                        height=400
+                    )
+                    st.plotly_chart(fig_pos, use_container_width=True)
+        
+        else:
+            # NBA/NHL Position distribution
+            pos_percentages = panel_result(report, report_key, 'position_distribution')
             
-            def analyze_stacks(group):
-                # Convert LW and RW to just W for stack analysis
-                group['Position'] = group['Position'].replace({'LW': 'W', 'RW': 'W'})
-                
-                # Get positions by team
-                team_positions = group.groupby('Team')['Position'].agg(list)
-                
-                # Analyze each team's stack
-                team_stacks = []
-                for team, positions in team_positions.items():
-                    if 'G' in positions:  # Skip goalies for stack analysis
-                        positions.remove('G')
-                    
-                    pos_count = {
-                        'C': positions.count('C'),
-                        'W': positions.count('W'),
-                        'D': positions.count('D')
+            with span("render position_distribution"):
+                fig_pos = px.bar(
+                    y=pos_percentages.index,
+                    x=pos_percentages.values,
+                    title="Position Distribution",
+                    labels={'x': 'Percentage (%)', 'y': 'Position'},
+                    orientation='h',
+                    color=pos_percentages.index,
+                    color_discrete_sequence=px.colors.qualitative.Set3[:len(pos_percentages)]
+                )
+                fig_pos.update_layout(
+                    title=dict(text="Position Distribution", font=dict(size=24)),
+                    showlegend=False,
+                    height=400
+                )
+                st.plotly_chart(fig_pos, use_container_width=True)
+
+
+@dashboard_fragment
+def stack_panel(report, report_key):
+    panel = lazy_panel("Stacks", "panel_stacks")
+    if not panel.open:
+        return
+    with panel:
+        # Stack distribution
+        stack_percentages = panel_result(report, report_key, 'stack_distribution')
+        
+        with span("render stack_distribution"):
+            fig_stack = px.bar(
+                y=stack_percentages.index,
+                x=stack_percentages.values,
+                title="Stack Distribution",
+                labels={'x': 'Percentage (%)', 'y': 'Stack Type'},
+                orientation='h',
+                color=stack_percentages.index,
+                color_discrete_sequence=px.colors.qualitative.Set3[:len(stack_percentages)]
+            )
+            fig_stack.update_layout(
+                title=dict(text="Stack Distribution", font=dict(size=24)),
+                showlegend=False,
+                height=400
+            )
+            st.plotly_chart(fig_stack, use_container_width=True)
+
+
+# Correlations cover the whole portfolio and ignore the filters; their own
+# options only rerun this fragment
+@dashboard_fragment
+def correlation_panel(df, upload_key):
+    panel = lazy_panel("Player Correlations", "panel_correlations")
+    if not panel.open:
+        return
+    with panel:
+        col_top_n, col_min_drafts = st.columns(2)
+        top_n = col_top_n.slider("Players in heatmap", min_value=5, max_value=50, value=25, step=5)
+        min_drafts = col_min_drafts.number_input("Minimum drafts together", min_value=1, value=3)
+        
+        # One sparse product per upload
+        with span("compute correlations"):
+            co_exposure = load_co_exposure(upload_key, df)
+        col_heatmap, col_pairs = st.columns(2, gap="small")
+        
+        with col_heatmap:
+            with span("compute lift_matrix"):
+                lift = co_exposure.lift_matrix(top_n=top_n)
+            with span("render correlations"):
+                fig_corr = px.imshow(
+                    lift,
+                    labels={'x': 'Player', 'y': 'Player', 'color': 'Lift'},
+                    color_continuous_scale='RdBu_r',
+                    color_continuous_midpoint=1.0,
+                    aspect='auto'
+                )
+                fig_corr.update_layout(
+                    title=dict(text="Co-Exposure Lift (Most Drafted)", font=dict(size=24)),
+                    height=600
+                )
+                st.plotly_chart(fig_corr, use_container_width=True)
+        
+        with col_pairs:
+            st.markdown("**Most Over-Correlated Pairs** (lift = drafts together vs. expected if independent)")
+            with span("compute top_pairs"):
+                top_pairs = co_exposure.top_pairs(n=25, min_drafts=min_drafts)
+            with span("render top_pairs"):
+                st.dataframe(
+                    top_pairs,
+                    hide_index=True,
+                    column_config={
+                        'B given A %': st.column_config.NumberColumn(format="%.1f%%"),
+                        'A given B %': st.column_config.NumberColumn(format="%.1f%%")
                     }
-                    
-                    # Determine stack type
-                    if pos_count['C'] >= 1 and pos_count['W'] >= 1 and pos_count['D'] == 0:
-                        team_stacks.append('C-W')
-                    elif pos_count['C'] >= 1 and pos_count['W'] >= 1 and pos_count['D'] >= 1:
-                        team_stacks.append('C-W-D')
-                    elif pos_count['C'] >= 1 and pos_count['D'] >= 1 and pos_count['W'] == 0:
-                        team_stacks.append('C-D')
-                    elif pos_count['C'] == 0 and pos_count['W'] >= 1 and pos_count['D'] >= 1:
-                        team_stacks.append('W-D')
-                    elif pos_count['C'] == 0 and pos_count['W'] >= 2 and pos_count['D'] >= 1:
-                        team_stacks.append('W-W-D')
-                
-                # Return the most significant stack type
-                if team_stacks:
-                    return max(team_stacks, key=len)  # Return the longest stack type
-                return 'No Stack'
+                )
+
+
+# Like correlations, timing covers the whole portfolio and ignores the filters
+@dashboard_fragment
+def timeline_panel(df, upload_key, selected_players):
+    panel = lazy_panel("Draft Timing", "panel_timeline")
+    if not panel.open:
+        return
+    with panel:
+        with span("compute timeline"):
+            timeline = load_timeline(upload_key, df)
+        if timeline.n_entries == 0:
+            st.info("No draft times (Picked At) in this export")
+            return
+        
+        col_players, col_view, col_window = st.columns([3, 2, 1])
+        trend_players = col_players.multiselect(
+            "Players to chart",
+            options=list(timeline.players),
+            default=list(selected_players) or timeline.top_players(5)
+        )
+        view = col_view.radio("Exposure by", options=["Daily", "Weekly", "Last N drafts"], index=1, horizontal=True)
+        if view == "Last N drafts":
+            window = col_window.number_input("Drafts per window", min_value=5, value=100, step=25)
         else:
-            st.error("Error: Invalid position data in CSV")
-            st.stop()
+            cumulative = col_window.checkbox("Cumulative", help="Share of all drafts up to each period")
+        freq = {label: code for code, label in FREQUENCIES.items()}.get(view, 'D')
+        
+        col_trend, col_counts = st.columns([2, 1], gap="small")
+        with col_trend:
+            with span("compute trends"):
+                if view == "Last N drafts":
+                    trends = timeline.rolling(trend_players, window=window)
+                else:
+                    trends = timeline.buckets(freq, players=trend_players, cumulative=cumulative)
+            if trend_players:
+                with span("render trends"):
+                    fig_trend = px.line(
+                        trends,
+                        labels={'value': 'Exposure (%)', 'variable': 'Player'},
+                        markers=view != "Last N drafts"
+                    )
+                    fig_trend.update_layout(
+                        title=dict(text="Exposure Over Time", font=dict(size=24)),
+                        xaxis_title=None,
+                        height=450
+                    )
+                    st.plotly_chart(fig_trend, use_container_width=True)
+        
+        with col_counts:
+            # When the drafts happened, per day or week
+            draft_counts = timeline.draft_counts(freq)
+            with span("render draft_counts"):
+                fig_counts = px.bar(
+                    x=draft_counts.index,
+                    y=draft_counts.values,
+                    labels={'x': '', 'y': 'Drafts'}
+                )
+                fig_counts.update_layout(
+                    title=dict(text=f"Drafts per {'Week' if freq == 'W' else 'Day'}", font=dict(size=24)),
+                    height=450
+                )
+                st.plotly_chart(fig_counts, use_container_width=True)
+        
+        # Exposure table as it stood at the end of the chosen day
+        as_of = st.date_input(
+            "Exposure as of",
+            value=timeline.end.date(),
+            min_value=timeline.start.date(),
+            max_value=timeline.end.date()
+        )
+        as_of_end = pd.Timestamp(as_of) + pd.Timedelta(days=1) - pd.Timedelta(1, unit='us')
+        with span("compute snapshot"):
+            snapshot = timeline.snapshot(as_of_end)
+        st.caption(
+            f"{timeline.drafts_as_of(as_of_end)} of {timeline.n_entries} drafts made by {as_of:%b %d, %Y} (UTC). "
+            "Change Since % is the current exposure minus the exposure on that date."
+        )
+        st.dataframe(
+            snapshot,
+            hide_index=True,
+            column_config={
+                'Exposure %': st.column_config.NumberColumn(format="%.1f%%"),
+                'Change Since %': st.column_config.NumberColumn(format="%+.1f%%")
+            }
+        )
+
 
-        # Combine First Name and Last Name into a single Player column
-        df['Player'] = df['First Name'] + ' ' + df['Last Name']
+# Targets are checked against the drafts left by the filters, like the panels above
+@dashboard_fragment
+def rebalance_panel(report, report_key):
+    panel = lazy_panel("Rebalance Exposures", "panel_rebalance")
+    if not panel.open:
+        return
+    with panel:
+        st.caption(
+            "Set exposure floors and caps for players, teams (share of picks) and stack types "
+            "to see who to prioritize or avoid over your next drafts"
+        )
+        col_drafts, col_cap = st.columns(2)
+        n_drafts = col_drafts.number_input("Next N drafts", min_value=1, value=20, step=5)
+        player_cap = col_cap.number_input(
+            "Cap every player at (%)", min_value=0.0, max_value=100.0, value=None, step=1.0,
+            placeholder="No cap"
+        )
         
-        # Group by Draft Pool to check for valid drafts (should be multiples of 6)
-        draft_counts = df.groupby('Draft Pool').size()
-        valid_drafts = draft_counts[draft_counts % 6 == 0].index
-        df = df[df['Draft Pool'].isin(valid_drafts)]
+        # Read through the result cache, like the exposures panel
+        exposures = panel_result(report, report_key, 'exposures')
+        names = cached((report_key, 'rebalance names'), lambda: (
+            sorted(report.pick_distribution.players.astype(str))
+            + sorted(pd.unique(report.df['Team'].dropna().astype(str)))
+            + sorted(report.entry_summary['Stack'].dropna().unique())
+        ))
+        targets = st.data_editor(
+            pd.DataFrame({
+                'Type': pd.Series(dtype=str),
+                'Name': pd.Series(dtype=str),
+                'Floor %': pd.Series(dtype=float),
+                'Cap %': pd.Series(dtype=float)
+            }),
+            num_rows="dynamic",
+            hide_index=True,
+            key="rebalance_targets",
+            column_config={
+                'Type': st.column_config.SelectboxColumn(options=list(TARGET_TYPES), required=True),
+                'Name': st.column_config.SelectboxColumn(options=names, required=True),
+                'Floor %': st.column_config.NumberColumn(min_value=0.0, max_value=100.0, format="%.1f%%"),
+                'Cap %': st.column_config.NumberColumn(min_value=0.0, max_value=100.0, format="%.1f%%")
+            }
+        )
         
-        # Start with the original dataframe
-        base_df = df.copy()
+        # Plans are cached on the filters, the number of drafts, the cap and the targets
+        # (missing values as None, since NaN never equals itself in a key)
+        target_rows = targets.astype(object).where(targets.notna(), None)
+        plan_key = (report_key,) + report.panel_key('exposures') + (
+            'rebalance', n_drafts, player_cap, tuple(target_rows.itertuples(index=False, name=None))
+        )
+
+        def plan():
+            with span("compute rebalance"):
+                return plan_rebalance(report, n_drafts, targets, player_cap, exposures)
+
+        with span("panel rebalance"):
+            plans = cached(plan_key, plan)
+        only_actions = st.toggle("Only show items to act on", value=True)
+        percent = st.column_config.NumberColumn(format="%.1f%%")
+        for tab, kind in zip(st.tabs(["Players", "Teams", "Stacks"]), TARGET_TYPES):
+            plan = plans[kind]
+            if only_actions:
+                plan = plan[plan['Action'] != 'On Pace']
+            with tab, span(f"render rebalance {kind}"):
+                st.dataframe(
+                    plan,
+                    hide_index=True,
+                    column_config={
+                        'Count': st.column_config.NumberColumn("Picks" if kind == 'Team' else "Drafts"),
+                        'Exposure %': percent,
+                        'Floor %': percent,
+                        'Cap %': percent,
+                        'Next N': st.column_config.NumberColumn(
+                            f"Next {n_drafts}",
+                            help=f"Picks of the team over the next {n_drafts} drafts" if kind == 'Team'
+                            else f"Drafts to take this in, out of the next {n_drafts}"
+                        ),
+                        'Next N %': st.column_config.NumberColumn(f"Next {n_drafts} %", format="%.1f%%"),
+                        'Projected %': st.column_config.NumberColumn(
+                            format="%.1f%%", help="Exposure after the next N drafts if you follow the plan"
+                        )
+                    }
+                )
+
+
+@dashboard_fragment
+def cache_panel():
+    panel = st.expander("Debug: Result Cache", key="panel_cache", on_change="rerun")
+    if not panel.open:
+        return
+    with panel:
+        # Result cache counters for this server process
+        cache_stats = load_result_cache().stats()
+        session_stats = load_session_tracker().stats()
+        col_hits, col_misses, col_evictions, col_size, col_sessions = st.columns(5)
+        col_hits.metric("Hits", cache_stats['hits'], f"{cache_stats['hit_rate']}% hit rate", delta_color="off")
+        col_misses.metric("Misses", cache_stats['misses'])
+        col_evictions.metric("Evictions", cache_stats['evictions'])
+        col_size.metric(
+            "Cached Results",
+            f"{cache_stats['entries']} / {cache_stats['max_entries']}",
+            f"{cache_stats['bytes'] / 1024 ** 2:.1f} / {cache_stats['max_bytes'] / 1024 ** 2:.0f} MB",
+            delta_color="off"
+        )
+        col_sessions.metric(
+            "Sessions",
+            session_stats['sessions'],
+            f"{session_stats['uploads']} uploads, {cache_stats['max_owner_bytes'] / 1024 ** 2:.0f} MB each",
+            delta_color="off",
+            help=f"Uploads are dropped after {session_stats['idle_seconds'] / 60:.0f} idle minutes"
+        )
+
+
+def profiling_panel(profiler, panel_profilers):
+    with st.expander("Profiling", expanded=True):
+        # Waterfall of this rerun's spans outside the panels; nested spans are indented
+        # under their parent, and each panel's last run is listed below
+        trace = profiler.to_frame()
+        frame_bytes = sum(profiler.frames.values())
+        col_total, col_rss, col_frames = st.columns(3)
+        col_total.metric("Rerun Time", f"{profiler.total * 1000:.0f} ms")
+        col_rss.metric("Peak RSS", f"{peak_rss_bytes() / 1024 ** 2:.0f} MB")
+        col_frames.metric("DataFrame Memory", f"{frame_bytes / 1024 ** 2:.1f} MB")
+        
+        if not trace.empty:
+            fig_trace = px.bar(
+                trace,
+                x='Duration (ms)',
+                y='Stage',
+                base='Start (ms)',
+                orientation='h',
+                color='Depth',
+                hover_data=['Start (ms)', 'Duration (ms)', 'Error'],
+                color_continuous_scale='Blues_r'
+            )
+            fig_trace.update_layout(
+                title=dict(text="Rerun Waterfall", font=dict(size=24)),
+                xaxis_title="Time since rerun start (ms)",
+                coloraxis_showscale=False,
+                height=max(300, 22 * len(trace))
+            )
+            fig_trace.update_yaxes(autorange="reversed", categoryorder="array", categoryarray=trace['Stage'])
+            st.plotly_chart(fig_trace, use_container_width=True)
+        
+        col_spans, col_memory = st.columns([2, 1])
+        col_spans.dataframe(trace, hide_index=True)
+        col_memory.dataframe(
+            pd.DataFrame({
+                'DataFrame': list(profiler.frames),
+                'Memory (MB)': [round(size / 1024 ** 2, 2) for size in profiler.frames.values()]
+            }),
+            hide_index=True
+        )
+        if panel_profilers:
+            # Each panel's last run, whether part of a full rerun or a rerun of just that panel
+            panel_traces = pd.concat(
+                [panel.to_frame().assign(Panel=name, **{'Run At': panel.started_at.strftime('%H:%M:%S')})
+                 for name, panel in panel_profilers.items()],
+                ignore_index=True
+            )
+            st.dataframe(panel_traces[['Panel', 'Run At'] + list(trace.columns)], hide_index=True)
+        # Chrome trace format: open in chrome://tracing or Perfetto, or diff across releases
+        st.download_button(
+            "Download Trace (JSON)",
+            profiler.to_json(),
+            file_name="udexposures-trace.json",
+            mime="application/json",
+            on_click="ignore"
+        )
+
+
+uploaded_files = st.file_uploader("", type=['csv', 'zip'], accept_multiple_files=True)
+
+# Read the CSV files (one account per export, cached on the uploads' content hash)
+uploads = [(uploaded_file.name, uploaded_file.getvalue()) for uploaded_file in uploaded_files or []]
+st.session_state.upload_digest = portfolio_digest(uploads) if uploads else None
+
+# Note which upload this session is on; uploads that only idle sessions were on are
+# dropped from the shared caches
+touch_session()
+for idle_upload in load_session_tracker().evict_idle():
+    release_upload(idle_upload)
+
+if uploaded_files:
+    try:
+        upload_key = st.session_state.upload_digest
+        with span("ingest", files=len(uploads)):
+            df = load_upload(upload_key, uploads)
+        st.session_state.profiler.record_frame("picks (upload)", df)
+        
+        # Detect the sport of every draft pool; mixed files are viewed one sport at a time
+        try:
+            with span("split sports"):
+                sport_frames, entry_summaries = load_sports(upload_key, df)
+        except ValueError:
+            st.error("Error: Invalid position data in CSV")
+            st.stop()
+        
+        if len(sport_frames) > 1:
+            sport = st.radio("Sport", options=list(sport_frames), horizontal=True)
+        else:
+            sport = next(iter(sport_frames))
+        df = sport_frames[sport]
+        entry_summary = entry_summaries[sport]
+        # Per-sport caches are keyed on the upload and the sport shown
+        upload_key = f"{upload_key}:{sport}"
+        st.session_state.profiler.record_frame(f"picks ({sport})", df)
+        st.session_state.profiler.record_frame(f"entry summary ({sport})", entry_summary)
+
+        # The filter bar narrows a row mask over the shared frame; option lists read one
+        # column under the mask, and the report takes the filtered rows itself
+        rows = np.ones(len(df), dtype=bool)
+
+        def options(column):
+            return sorted(df[column][rows].unique())
 
         # Add player search box
-        player_options = sorted(df['Player'].str.strip().unique())
+        with span("player options"):
+            player_options = sorted(df['Player'].unique())
         player_search = st.multiselect(
             "Search Players",
             options=player_options,
@@ -180,29 +797,39 @@ if uploaded_file is not None:
 
         # Apply player filters if any players are selected
         if player_search:
-            # Create a mask that checks if each draft contains all selected players
-            draft_mask = None
-            for player in player_search:
-                player_drafts = set(df[df['Player'].str.strip() == player.strip()]['Draft Entry'])
-                if draft_mask is None:
-                    draft_mask = df['Draft Entry'].isin(player_drafts)
-                else:
-                    draft_mask &= df['Draft Entry'].isin(player_drafts)
+            # Intersect the selected players' draft bitsets to find drafts containing all of them
+            with span("filter players", players=len(player_search)):
+                player_index = load_player_index(upload_key, df)
+                draft_mask = player_index.row_mask(player_search)
             
-            if draft_mask is not None:
-                base_df = df[draft_mask]
+            if draft_mask.any():
+                rows = draft_mask
             else:
                 st.warning("No drafts found containing all selected players")
                 st.stop()
 
-        # Initialize filtered_df with the base_df
-        filtered_df = base_df.copy()
+        def narrow(rows, column, value):
+            with span(f"filter {column}"):
+                mask = engine.column_mask(df, column, value)
+                return rows if mask is None else rows & mask
         
-        # Create filters
-        col1, col2, col3, col4 = st.columns(4)
+        # Create filters (plus an account filter when several accounts are loaded)
+        available_accounts = options('Account')
+        if len(available_accounts) > 1:
+            col_account, col1, col2, col3, col4 = st.columns(5)
+            with col_account:
+                selected_account = st.selectbox(
+                    'Filter by Account',
+                    options=['All'] + available_accounts,
+                    index=0
+                )
+                rows = narrow(rows, 'Account', selected_account)
+        else:
+            selected_account = 'All'
+            col1, col2, col3, col4 = st.columns(4)
         
         with col3:
-            available_draft_titles = sorted(base_df['Draft Pool Title'].unique())
+            available_draft_titles = options('Draft Pool Title')
             draft_title_options = ['All'] + available_draft_titles
             selected_draft_title = st.selectbox(
                 'Filter by Draft Pool Title',
@@ -210,11 +837,10 @@ if uploaded_file is not None:
                 index=0
             )
             
-            if selected_draft_title != 'All':
-                filtered_df = filtered_df[filtered_df['Draft Pool Title'] == selected_draft_title]
+            rows = narrow(rows, 'Draft Pool Title', selected_draft_title)
         
         with col1:
-            available_positions = sorted(filtered_df['Position'].unique())
+            available_positions = options('Position')
             position_options = ["All"] + available_positions
             selected_position = st.selectbox(
                 'Filter by Position',
@@ -222,11 +848,10 @@ if uploaded_file is not None:
                 index=0
             )
             
-            if selected_position != "All":
-                filtered_df = filtered_df[filtered_df['Position'] == selected_position]
+            rows = narrow(rows, 'Position', selected_position)
         
         with col2:
-            available_teams = sorted(filtered_df['Team'].unique())
+            available_teams = options('Team')
             team_options = ["All"] + available_teams
             selected_team = st.selectbox(
                 'Filter by Team',
@@ -234,11 +859,10 @@ if uploaded_file is not None:
                 index=0
             )
             
-            if selected_team != "All":
-                filtered_df = filtered_df[filtered_df['Team'] == selected_team]
+            rows = narrow(rows, 'Team', selected_team)
         
         with col4:
-            available_drafts = sorted(filtered_df['Draft Entry'].unique())
+            available_drafts = options('Draft Entry')
             draft_options = ['All'] + list(available_drafts)
             selected_draft = st.selectbox(
                 'Filter by Draft',
@@ -246,24 +870,47 @@ if uploaded_file is not None:
                 index=0
             )
             
-            if selected_draft != 'All':
-                filtered_df = filtered_df[filtered_df['Draft Entry'] == selected_draft]
+            rows = narrow(rows, 'Draft Entry', selected_draft)
         
-        # Calculate total number of drafts and percentage
-        total_filtered_drafts = len(filtered_df['Draft Entry'].unique())
-        total_all_drafts = len(df['Draft Entry'].unique())
-        percentage = round((total_filtered_drafts / total_all_drafts * 100), 1)
-        
-        # Calculate Draft Position for each entry
-        draft_positions = (
-            filtered_df.groupby('Draft Entry')['Pick Number']
-            .min()
-            .reset_index()
-            .rename(columns={'Pick Number': 'Draft Position'})
+        # Optional field ADP for the reach columns of the exposures table
+        field_adp = None
+        exposures_key = upload_key
+        if field_adp_file is not None:
+            field_data = field_adp_file.getvalue()
+            field_key = upload_digest(field_data)
+            try:
+                field_adp = load_field_adp(field_key, field_data)
+                exposures_key = f"{upload_key}:adp={field_key}"
+            except ValueError as e:
+                st.sidebar.error(f"Error reading field ADP: {e}")
+
+        # Report for this filter combination; nothing is computed until a panel asks for it
+        report = engine.ExposureReport(
+            df,
+            players=player_search,
+            draft_pool_title=selected_draft_title,
+            position=selected_position,
+            team=selected_team,
+            draft_entry=selected_draft,
+            account=selected_account,
+            sport=sport,
+            player_index=load_player_index(upload_key, df) if player_search else None,
+            entry_summary=entry_summary,
+            pick_distribution=load_pick_distribution(upload_key, df),
+            field_adp=field_adp,
         )
         
+        if player_search:
+            co_drafted_panel(report, upload_key)
+        
+        # Calculate total number of drafts and percentage
+        summary = panel_result(report, upload_key, 'summary')
+        total_filtered_drafts = summary['filtered_drafts']
+        total_all_drafts = summary['total_drafts']
+        percentage = summary['filtered_pct']
+        
         # Calculate average Draft Position
-        avg_draft_position = draft_positions['Draft Position'].mean().round(1)
+        avg_draft_position = summary['avg_draft_position']
         
         # Display metrics
         col_metrics1, col_metrics2 = st.columns(2)
@@ -279,229 +926,33 @@ if uploaded_file is not None:
         col_table, col_team, col_pos, col_stack = st.columns([2, 1, 1, 1], gap="small")
         
         with col_table:
-            # Calculate exposures
-            if selected_draft != 'All':
-                exposures = (
-                    filtered_df
-                    .assign(
-                        **{
-                            'Total Drafts': 1,
-                            'Total Entry Fees': lambda x: x['Draft Pool Entry Fee'],
-                            'Exposure %': 100.0
-                        }
-                    )
-                    [['Player', 'Position', 'Team', 'Total Drafts', 'Total Entry Fees', 'Exposure %']]
-                )
-            else:
-                exposures = (
-                    filtered_df.groupby(['Player', 'Position', 'Team'])
-                    .agg({
-                        'Draft Entry': 'count',
-                        'Draft Pool Entry Fee': 'sum'
-                    })
-                    .reset_index()
-                    .rename(columns={
-                        'Draft Entry': 'Total Drafts',
-                        'Draft Pool Entry Fee': 'Total Entry Fees'
-                    })
-                )
-                
-                # Calculate exposure percentages
-                exposures['Exposure %'] = (exposures['Total Drafts'] / total_filtered_drafts * 100).round(1)
-                exposures = exposures.sort_values('Exposure %', ascending=False)
-            
-            # Display exposures table
-            st.subheader("Player Exposures")
-            st.dataframe(
-                exposures,
-                hide_index=True,
-                column_config={
-                    'Exposure %': st.column_config.NumberColumn(format="%.1f%%"),
-                    'Total Entry Fees': st.column_config.NumberColumn(format="%.0f")
-                }
-            )
+            exposures_panel(report, exposures_key)
 
         with col_team:
-            if sport in ["NFL", "NBA", "NHL"]:
-                
-                # Load team logos and colors from GitHub
-                nfl_logos_url = 'https://raw.githubusercontent.com/louissherman/UDexposures/main/nfl_logos.csv'
-                nba_logos_url = 'https://raw.githubusercontent.com/louissherman/UDexposures/main/nba_logos.csv'
-                nhl_logos_url = 'https://raw.githubusercontent.com/louissherman/UDexposures/main/nhl_logos.csv'
-
-                # Load the logos CSVs directly from GitHub
-                nfl_logos_df = pd.read_csv(nfl_logos_url)
-                nba_logos_df = pd.read_csv(nba_logos_url)
-                nhl_logos_df = pd.read_csv(nhl_logos_url)
-
-                # Create dictionaries mapping team names to colors
-                nfl_colors = dict(zip(nfl_logos_df['Team'], nfl_logos_df['Color']))  # Assuming 'Color' column exists
-                nba_colors = dict(zip(nba_logos_df['Team'], nba_logos_df['Color']))  # Assuming 'Color' column exists
-                nhl_colors = dict(zip(nhl_logos_df['Team'], nhl_logos_df['Color']))  # Assuming 'Color' column exists
-                
-                # Create team distribution bar chart
-                team_dist = filtered_df['Team'].value_counts()
-                team_percentages = (team_dist / len(filtered_df) * 100).round(1)
-                team_percentages = team_percentages.sort_values(ascending=True)
-                
-                # Create a color sequence for the bars based on the team colors
-                nfl_colors_dist = [nfl_colors.get(team, '#FFFFFF') for team in team_percentages.index]  # Default to white if not found
-                nba_colors_dist = [nba_colors.get(team, '#FFFFFF') for team in team_percentages.index]  
-                nhl_colors_dist = [nhl_colors.get(team, '#FFFFFF') for team in team_percentages.index]  
-
-                if sport == "NFL":
-                    fig_team = px.bar(
-                        y=team_percentages.index,
-                        x=team_percentages.values,
-                        title="NFL Team Distribution",
-                        labels={'x': 'Percentage (%)', 'y': 'Team'},
-                        orientation='h',
-                        color=team_percentages.index,  # Use team names for colors
-                        color_discrete_sequence=nfl_colors_dist  # Use our custom color sequence
-                    )
-                    
-                    # Adjust layout without logo space
-                    fig_team.update_layout(
-                        title=dict(text="NFL Team Distribution", font=dict(size=24)),
-                        showlegend=False,
-                        height=600,
-                        margin=dict(l=100)  # Adjust margin as needed
-                    )
-                    
-                    st.plotly_chart(fig_team, use_container_width=True)
-                
-                elif sport == "NBA":
-                    fig_team = px.bar(
-                        y=team_percentages.index,
-                        x=team_percentages.values,
-                        title="NBA Team Distribution",
-                        labels={'x': 'Percentage (%)', 'y': 'Team'},
-                        orientation='h',
-                        color=team_percentages.index,  # Use team names for colors
-                        color_discrete_sequence=nba_colors_dist  # Use our custom color sequence
-                    )
-                    
-                    # Adjust layout without logo space
-                    fig_team.update_layout(
-                        title=dict(text="NBA Team Distribution", font=dict(size=24)),
-                        showlegend=False,
-                        height=600,
-                        margin=dict(l=100)  # Adjust margin as needed
-                    )
-                    
-                    st.plotly_chart(fig_team, use_container_width=True)
-                
-                elif sport == "NHL":
-                    fig_team = px.bar(
-                        y=team_percentages.index,
-                        x=team_percentages.values,
-                        title="NHL Team Distribution",
-                        labels={'x': 'Percentage (%)', 'y': 'Team'},
-                        orientation='h',
-                        color=team_percentages.index,  # Use team names for colors
-                        color_discrete_sequence=nhl_colors_dist  # Use our custom color sequence
-                    )
-                    
-                    # Adjust layout without logo space
-                    fig_team.update_layout(
-                        title=dict(text="NHL Team Distribution", font=dict(size=24)),
-                        showlegend=False,
-                        height=600,
-                        margin=dict(l=100)  # Adjust margin as needed
-                    )
-                    
-                    st.plotly_chart(fig_team, use_container_width=True)
+            if get_sport(sport).logo_file:
+                team_panel(report, upload_key, sport)
         
         with col_pos:
-            if sport == "NFL":
-                # NFL Position distribution
-                draft_compositions = filtered_df.groupby('Draft Entry')['Position'].agg(lambda x: x.value_counts().to_dict()).reset_index()
-                position_counts = draft_compositions['Position'].apply(lambda x: {
-                    'RB': x.get('RB', 0),
-                    'WR': x.get('WR', 0),
-                    'TE': x.get('TE', 0)
-                })
-                
-                position_df = pd.DataFrame(position_counts.tolist())
-                
-                distribution_summary = {
-                    "2 RB": (position_df['RB'] == 2).sum(),
-                    "3 WR": (position_df['WR'] >= 3).sum(),
-                    "2 TE": (position_df['TE'] == 2).sum()
-                }
-                # Convert to pandas Series and sort
-                dist_series = pd.Series(distribution_summary)
-                dist_series = dist_series[dist_series > 0].sort_values(ascending=True)
-                
-                fig_pos = px.bar(
-                    y=dist_series.index,
-                    x=dist_series.values,
-                    title="Position Distribution",
-                    labels={'x': 'Number of Drafts', 'y': 'Build Type'},
-                    orientation='h',
-                    color=dist_series.index,
-                    color_discrete_sequence=px.colors.qualitative.Set3[:len(dist_series)]
-                )
-                fig_pos.update_layout(
-                    title=dict(text="Position Distribution", font=dict(size=24)),
-                    showlegend=False,
-                    height=400
-                )
-                st.plotly_chart(fig_pos, use_container_width=True)
-            
-            else:
-                # NBA/NHL Position distribution
-                if selected_position == "All":
-                    pos_dist = filtered_df['Position'].value_counts()
-                    pos_percentages = (pos_dist / len(filtered_df) * 100).round(1)
-                    pos_percentages = pos_percentages.sort_values(ascending=True)
-                    
-                    fig_pos = px.bar(
-                        y=pos_percentages.index,
-                        x=pos_percentages.values,
-                        title="Position Distribution",
-                        labels={'x': 'Percentage (%)', 'y': 'Position'},
-                        orientation='h',
-                        color=pos_percentages.index,
-                        color_discrete_sequence=px.colors.qualitative.Set3[:len(pos_percentages)]
-                    )
-                    fig_pos.update_layout(
-                        title=dict(text="Position Distribution", font=dict(size=24)),
-                        showlegend=False,
-                        height=400
-                    )
-                    st.plotly_chart(fig_pos, use_container_width=True)
+            # The NBA/NHL position chart is hidden (and never computed) under a Position filter
+            if sport == "NFL" or selected_position == "All":
+                position_panel(report, upload_key, sport)
 
         with col_stack:
-            # Stack distribution
-            stack_analysis = (
-                filtered_df
-                .groupby('Draft Entry')
-                .apply(analyze_stacks)
-            )
-            
-            stack_counts = stack_analysis.value_counts()
-            stack_percentages = (stack_counts / len(stack_analysis) * 100).round(1)
-            stack_percentages = stack_percentages.sort_values(ascending=True)
-            
-            fig_stack = px.bar(
-                y=stack_percentages.index,
-                x=stack_percentages.values,
-                title="Stack Distribution",
-                labels={'x': 'Percentage (%)', 'y': 'Stack Type'},
-                orientation='h',
-                color=stack_percentages.index,
-                color_discrete_sequence=px.colors.qualitative.Set3[:len(stack_percentages)]
-            )
-            fig_stack.update_layout(
-                title=dict(text="Stack Distribution", font=dict(size=24)),
-                showlegend=False,
-                height=400
-            )
-            st.plotly_chart(fig_stack, use_container_width=True)
+            stack_panel(report, upload_key)
+        
+        correlation_panel(df, upload_key)
+        timeline_panel(df, upload_key, player_search)
+        rebalance_panel(report, exposures_key)
+        cache_panel()
             
     except Exception as e:
         st.error(f"Error processing file: {str(e)}")
+        if profiling:
+            # Full traceback; the stage that raised is flagged in the waterfall below
+            st.exception(e)
+
+if profiling:
+    profiling_panel(st.session_state.profiler, st.session_state.panel_profilers)
 
 # Create a footer Twitter icon
 col_footer = st.columns([1, 1])  # Create two columns
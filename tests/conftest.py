@@ -0,0 +1,41 @@
+"""Small synthetic exports shared by the tests.
+
+Frames returned by the fixtures are shared across tests and must not be
+modified in place.
+"""
+import pytest
+
+from synthetic import make_export, make_mixed_export
+from udexposures.ingest import load_drafts
+
+SPORTS = ('NFL', 'NBA', 'NHL')
+
+# Enough drafts for every player to show up a few times, small enough to stay fast
+N_DRAFTS = 300
+
+
+@pytest.fixture(scope='session', params=SPORTS)
+def sport(request):
+    return request.param
+
+
+@pytest.fixture(scope='session')
+def csv(sport):
+    """Raw bytes of an export with a couple of unfinished pools."""
+    return make_export(sport, N_DRAFTS, seed=1).to_csv(index=False).encode()
+
+
+@pytest.fixture(scope='session')
+def df(csv):
+    return load_drafts(csv)
+
+
+@pytest.fixture(scope='session')
+def mixed_csv():
+    return make_mixed_export(N_DRAFTS, seed=1).to_csv(index=False).encode()
+
+
+@pytest.fixture(scope='session')
+def mixed_df(mixed_csv):
+    return load_drafts(mixed_csv)
+
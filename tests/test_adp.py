@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from udexposures.adp import PickDistribution, read_field_adp
+
+
+@pytest.fixture(scope='module')
+def picks(df):
+    return PickDistribution(df)
+
+
+@pytest.fixture(scope='module')
+def grouped(df, picks):
+    return df.groupby('Player', observed=True)['Pick Number'].agg(['mean', 'median', 'min', 'max', 'size'])
+
+
+def by_player(picks, values):
+    return pd.Series(values, index=picks.players)
+
+
+def test_summaries_match_groupby(picks, grouped):
+    assert np.allclose(by_player(picks, picks.avg_pick)[grouped.index], grouped['mean'])
+    assert (by_player(picks, picks.min_pick)[grouped.index] == grouped['min']).all()
+    assert (by_player(picks, picks.max_pick_taken)[grouped.index] == grouped['max']).all()
+    assert (by_player(picks, picks.n_picks)[grouped.index] == grouped['size']).all()
+
+
+def test_percentiles_are_nearest_rank(df, picks):
+    for player in df['Player'].value_counts().index[:5]:
+        values = np.sort(df.loc[df['Player'] == player, 'Pick Number'].to_numpy())
+        for q in (10, 50, 90):
+            rank = max(int(np.ceil(q / 100 * len(values))), 1)
+            assert picks.percentile(q, [player])[0] == values[rank - 1]
+    assert np.isnan(picks.percentile(50, ['Nobody Atall'])[0])
+
+
+def test_histogram_counts_every_pick(picks):
+    counts, starts = picks.histogram(bins=12)
+    assert (counts.sum(axis=1) == picks.n_picks).all()
+    assert starts[0] == 1
+    unknown, _ = picks.histogram(['Nobody Atall'])
+    assert unknown.sum() == 0
+
+
+def test_subset_matches_a_fresh_distribution(df, picks):
+    rows = (df['Team'] == df['Team'].iloc[0]).to_numpy()
+    subset = picks.subset(rows)
+    assert subset.max_pick == picks.max_pick
+    assert subset.counts.sum() == rows.sum()
+    fresh = df[rows].groupby('Player', observed=True)['Pick Number'].mean()
+    assert np.allclose(by_player(subset, subset.avg_pick)[fresh.index], fresh)
+
+
+def test_ahead_of(df, picks):
+    player = df['Player'].value_counts().index[0]
+    values = df.loc[df['Player'] == player, 'Pick Number']
+    expected = (values < 20).mean() * 100
+    assert picks.ahead_of([player], [20])[0] == pytest.approx(expected)
+
+
+def test_annotate_with_field_adp(df, picks):
+    exposures = df.groupby('Player', observed=True).size().rename('Total Drafts').reset_index()
+    player = str(exposures['Player'].iloc[0])
+    field_adp = pd.Series({player: 10.0})
+    annotated = picks.annotate(exposures, field_adp).set_index('Player')
+    row = annotated.loc[player]
+    assert row['Field ADP'] == 10.0
+    assert row['Reach'] == pytest.approx(10.0 - row['Avg Pick'], abs=0.1)
+    assert annotated['Field ADP'].isna().sum() == len(annotated) - 1
+
+
+def test_read_field_adp():
+    by_name = read_field_adp(b'firstName,lastName,adp\nJosh,Allen,12.5\nJosh,Allen,13.5\nNo,Adp,-\n')
+    assert by_name.to_dict() == {'Josh Allen': 13.0}
+    assert read_field_adp(b'Player,ADP\n Ja Morant ,4\n').to_dict() == {'Ja Morant': 4.0}
+    with pytest.raises(ValueError):
+        read_field_adp(b'Player,Rank\nJa Morant,4\n')
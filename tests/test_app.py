@@ -0,0 +1,55 @@
+"""The dashboard script run headless, one upload per sport."""
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('streamlit')
+pytest.importorskip('plotly')
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+APP = Path(__file__).resolve().parent.parent / 'exposures.py'
+
+
+def errors(at):
+    return [element.value for element in at.error] + [element.value for element in at.exception]
+
+
+@pytest.fixture
+def app(csv, sport):
+    at = AppTest.from_file(str(APP), default_timeout=120)
+    at.run()
+    at.file_uploader[0].set_value((f'{sport}.csv', csv, 'text/csv'))
+    at.run()
+    return at
+
+
+def test_upload(app, df):
+    assert errors(app) == []
+    metrics = {metric.label: metric.value for metric in app.metric}
+    drafts = df['Draft Entry'].nunique()
+    assert metrics['Total Number of Drafts'] == f'{drafts} / {drafts} (100.0%)'
+    assert len(app.dataframe)
+
+
+def test_filters_and_player_search(app, df):
+    position = next(box for box in app.selectbox if box.label == 'Filter by Position')
+    position.set_value(position.options[1])
+    app.run()
+    assert errors(app) == []
+
+    search = next(box for box in app.multiselect if box.label == 'Search Players')
+    search.set_value([str(df['Player'].value_counts().index[0])])
+    app.run()
+    assert errors(app) == []
+
+
+def test_each_panel_is_profiled(app):
+    app.sidebar.toggle[0].set_value(True)
+    app.run()
+    assert errors(app) == []
+    captions = [caption.value for caption in app.caption]
+    assert any(caption.startswith('exposures_panel: ') for caption in captions)
+    assert any(caption.startswith('stack_panel: ') for caption in captions)
+    panels = next(frame.value for frame in app.dataframe if 'Panel' in frame.value.columns)
+    assert {'exposures_panel', 'stack_panel'} <= set(panels['Panel'])
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+from udexposures.cache import ResultCache, result_nbytes
+
+
+def test_lru_by_entries():
+    cache = ResultCache(max_entries=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert 'b' not in cache
+    assert 'a' in cache and 'c' in cache
+    assert cache.stats()['evictions'] == 1
+
+
+def test_bytes_bound():
+    cache = ResultCache(max_bytes=1000)
+    big = np.zeros(2000, dtype=np.uint8)
+    assert cache.put('big', big) is big
+    assert 'big' not in cache
+    cache.put('a', np.zeros(600, dtype=np.uint8))
+    cache.put('b', np.zeros(600, dtype=np.uint8))
+    assert 'a' not in cache
+    assert cache.nbytes == 600
+
+
+def test_owner_budget_evicts_that_owner_first():
+    cache = ResultCache(max_owner_bytes=1000)
+    cache.put('other', np.zeros(800, dtype=np.uint8), owner='y')
+    cache.put('a', np.zeros(600, dtype=np.uint8), owner='x')
+    cache.put('b', np.zeros(600, dtype=np.uint8), owner='x')
+    assert 'a' not in cache
+    assert 'b' in cache and 'other' in cache
+    assert cache.owner_bytes['x'] == 600
+    assert cache.evict_owner('y') == 1
+    assert 'other' not in cache
+    assert cache.stats()['owners'] == 1
+
+
+def test_get_or_compute_counts_hits():
+    cache = ResultCache()
+    calls = []
+    compute = lambda: calls.append(1) or 'result'
+    assert cache.get_or_compute('k', compute) == 'result'
+    assert cache.get_or_compute('k', compute) == 'result'
+    assert len(calls) == 1
+    assert cache.stats()['hit_rate'] == 50.0
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+def test_result_nbytes_counts_frames():
+    df = pd.DataFrame({'a': np.zeros(100)})
+    assert result_nbytes(df) >= 800
+    assert result_nbytes({'x': df, 'y': df}) >= 1600
@@ -0,0 +1,117 @@
+import json
+import zipfile
+
+import pandas as pd
+import pytest
+
+from udexposures.cli import main
+
+
+@pytest.fixture
+def export(tmp_path, csv):
+    path = tmp_path / 'main.csv'
+    path.write_bytes(csv)
+    return path
+
+
+def summary(out_dir):
+    with open(out_dir / 'summary.json') as f:
+        return json.load(f)
+
+
+def test_single_export(tmp_path, export, df, sport):
+    out_dir = tmp_path / 'reports'
+    assert main([str(export), '-o', str(out_dir)]) == 0
+    assert summary(out_dir)['sport'] == sport
+    assert summary(out_dir)['total_drafts'] == df['Draft Entry'].nunique()
+    exposures = pd.read_csv(out_dir / 'exposures.csv')
+    assert exposures['Total Drafts'].sum() == len(df)
+
+
+def test_filters_and_players(tmp_path, export, df):
+    player = str(df['Player'].value_counts().index[0])
+    team = str(df['Team'].value_counts().index[0])
+    out_dir = tmp_path / 'reports'
+    assert main([str(export), '-o', str(out_dir), '--player', player, '--team', team]) == 0
+    drafts = df.loc[df['Player'] == player, 'Draft Entry'].nunique()
+    assert summary(out_dir)['filtered_drafts'] <= drafts
+
+
+def test_directory_and_zip_give_one_report_per_csv(tmp_path, csv):
+    inputs = tmp_path / 'exports'
+    inputs.mkdir()
+    (inputs / 'alice.csv').write_bytes(csv)
+    (inputs / 'bob.csv').write_bytes(csv)
+    with zipfile.ZipFile(inputs / 'more.zip', 'w') as archive:
+        archive.writestr('carol.csv', csv)
+
+    out_dir = tmp_path / 'reports'
+    assert main([str(inputs), '-o', str(out_dir)]) == 0
+    assert sorted(path.name for path in out_dir.iterdir()) == ['alice', 'bob', 'carol']
+    assert summary(out_dir / 'alice') == summary(out_dir / 'carol')
+
+
+def test_combine(tmp_path, export, df):
+    out_dir = tmp_path / 'reports'
+    assert main([str(export), str(export), '--combine', '-o', str(out_dir)]) == 0
+    # Picks repeated across exports are kept once
+    assert summary(out_dir)['total_drafts'] == df['Draft Entry'].nunique()
+
+
+def test_stream_matches_eager(tmp_path, export):
+    assert main([str(export), '-o', str(tmp_path / 'eager')]) == 0
+    assert main([str(export), '--stream', '--chunksize', '500', '-o', str(tmp_path / 'stream')]) == 0
+    assert summary(tmp_path / 'eager') == summary(tmp_path / 'stream')
+
+
+def test_stream_matches_eager_on_mixed_export(tmp_path, mixed_csv):
+    path = tmp_path / 'mixed.csv'
+    path.write_bytes(mixed_csv)
+    assert main([str(path), '-o', str(tmp_path / 'eager')]) == 0
+    assert main([str(path), '--stream', '--chunksize', '500', '-o', str(tmp_path / 'stream')]) == 0
+    sports = sorted(p.name for p in (tmp_path / 'eager').iterdir())
+    assert sports == ['NBA', 'NFL', 'NHL']
+    assert sorted(p.name for p in (tmp_path / 'stream').iterdir()) == sports
+    for sport in sports:
+        assert summary(tmp_path / 'stream' / sport) == summary(tmp_path / 'eager' / sport)
+
+
+def test_mixed_export_with_a_player_of_one_sport(tmp_path, mixed_csv, mixed_df):
+    path = tmp_path / 'mixed.csv'
+    path.write_bytes(mixed_csv)
+    player = str(mixed_df.loc[mixed_df['Position'] == 'QB', 'Player'].value_counts().index[0])
+    out_dir = tmp_path / 'reports'
+    assert main([str(path), '--player', player, '-o', str(out_dir)]) == 0
+    assert summary(out_dir)['sport'] == 'NFL'
+
+
+def test_store(tmp_path, export, df):
+    pytest.importorskip('pyarrow')
+    store = tmp_path / 'store'
+    for _ in range(2):
+        assert main([str(export), '--store', str(store), '-o', str(tmp_path / 'reports')]) == 0
+    assert summary(tmp_path / 'reports')['total_drafts'] == df['Draft Entry'].nunique()
+
+
+def test_missing_export(tmp_path, capsys):
+    assert main([str(tmp_path / 'missing.csv'), '-o', str(tmp_path / 'reports')]) == 1
+    assert 'missing.csv' in capsys.readouterr().err
+
+
+def test_empty_directory(tmp_path, capsys):
+    empty = tmp_path / 'empty'
+    empty.mkdir()
+    assert main([str(empty), '-o', str(tmp_path / 'reports')]) == 1
+    assert 'No draft exports found' in capsys.readouterr().err
+
+
+def test_account_needs_a_portfolio(tmp_path, export, capsys):
+    with pytest.raises(SystemExit):
+        main([str(export), '--account', 'main', '-o', str(tmp_path / 'reports')])
+    assert '--account needs --combine or --store' in capsys.readouterr().err
+    assert main([str(export), '--combine', '--account', 'main', '-o', str(tmp_path / 'reports')]) == 0
+
+
+def test_stream_rejects_filters(tmp_path):
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / 'missing.csv'), '--stream', '--team', 'KC'])
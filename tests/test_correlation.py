@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from udexposures.correlation import CoExposure
+
+
+@pytest.fixture(scope='module')
+def co(df):
+    return CoExposure(df)
+
+
+def drafts_of(df, player):
+    return set(df.loc[df['Player'] == player, 'Draft Entry'])
+
+
+def test_diagonal_is_player_drafts(df, co):
+    expected = df.groupby('Player', observed=True)['Draft Entry'].nunique()
+    assert (co.player_drafts == expected.reindex(co.players).to_numpy()).all()
+    assert co.n_entries == df['Draft Entry'].nunique()
+
+
+def test_pairs_match_set_intersections(df, co):
+    pairs = co.top_pairs(n=10, min_drafts=3)
+    assert len(pairs)
+    for row in pairs.itertuples():
+        together = drafts_of(df, row[1]) & drafts_of(df, row[2])
+        assert row[3] == len(together)
+    assert pairs['Lift'].is_monotonic_decreasing
+
+
+def test_lift_matrix(df, co):
+    lift = co.lift_matrix(top_n=4)
+    assert lift.shape == (4, 4)
+    assert np.isnan(np.diag(lift.to_numpy())).all()
+    a, b = lift.index[:2]
+    expected = len(drafts_of(df, a) & drafts_of(df, b)) * co.n_entries / (
+        len(drafts_of(df, a)) * len(drafts_of(df, b))
+    )
+    assert lift.loc[a, b] == pytest.approx(expected)
@@ -0,0 +1,12 @@
+from udexposures.encoding import DraftEncoding
+
+
+def test_encoding_labels(df):
+    encoding = DraftEncoding(df)
+    assert (encoding.entries[encoding.entry_codes] == df['Draft Entry'].astype(str)).all()
+    assert (encoding.players[encoding.player_codes] == df['Player'].astype(str)).all()
+    first = df.drop_duplicates('Player').astype({'Player': str}).set_index('Player')
+    info = encoding.player_info.set_index('Player')
+    assert list(info['Team'].astype(str)) == list(first.loc[info.index, 'Team'].astype(str))
+    assert encoding.n_players == df['Player'].nunique()
+    assert encoding.n_entries == df['Draft Entry'].nunique()
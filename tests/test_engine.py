@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from udexposures.engine import ALL, ExposureReport, exposure_table, filter_mask
+from udexposures.entries import summarize_entries
+from udexposures.sports import all_positions
+
+
+def most_drafted(df, n):
+    return list(df['Player'].value_counts().index[:n].astype(str))
+
+
+def test_unfiltered_report(df, sport):
+    report = ExposureReport(df)
+    assert report.sport == sport
+    assert report.row_mask is None
+    assert report.filtered_df is df
+    assert report.total_drafts == report.filtered_drafts == df['Draft Entry'].nunique()
+
+    exposures = report.exposures
+    expected = df.groupby('Player', observed=True).size()
+    assert exposures.set_index('Player')['Total Drafts'].to_dict() == expected.to_dict()
+    assert exposures['Exposure %'].is_monotonic_decreasing
+
+
+def test_filters_match_pandas(df):
+    team = df['Team'].value_counts().index[0]
+    position = df['Position'].iloc[0]
+    report = ExposureReport(df, team=team, position=position)
+    expected = df[(df['Team'] == team) & (df['Position'] == position)]
+    pd.testing.assert_frame_equal(report.filtered_df, expected)
+    assert report.filtered_drafts == expected['Draft Entry'].nunique()
+    assert report.summary()['filtered_drafts'] == report.filtered_drafts
+
+
+def test_all_means_no_filter(df):
+    assert filter_mask(df, team=ALL, position=None) is None
+    assert ExposureReport(df, team=ALL).filtered_df is df
+
+
+def test_players_and_filters_combine(df):
+    players = most_drafted(df, 1)
+    team = df['Team'].value_counts().index[1]
+    report = ExposureReport(df, players=players, team=team)
+    entries = set(df.loc[df['Player'] == players[0], 'Draft Entry'])
+    expected = df[df['Draft Entry'].isin(entries) & (df['Team'] == team)]
+    pd.testing.assert_frame_equal(report.filtered_df, expected)
+
+
+def test_pick_columns_follow_the_filters(df):
+    team = df['Team'].value_counts().index[0]
+    exposures = ExposureReport(df, team=team).exposures.set_index('Player')
+    picks = df[df['Team'] == team].groupby('Player', observed=True)['Pick Number']
+    expected = picks.mean().round(1)
+    assert np.allclose(exposures.loc[expected.index, 'Avg Pick'].astype(float), expected)
+    assert (exposures.loc[expected.index, 'Min Pick'] == picks.min()).all()
+    assert (exposures.loc[expected.index, 'Max Pick'] == picks.max()).all()
+
+
+def test_single_draft_table(df):
+    entry = df['Draft Entry'].iloc[0]
+    exposures = ExposureReport(df, draft_entry=entry).exposures
+    assert len(exposures) == (df['Draft Entry'] == entry).sum()
+    assert (exposures['Exposure %'] == 100.0).all()
+
+
+def test_exposure_table_percentages(df):
+    table = exposure_table(df, 200)
+    assert (table['Exposure %'] == (table['Total Drafts'] / 200 * 100).round(1)).all()
+
+
+def test_distributions(df, sport):
+    report = ExposureReport(df)
+    assert report.team_distribution.sum() == pytest.approx(100, abs=1)
+    assert report.stack_distribution.sum() == pytest.approx(100, abs=1)
+    assert report.build_distribution.empty == (sport != 'NFL')
+    assert set(report.tables()) == {'exposures', 'draft_positions', 'teams', 'positions', 'builds', 'stacks'}
+
+
+def test_panel_keys_only_hold_their_filters(df):
+    players = most_drafted(df, 1)
+    team = df['Team'].iloc[0]
+    a = ExposureReport(df, players=players)
+    b = ExposureReport(df, players=players, team=team)
+    assert a.panel_key('co_drafted') == b.panel_key('co_drafted')
+    assert a.panel_key('team_distribution') == b.panel_key('team_distribution')
+    assert a.panel_key('position_distribution') != b.panel_key('position_distribution')
+    assert a.panel_key('exposures') != b.panel_key('exposures')
+    assert a.panel('summary') == a.summary()
+
+
+def test_shares_leave_out_their_own_filter(df):
+    team = df['Team'].iloc[0]
+    position = df['Position'].iloc[0]
+    report = ExposureReport(df, team=team, position=position)
+    pd.testing.assert_series_equal(report.team_distribution, ExposureReport(df, position=position).team_distribution)
+    pd.testing.assert_series_equal(report.position_distribution, ExposureReport(df, team=team).position_distribution)
+    assert len(report.team_distribution) > 1
+    # Panel results cached under a key must not depend on the filters left out of it
+    for name in ('team_distribution', 'position_distribution'):
+        for other in (ExposureReport(df, team=team), ExposureReport(df, position=position)):
+            if other.panel_key(name) == report.panel_key(name):
+                pd.testing.assert_series_equal(other.panel(name), report.panel(name))
+
+
+def test_by_sport_splits_mixed_exports(mixed_df):
+    reports = ExposureReport.by_sport(mixed_df)
+    assert list(reports) == ['NFL', 'NBA', 'NHL']
+    assert sum(report.total_drafts for report in reports.values()) == mixed_df['Draft Entry'].nunique()
+
+
+def test_by_sport_players_of_one_sport(mixed_df):
+    nba = mixed_df[mixed_df['Position'] == 'PG']
+    players = most_drafted(nba, 1)
+    reports = ExposureReport.by_sport(mixed_df, players=players)
+    assert list(reports) == ['NBA']
+    assert reports['NBA'].filtered_drafts == mixed_df.loc[mixed_df['Player'] == players[0], 'Draft Entry'].nunique()
+
+
+def test_by_sport_players_of_two_sports(mixed_df):
+    nfl = mixed_df[mixed_df['Position'] == 'QB']
+    nba = mixed_df[mixed_df['Position'] == 'PG']
+    players = most_drafted(nfl, 1) + most_drafted(nba, 1)
+    with pytest.raises(KeyError, match='No sport has drafts with all of'):
+        ExposureReport.by_sport(mixed_df, players=players)
+    with pytest.raises(KeyError, match='Unknown player'):
+        ExposureReport.by_sport(mixed_df, players=['Nobody Atall'])
+
+
+def test_by_sport_reuses_entry_summary(mixed_df):
+    # One table for every sport, as DraftStore.load_entries returns it
+    summary = pd.concat([summarize_entries(report.df, sport)
+                         for sport, report in ExposureReport.by_sport(mixed_df).items()])
+    counts = [pos for pos in all_positions() if pos in summary.columns]
+    summary[counts] = summary[counts].fillna(0).astype('int8')
+    reports = ExposureReport.by_sport(mixed_df, entry_summary=summary)
+    for sport, report in reports.items():
+        expected = summarize_entries(report.df, sport)
+        pd.testing.assert_frame_equal(report.entry_summary.astype(str), expected.astype(str))
@@ -0,0 +1,21 @@
+from udexposures.entries import entry_rows, summarize_entries
+from udexposures.sports import get_sport
+
+
+def test_summary_has_one_row_per_entry(df, sport):
+    summary = summarize_entries(df, sport)
+    positions = get_sport(sport).positions
+    assert len(summary) == df['Draft Entry'].nunique()
+    assert (summary['Picks'] == 6).all()
+    assert (summary[positions].sum(axis=1) == summary['Picks']).all()
+    first = df.groupby('Draft Entry', observed=True)['Pick Number'].min()
+    assert (summary['First Pick'] == first).all()
+    assert ('Build' in summary.columns) == (sport == 'NFL')
+
+
+def test_entry_rows_keep_summary_order(df, sport):
+    summary = summarize_entries(df, sport)
+    team = df['Team'].iloc[0]
+    rows = entry_rows(summary, df[df['Team'] == team])
+    assert set(rows.index) == set(df.loc[df['Team'] == team, 'Draft Entry'])
+    assert rows.index.is_monotonic_increasing == summary.index.is_monotonic_increasing
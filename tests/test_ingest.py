@@ -0,0 +1,51 @@
+import io
+
+import pandas as pd
+
+from legacy import legacy_load
+from udexposures.ingest import (
+    REQUIRED_COLUMNS, ROSTER_SIZE, concat_drafts, load_drafts, parse_picked_at, upload_digest,
+)
+
+
+def test_load_drafts_keeps_the_legacy_rows(csv, df):
+    expected = legacy_load(io.BytesIO(csv)).reset_index(drop=True)
+    assert len(df) == len(expected)
+    assert list(df.columns) == REQUIRED_COLUMNS + ['Player']
+    assert (df['Player'].astype(str) == expected['Player'].str.strip()).all()
+    assert (df['Draft Entry'].astype(str) == expected['Draft Entry']).all()
+
+
+def test_unfinished_pools_are_dropped(csv, df):
+    raw = pd.read_csv(io.BytesIO(csv))
+    assert len(df) < len(raw)
+    assert (df.groupby('Draft Pool', observed=True).size() % ROSTER_SIZE == 0).all()
+    # No categories are left over from the dropped pools
+    assert set(df['Draft Pool'].cat.categories) == set(df['Draft Pool'].unique())
+
+
+def test_chunked_matches_eager(csv, df):
+    pd.testing.assert_frame_equal(load_drafts(io.BytesIO(csv), chunksize=500), df)
+
+
+def test_picked_at_is_parsed_as_utc(df):
+    assert str(df['Picked At'].dt.tz) == 'UTC'
+    assert df['Picked At'].notna().all()
+
+
+def test_parse_picked_at_falls_back_to_inference():
+    parsed = parse_picked_at(pd.Series(['09/08/2024 17:03:21', None], dtype='string'))
+    assert parsed.iloc[0] == pd.Timestamp('2024-09-08 17:03:21', tz='UTC')
+    assert pd.isna(parsed.iloc[1])
+
+
+def test_upload_digest_is_content_hash(csv):
+    assert upload_digest(csv) == upload_digest(bytes(csv))
+    assert upload_digest(csv) != upload_digest(csv + b'\n')
+
+
+def test_concat_drafts_keeps_categoricals(df):
+    half = len(df) // 2
+    combined = concat_drafts([df.iloc[:half], None, df.iloc[half:]])
+    assert isinstance(combined['Player'].dtype, pd.CategoricalDtype)
+    assert (combined['Player'] == df['Player']).all()
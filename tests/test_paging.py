@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+
+from udexposures.paging import TablePager, page_count
+
+
+def table():
+    return pd.DataFrame({
+        'Player': ['Josh Allen', 'Ja Morant', 'Jalen Hurts', 'Connor McDavid', 'Joe Burrow'],
+        'Exposure %': [12.5, 3.0, np.nan, 40.0, 12.5],
+        'Team': pd.Categorical(['BUF', 'MEM', 'PHI', 'EDM', 'CIN']),
+    })
+
+
+def test_order_matches_sort_values():
+    pager = TablePager(table())
+    for column in ('Player', 'Exposure %', 'Team'):
+        expected = table().sort_values(column, kind='stable', na_position='last').index
+        assert list(pager.order(column)) == list(expected)
+    descending = table().sort_values('Exposure %', ascending=False, kind='stable', na_position='last').index
+    assert list(pager.order('Exposure %', ascending=False)) == list(descending)
+
+
+def test_view_filters_text_case_insensitively():
+    pager = TablePager(table())
+    view = pager.view('Exposure %', False, '  JA ')
+    assert list(pager.page(view)['Player']) == ['Ja Morant', 'Jalen Hurts']
+
+
+def test_pages():
+    pager = TablePager(table())
+    view = pager.view('Player')
+    assert list(pager.page(view, 2, 2)['Player']) == ['Jalen Hurts', 'Joe Burrow']
+    assert pager.page(view, 4, 2).empty
+    assert page_count(5, 2) == 3
+    assert page_count(0, 50) == 1
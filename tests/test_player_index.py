@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from legacy import legacy_player_search
+from udexposures.encoding import DraftEncoding
+from udexposures.engine import select_players
+from udexposures.player_index import PlayerIndex
+
+
+@pytest.fixture(scope='module')
+def index(df):
+    return PlayerIndex(df)
+
+
+def most_drafted(df, n):
+    return list(df['Player'].value_counts().index[:n].astype(str))
+
+
+@pytest.mark.parametrize('n_players', [1, 2, 3])
+def test_row_mask_matches_legacy_search(df, index, n_players):
+    players = most_drafted(df, n_players)
+    expected = legacy_player_search(df, players)
+    assert np.array_equal(index.row_mask(players), df.index.isin(expected.index))
+    pd.testing.assert_frame_equal(select_players(df, players, index), expected)
+
+
+def test_rare_pair_matches_legacy_search(df, index):
+    # The most and least drafted players rarely share a draft
+    counts = df['Player'].value_counts()
+    players = [str(counts.index[0]), str(counts.index[-1])]
+    expected = legacy_player_search(df, players)
+    assert index.row_mask(players).sum() == len(expected)
+    assert set(index.entry_ids(players)) == set(expected['Draft Entry'].astype(str))
+
+
+def test_bitmaps_hold_every_draft_of_a_player(df, index):
+    for player in most_drafted(df, 5):
+        entries = set(df.loc[df['Player'] == player, 'Draft Entry'].astype(str))
+        assert set(index.entry_ids([player])) == entries
+    assert index.player_drafts.sum() == len(df)
+
+
+def test_no_players_selects_everything(df, index):
+    assert index.entry_mask([]).all()
+    assert select_players(df, []) is df
+
+
+def test_names_are_stripped(df, index):
+    player = most_drafted(df, 1)[0]
+    assert np.array_equal(index.row_mask([f' {player} ']), index.row_mask([player]))
+
+
+def test_unknown_player_raises(index):
+    with pytest.raises(KeyError, match='Nobody Atall'):
+        index.row_mask(['Nobody Atall'])
+
+
+def test_unknown_names(df, index):
+    player = most_drafted(df, 1)[0]
+    assert index.unknown([f' {player} ', 'Nobody Atall']) == ['Nobody Atall']
+
+
+def test_co_drafted_counts(df, index):
+    players = most_drafted(df, 1)
+    selected = legacy_player_search(df, players)
+    expected = selected[selected['Player'] != players[0]]['Player'].astype(str).value_counts()
+    result = index.co_drafted(players).set_index('Player')['Drafts Together']
+    assert result.sort_index().to_dict() == expected[expected > 0].sort_index().to_dict()
+
+
+def test_shared_encoding(df):
+    encoding = DraftEncoding(df)
+    index = PlayerIndex(df, encoding)
+    assert index.encoding is encoding
+    assert np.array_equal(index.bitmaps, PlayerIndex(df).bitmaps)
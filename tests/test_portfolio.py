@@ -0,0 +1,32 @@
+import io
+import zipfile
+
+import pandas as pd
+
+from udexposures.portfolio import ACCOUNT_COLUMN, expand_sources, load_portfolio, portfolio_digest
+
+
+def test_expand_sources(tmp_path):
+    (tmp_path / 'a.csv').write_bytes(b'a')
+    with zipfile.ZipFile(tmp_path / 'b.zip', 'w') as archive:
+        archive.writestr('c.csv', b'c')
+        archive.writestr('__MACOSX/c.csv', b'junk')
+        archive.writestr('notes.txt', b'junk')
+    uploads = [('d.csv', b'd')]
+    assert expand_sources([tmp_path] + uploads) == [('a', b'a'), ('c', b'c'), ('d', b'd')]
+
+
+def test_portfolio_digest_ignores_order():
+    assert portfolio_digest([('a', b'1'), ('b', b'2')]) == portfolio_digest([('b', b'2'), ('a', b'1')])
+    assert portfolio_digest([('a', b'1')]) != portfolio_digest([('a', b'2')])
+
+
+def test_accounts_are_tagged_and_overlaps_dropped(csv, df):
+    entries = df['Draft Entry'].unique()
+    half = pd.read_csv(io.BytesIO(csv))
+    half = half[half['Draft Entry'].isin(entries[:100].astype(str))].to_csv(index=False).encode()
+
+    portfolio = load_portfolio([('full.csv', csv), ('half.csv', half)], max_workers=2)
+    assert len(portfolio) == len(df)
+    assert set(portfolio[ACCOUNT_COLUMN]) == {'full'}
+    assert isinstance(portfolio['Player'].dtype, pd.CategoricalDtype)
@@ -0,0 +1,40 @@
+import json
+
+import pandas as pd
+import pytest
+
+from udexposures.profiling import Profiler, peak_rss_bytes
+
+
+def test_spans_nest_and_record_errors():
+    profiler = Profiler(name='test')
+    with profiler.span('outer', source='x'):
+        with profiler.span('inner'):
+            pass
+    with pytest.raises(ValueError):
+        with profiler.span('failing'):
+            raise ValueError
+    frame = profiler.to_frame()
+    assert list(frame['Stage']) == ['outer', '  inner', 'failing']
+    assert list(frame['Error'].fillna('')) == ['', '', 'ValueError']
+    assert profiler.total >= frame['Duration (ms)'].max() / 1000
+
+
+def test_trace_is_json(tmp_path):
+    profiler = Profiler(name='test')
+    with profiler.span('stage'):
+        profiler.record_frame('df', pd.DataFrame({'a': range(10)}))
+    path = tmp_path / 'trace.json'
+    profiler.save(path)
+    trace = json.loads(path.read_text())
+    assert [event['name'] for event in trace['traceEvents']] == ['stage']
+    assert trace['metadata']['frame_bytes']['df'] > 0
+    assert peak_rss_bytes() > 0
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = Profiler(enabled=False)
+    with profiler.span('stage'):
+        profiler.record_frame('df', pd.DataFrame())
+    assert profiler.spans == [] and profiler.frames == {}
+    assert profiler.total == 0.0
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from udexposures.engine import ExposureReport
+from udexposures.rebalance import ACTIONS, TARGET_TYPES, plan_rebalance, rebalance
+
+
+def counts(values):
+    return pd.Series(values, index=pd.Index(list('abcd')[:len(values)], name='Player'))
+
+
+def test_slots_follow_pace_without_targets():
+    plan = rebalance(counts([50, 30, 20]), 100, 10).set_index('Player')
+    assert plan['Next N'].sum() == 10
+    assert plan['Next N'].to_dict() == {'a': 5, 'b': 3, 'c': 2}
+    assert (plan['Action'] == 'On Pace').all()
+
+
+def test_floors_and_caps_hold():
+    floors = pd.Series({'c': 30.0})
+    caps = pd.Series({'a': 40.0})
+    plan = rebalance(counts([50, 30, 20]), 100, 100, floors=floors, caps=caps).set_index('Player')
+    assert plan['Next N'].sum() == 100
+    assert plan.loc['c', 'Projected %'] >= 30.0
+    assert plan.loc['a', 'Projected %'] <= 40.0
+    assert plan.loc['c', 'Action'] == 'Prioritize'
+    assert plan.loc['a', 'Action'] in ('Limit', 'Avoid')
+
+
+def test_unreachable_floor():
+    plan = rebalance(counts([90, 10]), 100, 5, floors=pd.Series({'b': 50.0})).set_index('Player')
+    assert plan.loc['b', 'Action'] == 'Unreachable'
+    assert plan.loc['b', 'Next N'] <= 5
+    assert list(plan['Action'].cat.categories) == ACTIONS
+
+
+def test_plan_rebalance(df):
+    report = ExposureReport(df)
+    player = str(report.exposures['Player'].iloc[0])
+    team = str(df['Team'].value_counts().index[-1])
+    targets = pd.DataFrame({
+        'Type': ['Player', 'Team', 'Player'],
+        'Name': [player, team, 'Nobody Atall'],
+        'Floor %': [None, 20.0, 10.0],
+        'Cap %': [5.0, None, None],
+    })
+    plans = plan_rebalance(report, 40, targets, player_cap=25)
+    assert list(plans) == list(TARGET_TYPES)
+
+    players = plans['Player'].set_index('Player')
+    assert players.loc[player, 'Cap %'] == 5.0
+    assert players.loc[player, 'Projected %'] < players.loc[player, 'Exposure %']
+    # Targeted players with no drafts yet get a row
+    assert players.loc['Nobody Atall', 'Count'] == 0
+    assert (players['Next N'] <= 40).all()
+    assert plans['Team'].set_index('Team').loc[team, 'Action'] in ('Prioritize', 'Unreachable')
+    assert plans['Stack']['Next N'].sum() == 40
+
+
+@pytest.mark.parametrize('added', [1, 7, 250])
+def test_allocation_sums_to_slots(added):
+    current = pd.Series(np.arange(1, 41), index=pd.Index([f'p{i}' for i in range(40)], name='Player'))
+    plan = rebalance(current, int(current.sum()), added)
+    assert plan['Next N'].sum() == added
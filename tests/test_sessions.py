@@ -0,0 +1,33 @@
+from udexposures.sessions import SessionTracker, session_limits
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_session_limits():
+    assert session_limits({}) == (256 * 1024 ** 2, 30 * 60)
+    assert session_limits({'UDEXPOSURES_SESSION_MB': '64', 'UDEXPOSURES_IDLE_MINUTES': '0.5'}) == (
+        64 * 1024 ** 2, 30
+    )
+
+
+def test_idle_sessions_release_uploads_no_one_else_holds():
+    clock = Clock()
+    tracker = SessionTracker(idle_seconds=60, clock=clock)
+    tracker.touch('tab-1', 'upload-a')
+    tracker.touch('tab-2', 'upload-b')
+    tracker.touch('tab-3', None)
+    clock.now = 50
+    tracker.touch('tab-4', 'upload-b')
+    clock.now = 100
+
+    assert tracker.evict_idle() == ['upload-a']
+    assert len(tracker) == 1
+    assert tracker.stats() == {'sessions': 1, 'uploads': 1, 'idle_seconds': 60}
+    clock.now = 200
+    assert tracker.evict_idle() == ['upload-b']
@@ -0,0 +1,53 @@
+import pandas as pd
+import pytest
+
+from udexposures.ingest import ROSTER_SIZE
+from udexposures.sports import detect_pool_sports, detect_sport, get_sport, split_sports
+
+
+def test_detect_sport(df, sport):
+    assert detect_sport(df) == sport
+
+
+def test_split_single_sport_keeps_the_frame(df, sport):
+    frames = split_sports(df)
+    assert list(frames) == [sport]
+    assert frames[sport] is df
+
+
+def test_split_mixed_export(mixed_df):
+    frames = split_sports(mixed_df)
+    assert list(frames) == ['NFL', 'NBA', 'NHL']
+    assert sum(len(frame) for frame in frames.values()) == len(mixed_df)
+    for sport, frame in frames.items():
+        assert detect_sport(frame) == sport
+        assert not set(frame['Draft Pool']) & set().union(
+            *(set(other['Draft Pool']) for name, other in frames.items() if name != sport)
+        )
+
+
+def test_pool_sports(mixed_df):
+    pool_sports = detect_pool_sports(mixed_df)
+    assert set(pool_sports) == {'NFL', 'NBA', 'NHL'}
+    assert len(pool_sports) == mixed_df['Draft Pool'].nunique()
+
+
+def test_unfinished_pools_are_left_out(df, sport):
+    pool = df['Draft Pool'].iloc[0]
+    partial = df.drop(df.index[df['Draft Pool'] == pool][:1])
+    frames = split_sports(partial)
+    assert pool not in set(frames[sport]['Draft Pool'])
+    assert len(frames[sport]) % ROSTER_SIZE == 0
+
+
+def test_unknown_positions_raise():
+    df = pd.DataFrame({'Position': ['XX'] * 6, 'Draft Pool': ['pool'] * 6})
+    with pytest.raises(ValueError):
+        detect_sport(df)
+    with pytest.raises(ValueError):
+        split_sports(df)
+
+
+def test_unknown_sport_raises():
+    with pytest.raises(KeyError):
+        get_sport('Curling')
@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+
+from legacy import legacy_stack_labels
+from synthetic import make_export
+from udexposures.sports import get_sport
+from udexposures.stacks import classify_nfl_stacks, primary_stack_team
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_vectorized_labels_match_legacy(sport, seed):
+    picks = make_export(sport, 1000, seed, invalid_pools=0, full_schema=False)
+    picks = picks[['Draft Entry', 'Team', 'Position']].astype('category')
+    expected = legacy_stack_labels(picks, sport)
+    result = get_sport(sport).stack_classifier(picks)
+    pd.testing.assert_series_equal(result.astype(str), expected.astype(str), check_names=False)
+
+
+def test_labels_on_ingested_frame(df, sport):
+    expected = legacy_stack_labels(df[['Draft Entry', 'Team', 'Position']], sport)
+    result = get_sport(sport).stack_classifier(df)
+    pd.testing.assert_series_equal(result.astype(str), expected.astype(str), check_names=False)
+
+
+def drafts(rosters):
+    """Pick-level frame of hand-written (position, team) rosters."""
+    rows = [(f'entry-{i}', position, team) for i, roster in enumerate(rosters) for position, team in roster]
+    return pd.DataFrame(rows, columns=['Draft Entry', 'Position', 'Team']).astype('category')
+
+
+def test_nfl_labels():
+    picks = drafts([
+        [('QB', 'KC'), ('WR', 'KC'), ('TE', 'KC'), ('RB', 'BUF'), ('WR', 'DAL'), ('WR', 'SF')],
+        [('QB', 'KC'), ('WR', 'BUF'), ('TE', 'DAL'), ('RB', 'BUF'), ('WR', 'DAL'), ('WR', 'SF')],
+        [('RB', 'KC'), ('WR', 'KC'), ('TE', 'KC'), ('RB', 'BUF'), ('WR', 'DAL'), ('WR', 'SF')],
+    ])
+    labels = classify_nfl_stacks(picks)
+    assert list(labels.astype(str)) == ['Double', 'Naked QB', 'Invalid']
+
+
+def test_primary_stack_team():
+    picks = drafts([[('QB', 'KC'), ('WR', 'KC'), ('TE', 'KC'), ('RB', 'BUF'), ('WR', 'BUF'), ('WR', 'SF')]])
+    assert primary_stack_team(picks).astype(str).iloc[0] == 'KC'
@@ -0,0 +1,88 @@
+import pandas as pd
+import pytest
+
+from udexposures.entries import summarize_entries
+from udexposures.sports import split_sports
+from udexposures.store import DraftStore
+
+pytest.importorskip('pyarrow')
+
+
+def test_append_is_incremental(tmp_path, df, sport):
+    store = DraftStore(tmp_path)
+    entries = df['Draft Entry'].unique()
+    first = df[df['Draft Entry'].isin(entries[:100])]
+    assert store.append(first, sport) == 100
+    assert store.append(df, sport) == len(entries) - 100
+    assert store.append(df, sport) == 0
+    assert len(store.load_picks()) == len(df)
+    assert set(store.known_entries()) == set(entries.astype(str))
+
+
+def test_interrupted_append_is_retried_in_full(tmp_path, df, sport, monkeypatch):
+    store = DraftStore(tmp_path)
+    to_parquet = pd.DataFrame.to_parquet
+    calls = []
+
+    def fail_on_entries(self, path, **kwargs):
+        calls.append(path)
+        if len(calls) == 2:
+            raise OSError('disk full')
+        return to_parquet(self, path, **kwargs)
+
+    monkeypatch.setattr(pd.DataFrame, 'to_parquet', fail_on_entries)
+    with pytest.raises(OSError):
+        store.append(df, sport)
+    monkeypatch.undo()
+    assert store.load_picks() is None
+    assert store.append(df, sport) == df['Draft Entry'].nunique()
+    assert len(store.load_picks()) == len(df)
+
+
+def test_orphan_picks_part_is_dropped(tmp_path, df, sport):
+    store = DraftStore(tmp_path)
+    store.append(df, sport)
+    # An append interrupted between the two renames
+    (store.entries_dir / 'part-00000.parquet').unlink()
+    assert store.append(df, sport) == df['Draft Entry'].nunique()
+    assert len(store.load_picks()) == len(df)
+
+
+def test_stored_summaries_match(tmp_path, mixed_df):
+    store = DraftStore(tmp_path)
+    store.append(mixed_df)
+    stored = store.load_entries()
+    for sport, frame in split_sports(mixed_df).items():
+        expected = summarize_entries(frame, sport)
+        result = stored.loc[expected.index.astype(str), expected.columns]
+        pd.testing.assert_frame_equal(result.astype(str), expected.set_axis(result.index).astype(str))
+
+
+def test_unfinished_pools_are_picked_up_later(tmp_path, df, sport):
+    store = DraftStore(tmp_path)
+    pool = df['Draft Pool'].iloc[0]
+    pool_rows = df.index[df['Draft Pool'] == pool]
+    partial = df.drop(pool_rows[:1])
+    added = store.append(partial)
+    assert pool not in set(store.load_picks()['Draft Pool'])
+    # Re-importing the same unfinished export stores nothing
+    assert store.append(partial) == 0
+    assert added + store.append(df) == df['Draft Entry'].nunique()
+    assert len(store.load_picks()) == len(df)
+
+
+def test_invalid_first_import_raises(tmp_path):
+    df = pd.DataFrame({'Draft Entry': ['e'] * 6, 'Position': ['XX'] * 6, 'Draft Pool': ['p'] * 6})
+    with pytest.raises(ValueError):
+        DraftStore(tmp_path).append(df)
+
+
+def test_compact(tmp_path, df, sport):
+    store = DraftStore(tmp_path)
+    entries = df['Draft Entry'].unique()
+    store.append(df[df['Draft Entry'].isin(entries[:50])], sport)
+    store.append(df, sport)
+    store.compact()
+    assert [path.name for path in store.picks_dir.iterdir()] == ['part-00000.parquet']
+    assert len(store.load_picks()) == len(df)
+    assert len(store.load_entries()) == len(entries)
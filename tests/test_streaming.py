@@ -0,0 +1,80 @@
+import io
+
+import pandas as pd
+import pytest
+
+from udexposures.engine import ExposureReport
+from udexposures.sports import detect_pool_sports
+from udexposures.streaming import StreamingExposures, count_pool_picks, scan_pools
+
+KEY = ['Player', 'Position', 'Team']
+
+
+@pytest.fixture(scope='module', params=[100, 1000, 1_000_000], ids=lambda size: f'chunks of {size}')
+def streamed(request, csv):
+    return StreamingExposures.from_source(io.BytesIO(csv), chunksize=request.param)
+
+
+def by_player(exposures):
+    exposures = exposures.astype({column: str for column in KEY})
+    return exposures.set_index(KEY).sort_index()
+
+
+def test_exposures_match_eager(streamed, df):
+    expected = ExposureReport(df).exposures[streamed.exposures().columns]
+    pd.testing.assert_frame_equal(by_player(streamed.exposures()), by_player(expected), check_dtype=False)
+
+
+def test_draft_positions_match_eager(streamed, df):
+    expected = ExposureReport(df).draft_positions
+    result = streamed.draft_positions()
+    merged = expected.astype({'Draft Entry': str}).merge(result, on='Draft Entry', validate='one_to_one')
+    assert len(merged) == len(expected) == len(result)
+    assert (merged['Draft Position_x'] == merged['Draft Position_y']).all()
+
+
+def test_summary_matches_eager(streamed, df):
+    assert streamed.summary() == ExposureReport(df).summary()
+
+
+def test_by_sport_matches_eager(mixed_csv, mixed_df):
+    streamed = StreamingExposures.by_sport(mixed_csv, chunksize=700)
+    reports = ExposureReport.by_sport(mixed_df)
+    assert list(streamed) == list(reports)
+    for sport, report in reports.items():
+        assert streamed[sport].summary() == report.summary()
+        expected = report.exposures[streamed[sport].exposures().columns]
+        pd.testing.assert_frame_equal(by_player(streamed[sport].exposures()), by_player(expected),
+                                      check_dtype=False)
+
+
+def test_scan_pools(mixed_csv, mixed_df):
+    pools = scan_pools(io.BytesIO(mixed_csv), chunksize=250)
+    raw = pd.read_csv(io.BytesIO(mixed_csv))
+    assert pools['Picks'].sort_index().to_dict() == raw.groupby('Draft Pool').size().to_dict()
+    expected = detect_pool_sports(mixed_df)
+    assert (pools.loc[expected.index.astype(str), 'Sport'].to_numpy() == expected.to_numpy()).all()
+
+
+def test_by_sport_rejects_unknown_positions():
+    csv = pd.DataFrame({
+        'First Name': ['A'] * 6, 'Last Name': ['B'] * 6, 'Position': ['XX'] * 6, 'Team': ['T'] * 6,
+        'Draft Pool': ['p'] * 6, 'Draft Pool Entry Fee': [1] * 6, 'Draft Entry': ['e'] * 6,
+        'Pick Number': range(6),
+    }).to_csv(index=False).encode()
+    with pytest.raises(ValueError):
+        StreamingExposures.by_sport(csv)
+
+
+def test_pool_counts(csv):
+    raw = pd.read_csv(io.BytesIO(csv))
+    expected = raw.groupby('Draft Pool').size()
+    counts = count_pool_picks(io.BytesIO(csv), chunksize=250)
+    assert counts.sort_index().to_dict() == expected.to_dict()
+
+
+def test_empty_stream():
+    totals = StreamingExposures([])
+    assert totals.total_drafts == 0
+    assert totals.exposures().empty
+    assert totals.draft_positions().empty
@@ -0,0 +1,24 @@
+import pytest
+
+from udexposures.teams import LOGO_FILES, team_colors, team_metadata
+
+
+@pytest.mark.parametrize('sport', sorted(LOGO_FILES))
+def test_bundled_metadata(sport):
+    meta = team_metadata(sport)
+    assert len(meta) and meta.index.is_unique
+    colors = team_colors(sport.lower())
+    assert set(colors) == set(meta.index)
+    assert all(color.startswith('#') for color in colors.values())
+
+
+def test_colors_are_shared_and_read_only():
+    colors = team_colors('NFL')
+    assert team_colors('nfl') is colors
+    with pytest.raises(TypeError):
+        colors['XXX'] = '#000000'
+
+
+def test_unknown_sport():
+    with pytest.raises(KeyError):
+        team_metadata('Curling')
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from udexposures.timeline import ExposureTimeline
+
+
+@pytest.fixture(scope='module')
+def timeline(df):
+    return ExposureTimeline(df)
+
+
+@pytest.fixture(scope='module')
+def started(df):
+    """Start time of every draft, by its first pick."""
+    return df.groupby('Draft Entry', observed=True)['Picked At'].min().sort_values(kind='stable')
+
+
+def test_entries_are_ordered_by_start(timeline, started):
+    assert timeline.n_entries == len(started)
+    assert (timeline.entry_times == pd.DatetimeIndex(started.to_numpy())).all()
+    assert timeline.start == started.iloc[0] and timeline.end == started.iloc[-1]
+
+
+def test_snapshot_at_the_end_is_the_exposure_table(df, timeline):
+    snapshot = timeline.snapshot(timeline.end).set_index('Player')
+    expected = df.groupby('Player', observed=True)['Draft Entry'].nunique()
+    assert snapshot['Total Drafts'].to_dict() == expected[expected > 0].to_dict()
+    assert (snapshot['Change Since %'] == 0).all()
+
+
+def test_snapshot_midway(df, timeline, started):
+    when = started.iloc[len(started) // 2]
+    entries = started.index[started <= when]
+    picks = df[df['Draft Entry'].isin(entries)]
+    expected = picks.groupby('Player', observed=True)['Draft Entry'].nunique()
+    snapshot = timeline.snapshot(when).set_index('Player')
+    assert timeline.drafts_as_of(when) == len(entries)
+    assert snapshot['Total Drafts'].to_dict() == expected[expected > 0].to_dict()
+
+
+def test_weekly_buckets(df, timeline, started):
+    players = list(df['Player'].value_counts().index[:3])
+    buckets = timeline.buckets('W', players)
+    week = started.dt.tz_localize(None).dt.to_period('W').dt.start_time
+    drafts = week.groupby(week).size()
+    assert (timeline.draft_counts('W').to_numpy() == drafts.to_numpy()).all()
+
+    player = players[0]
+    entries = set(df.loc[df['Player'] == player, 'Draft Entry'])
+    has_player = week[week.index.isin(entries)].groupby(week[week.index.isin(entries)]).size()
+    expected = (has_player.reindex(drafts.index, fill_value=0) / drafts * 100).round(1)
+    assert np.allclose(buckets[player].to_numpy(), expected.to_numpy())
+    cumulative = timeline.buckets('W', players, cumulative=True)
+    assert cumulative[player].iloc[-1] == pytest.approx(len(entries) / len(started) * 100, abs=0.05)
+
+
+def test_rolling(df, timeline):
+    player = df['Player'].value_counts().index[0]
+    rolling = timeline.rolling([player], window=50, max_points=1000)
+    assert len(rolling) == timeline.n_entries
+    entries = set(df.loc[df['Player'] == player, 'Draft Entry'])
+    hits = np.isin(np.asarray(timeline.entries), list(entries))
+    expected = hits[-50:].mean() * 100
+    assert rolling[player].iloc[-1] == pytest.approx(expected, abs=0.05)
+    assert timeline.rolling(['Nobody Atall']).empty
@@ -0,0 +1,27 @@
+"""Analytics helpers behind the Underdog draft exposures dashboard."""
+from . import engine
+from .engine import ExposureReport, detect_sport
+from .ingest import (
+    REQUIRED_COLUMNS,
+    ROSTER_SIZE,
+    load_drafts,
+    normalize_drafts,
+    read_draft_csv,
+    upload_digest,
+)
+from .sports import Sport, register_sport, split_sports
+
+__all__ = [
+    'ExposureReport',
+    'detect_sport',
+    'engine',
+    'Sport',
+    'register_sport',
+    'split_sports',
+    'REQUIRED_COLUMNS',
+    'ROSTER_SIZE',
+    'load_drafts',
+    'normalize_drafts',
+    'read_draft_csv',
+    'upload_digest',
+]
@@ -0,0 +1,201 @@
+"""Per-player pick number distributions: ADP, pick ranges and reach vs. the field.
+
+``PickDistribution`` bins every pick of a frame into a players x pick number
+count matrix in one pass and keeps its running sum along pick numbers.
+Average, min/max and percentile picks, coarser histogram bins and the share
+of picks taken ahead of a field ADP are all read from those two arrays, so
+none of them re-aggregates the picks. ``subset`` re-bins just the picks left
+by a set of filters, so the pick columns of a filtered table describe the
+same picks as its other columns.
+"""
+import io
+
+import numpy as np
+import pandas as pd
+
+from .encoding import DraftEncoding
+
+# Pick columns added to the exposures table
+PICK_COLUMNS = ['Avg Pick', 'Median Pick', 'Min Pick', 'Max Pick']
+
+# Columns added when a field ADP is given
+REACH_COLUMNS = ['Field ADP', 'Reach', 'Ahead of Field %']
+
+
+def _compact(counts):
+    """Counts in the smallest unsigned integer type that holds them."""
+    return counts.astype(np.min_scalar_type(int(counts.max()) if counts.size else 0))
+
+
+class PickDistribution:
+    """Pick number histogram of every player in one pick-level frame.
+
+    ``counts[player, pick - 1]`` is how often the player was taken with that
+    pick number; ``cumulative`` is its running sum along pick numbers. Pass
+    the upload's ``encoding`` to reuse its player codes.
+    """
+
+    def __init__(self, df, encoding=None):
+        encoding = encoding or DraftEncoding(df)
+        self.players = encoding.players
+        # Kept per row so ``subset`` can re-bin any filtered set of picks
+        self._row_players = encoding.player_codes
+        self._row_picks = _compact(np.maximum(df['Pick Number'].to_numpy(dtype=np.int64), 0))
+        picks = self._row_picks[(self._row_players >= 0) & (self._row_picks >= 1)]
+        self._fill(np.ones(len(self._row_picks), dtype=bool), int(picks.max()) if len(picks) else 0)
+
+    def _fill(self, rows, max_pick):
+        """Bin the picks of the rows selected by the boolean mask ``rows``."""
+        player_codes, picks = self._row_players[rows], self._row_picks[rows].astype(np.int64)
+        keep = (player_codes >= 0) & (picks >= 1) & (picks <= max_pick)
+        player_codes, picks = player_codes[keep], picks[keep]
+        self.max_pick = max_pick
+
+        # One bincount over player x pick number
+        counts = np.bincount(
+            player_codes.astype(np.int64) * self.max_pick + picks - 1,
+            minlength=len(self.players) * self.max_pick,
+        ).reshape(len(self.players), self.max_pick)
+        self.counts = _compact(counts)
+        self.cumulative = _compact(counts.cumsum(axis=1))
+        self.n_picks = counts.sum(axis=1)
+
+        # Per-player summaries, read off the histogram once
+        taken = counts > 0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.avg_pick = counts @ np.arange(1, self.max_pick + 1) / self.n_picks
+        self.min_pick = np.where(self.n_picks > 0, taken.argmax(axis=1) + 1, 0)
+        self.max_pick_taken = np.where(self.n_picks > 0, self.max_pick - taken[:, ::-1].argmax(axis=1), 0)
+        self.median_pick = self.percentile(50)
+        self._binned = {}
+
+    def subset(self, rows):
+        """Distribution of the picks in ``rows`` only (a boolean mask over the frame's rows).
+
+        Players and pick numbers are those of this distribution, so histogram
+        bins line up with it.
+        """
+        subset = object.__new__(type(self))
+        subset.players, subset._row_players, subset._row_picks = self.players, self._row_players, self._row_picks
+        subset._fill(rows, self.max_pick)
+        return subset
+
+    @property
+    def nbytes(self):
+        arrays = (self.counts, self.cumulative, self.n_picks, self.avg_pick, self.min_pick,
+                  self.max_pick_taken, self.median_pick)
+        return int(sum(array.nbytes for array in arrays) + sum(b.nbytes for b in self._binned.values()))
+
+    def player_codes(self, players):
+        """Codes of the given players; -1 for names not in the distribution."""
+        return self.players.get_indexer(np.asarray(players, dtype=object))
+
+    def percentile(self, q, players=None):
+        """Nearest-rank ``q``-th percentile pick of each player (default: all).
+
+        Players without picks (or unknown names) get NaN.
+        """
+        codes = np.arange(len(self.players)) if players is None else self.player_codes(players)
+        known = codes >= 0
+        cumulative = self.cumulative[codes[known]]
+        n_picks = self.n_picks[codes[known]]
+        # The pick holding the ceil(q% of picks)-th pick of the player
+        rank = np.maximum(np.ceil(q / 100 * n_picks), 1)
+        result = np.full(len(codes), np.nan)
+        result[known] = np.where(n_picks > 0, (cumulative < rank[:, None]).sum(axis=1) + 1, np.nan)
+        return result
+
+    def histogram(self, players=None, bins=12):
+        """Pick counts of each player (default: all) in ``bins`` equal-width bins.
+
+        Returns the players x bins count matrix and the first pick number of
+        each bin; unknown players get empty rows. Each bin count is summed
+        from the pick counts once and reused.
+        """
+        width = max(-(-self.max_pick // bins), 1)
+        n_bins = max(-(-self.max_pick // width), 1)
+        if bins not in self._binned:
+            padded = np.zeros((len(self.players), n_bins * width), dtype=self.counts.dtype)
+            padded[:, :self.max_pick] = self.counts
+            self._binned[bins] = _compact(padded.reshape(len(self.players), n_bins, width).sum(axis=2))
+        binned = self._binned[bins]
+        if players is not None:
+            codes = self.player_codes(players)
+            binned = np.where((codes >= 0)[:, None], binned[np.maximum(codes, 0)], 0)
+        return binned, np.arange(n_bins) * width + 1
+
+    def ahead_of(self, players, picks):
+        """Share (%) of each player's picks made before the given pick numbers."""
+        codes = self.player_codes(players)
+        picks = np.asarray(picks, dtype=np.float64)
+        known = (codes >= 0) & ~np.isnan(picks)
+        # Picks strictly before p are the pick numbers 1..ceil(p) - 1
+        before = np.clip(np.ceil(picks[known]).astype(np.int64) - 1, 0, self.max_pick)
+        counts = np.zeros(known.sum(), dtype=np.int64)
+        inside = before > 0
+        counts[inside] = self.cumulative[codes[known][inside], before[inside] - 1]
+        result = np.full(len(codes), np.nan)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            result[known] = counts / self.n_picks[codes[known]] * 100
+        return result
+
+    def annotate(self, exposures, field_adp=None):
+        """Exposure table with the pick columns (and reach columns) of its players.
+
+        ``field_adp`` maps player names to the field's average draft position
+        (see ``read_field_adp``); Reach is field ADP minus the player's average
+        pick, so positive values mean the player is taken earlier than the field.
+        """
+        players = exposures['Player']
+        codes = self.player_codes(players)
+        known = codes >= 0
+        avg_pick = np.where(known, self.avg_pick[codes], np.nan)
+
+        def column(values, dtype='Float64'):
+            return pd.array(np.round(values, 1), dtype=dtype)
+
+        def lookup(values, dtype='Float64'):
+            return column(np.where(known, values[codes], np.nan), dtype)
+
+        exposures = exposures.assign(**{
+            'Avg Pick': column(avg_pick),
+            'Median Pick': lookup(self.median_pick),
+            'Min Pick': lookup(self.min_pick, 'Int64'),
+            'Max Pick': lookup(self.max_pick_taken, 'Int64'),
+        })
+        if field_adp is None:
+            return exposures
+        field = field_adp.reindex(np.asarray(players, dtype=object)).to_numpy(dtype=np.float64)
+        return exposures.assign(**{
+            'Field ADP': column(field),
+            'Reach': column(field - avg_pick),
+            'Ahead of Field %': column(self.ahead_of(players, field)),
+        })
+
+
+def read_field_adp(source):
+    """Parse a field ADP CSV (path, buffer or bytes) into player -> ADP.
+
+    Takes either ``Player`` or first/last name columns (``firstName`` and
+    ``lastName`` as in Underdog's rankings export) plus an ``ADP`` column;
+    rows without a numeric ADP are dropped.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    df = pd.read_csv(source)
+    columns = {column.lower().replace(' ', '').replace('_', ''): column for column in df.columns}
+    if 'adp' not in columns:
+        raise ValueError('Field ADP file needs an ADP column')
+    if 'player' in columns:
+        player = df[columns['player']].astype('string')
+    elif 'firstname' in columns and 'lastname' in columns:
+        player = df[columns['firstname']].astype('string') + ' ' + df[columns['lastname']].astype('string')
+    else:
+        raise ValueError('Field ADP file needs a Player column or first and last name columns')
+    adp = pd.to_numeric(df[columns['adp']], errors='coerce')
+    return (
+        pd.Series(adp.to_numpy(), index=player.str.strip().to_numpy(), name='Field ADP')
+        .dropna()
+        .groupby(level=0).mean()
+        .rename_axis('Player')
+    )
@@ -0,0 +1,141 @@
+"""Bounded LRU cache for computed dashboard results.
+
+Entries are evicted least-recently-used first once either the entry count or
+the estimated memory of the stored values goes over its cap. Entries can be
+tagged with an owner (the dashboard uses the upload they were computed from)
+to cap what one owner holds and to drop everything of an owner at once. Hit,
+miss and eviction counters are kept so the dashboard can show how well it
+works.
+"""
+import sys
+import threading
+from collections import OrderedDict, defaultdict
+
+import numpy as np
+import pandas as pd
+
+
+def result_nbytes(value):
+    """Approximate memory held by a cached value (frames counted deeply)."""
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(getattr(value, 'nbytes', None), int):
+        # Objects that report their own size (e.g. paging.TablePager)
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(result_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(result_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    """Thread-safe LRU mapping of hashable keys to computed results.
+
+    ``max_entries`` bounds the number of results and ``max_bytes`` their
+    estimated total size; ``max_owner_bytes`` (optional) bounds the size of
+    the results stored under any one owner, evicting that owner's least
+    recently used results first. A single result larger than a bound is
+    returned but not stored.
+    """
+
+    def __init__(self, max_entries=64, max_bytes=256 * 1024 ** 2, max_owner_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_owner_bytes = max_owner_bytes
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.owner_bytes = defaultdict(int)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._items:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._items.move_to_end(key)
+            return self._items[key][0]
+
+    def _pop(self, key):
+        # Caller holds the lock
+        _, size, owner = self._items.pop(key)
+        self.nbytes -= size
+        self.owner_bytes[owner] -= size
+        if not self.owner_bytes[owner]:
+            del self.owner_bytes[owner]
+
+    def put(self, key, value, owner=None):
+        size = result_nbytes(value)
+        owner_limit = self.max_owner_bytes if owner is not None else None
+        with self._lock:
+            if key in self._items:
+                self._pop(key)
+            if size > self.max_bytes or (owner_limit is not None and size > owner_limit):
+                return value
+            self._items[key] = (value, size, owner)
+            self.nbytes += size
+            self.owner_bytes[owner] += size
+            # The owner's own oldest results go first when it is over its budget
+            while owner_limit is not None and self.owner_bytes[owner] > owner_limit:
+                self._pop(next(k for k, item in self._items.items() if item[2] == owner))
+                self.evictions += 1
+            while len(self._items) > self.max_entries or self.nbytes > self.max_bytes:
+                self._pop(next(iter(self._items)))
+                self.evictions += 1
+        return value
+
+    def get_or_compute(self, key, compute, owner=None):
+        """Cached result for ``key``, calling ``compute()`` on a miss.
+
+        ``compute`` runs outside the lock, so two sessions missing the same
+        key at once may both compute it; the last one stored wins.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = self.put(key, compute(), owner)
+        return value
+
+    def evict_owner(self, owner):
+        """Drop every result stored under ``owner``; returns how many."""
+        with self._lock:
+            keys = [key for key, item in self._items.items() if item[2] == owner]
+            for key in keys:
+                self._pop(key)
+            self.evictions += len(keys)
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.nbytes = 0
+            self.owner_bytes.clear()
+
+    def stats(self):
+        """Counters and current size, for display."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups * 100, 1) if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self._items),
+            'max_entries': self.max_entries,
+            'bytes': self.nbytes,
+            'max_bytes': self.max_bytes,
+            'owners': sum(1 for owner in self.owner_bytes if owner is not None),
+            'max_owner_bytes': self.max_owner_bytes,
+        }
@@ -0,0 +1,197 @@
+"""Command-line entry point: ``udexposures`` (or ``python -m udexposures``).
+
+Writes the tables of an ``ExposureReport`` for one or more draft exports,
+so nightly reports can run in a batch job without a Streamlit server.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from .adp import read_field_adp
+from .engine import ExposureReport
+from .ingest import CHUNKSIZE, load_drafts
+from .portfolio import expand_sources, load_portfolio
+from .profiling import Profiler
+from .store import DraftStore
+from .streaming import StreamingExposures
+
+FORMATS = ('csv', 'parquet', 'json')
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='udexposures',
+        description='Compute Underdog draft exposure reports from exported CSVs.',
+    )
+    parser.add_argument('inputs', nargs='+', type=Path,
+                        help='Underdog draft export CSV file(s), directories or zip archives')
+    parser.add_argument('-o', '--output', type=Path, default=Path('reports'),
+                        help='output directory (default: ./reports)')
+    parser.add_argument('-f', '--format', choices=FORMATS, default='csv')
+    parser.add_argument('--combine', action='store_true',
+                        help='report on all inputs as one multi-account portfolio')
+    parser.add_argument('--store', type=Path,
+                        help='append new entries from the inputs to this local store and '
+                             'report on everything it holds')
+    parser.add_argument('--chunksize', type=int,
+                        help='read exports this many rows at a time to bound peak memory')
+    parser.add_argument('--stream', action='store_true',
+                        help='only write unfiltered exposures and draft positions, '
+                             'aggregated in one pass without loading the picks')
+    parser.add_argument('--field-adp', type=Path, metavar='CSV',
+                        help='field ADP per player (Player or firstName/lastName plus ADP columns) '
+                             'to add reach columns to the exposures table')
+    parser.add_argument('--profile', type=Path, metavar='TRACE',
+                        help='write a JSON timing trace of the run (Chrome trace format) to TRACE')
+    parser.add_argument('--player', action='append', dest='players', default=[],
+                        help='only drafts containing this player (repeatable)')
+    parser.add_argument('--title', dest='draft_pool_title', help='Draft Pool Title filter')
+    parser.add_argument('--position', help='Position filter')
+    parser.add_argument('--team', help='Team filter')
+    parser.add_argument('--draft', dest='draft_entry', help='Draft Entry filter')
+    parser.add_argument('--account', help='Account filter (portfolio reports)')
+    return parser
+
+
+def write_table(df, path, fmt):
+    if fmt == 'csv':
+        df.to_csv(path, index=False)
+    elif fmt == 'parquet':
+        df.to_parquet(path, index=False)
+    else:
+        df.to_json(path, orient='records', indent=2, date_format='iso')
+
+
+def write_report(report, out_dir, fmt, profiler=None):
+    """Write every report table plus a ``summary.json`` into ``out_dir``."""
+    profiler = profiler or Profiler(enabled=False)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    with profiler.span('aggregate', output=out_dir):
+        tables = report.tables()
+        summary = report.summary()
+    with profiler.span('write', output=out_dir):
+        for name, table in tables.items():
+            write_table(table, out_dir / f'{name}.{fmt}', fmt)
+        with open(out_dir / 'summary.json', 'w') as f:
+            json.dump(summary, f, indent=2)
+
+
+def run_report(label, make_report, out_dir, fmt, profiler=None):
+    """Build and write a report, printing a one-line summary; returns success.
+
+    ``make_report`` may also return a dict of sport -> report (see
+    ``ExposureReport.by_sport``); with several sports each one is written to
+    its own sub-directory of ``out_dir``.
+    """
+    profiler = profiler or Profiler(enabled=False)
+    try:
+        with profiler.span('ingest', source=label):
+            reports = make_report()
+        if not isinstance(reports, dict):
+            reports = {None: reports}
+        for sport, report in reports.items():
+            write_report(report, out_dir / sport if len(reports) > 1 else out_dir, fmt, profiler)
+    except (OSError, ValueError, KeyError, ImportError) as e:
+        print(f'{label}: {e}', file=sys.stderr)
+        return False
+    for sport, report in reports.items():
+        summary = report.summary()
+        report_dir = out_dir / sport if len(reports) > 1 else out_dir
+        print(
+            f"{label}: {summary['sport']} {summary['filtered_drafts']}/{summary['total_drafts']} drafts"
+            f' -> {report_dir}'
+        )
+    return True
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    filters = {
+        'players': args.players,
+        'draft_pool_title': args.draft_pool_title,
+        'position': args.position,
+        'team': args.team,
+        'draft_entry': args.draft_entry,
+        'account': args.account,
+    }
+    if args.stream and (args.combine or args.store or args.field_adp or any(filters.values())):
+        parser.error('--stream cannot be combined with --combine, --store, --field-adp or filters')
+    if args.account and not (args.combine or args.store):
+        # Only portfolio frames have an Account column
+        parser.error('--account needs --combine or --store')
+    if args.field_adp:
+        # Passed to every report along with the filters
+        try:
+            filters['field_adp'] = read_field_adp(args.field_adp)
+        except (OSError, ValueError) as e:
+            parser.error(f'--field-adp: {e}')
+
+    profiler = Profiler(enabled=args.profile is not None, name='udexposures')
+    try:
+        return run(args, filters, profiler)
+    finally:
+        if args.profile:
+            profiler.save(args.profile)
+            print(f'{args.profile}: timing trace written')
+
+
+def export_sources(inputs):
+    """``(label, name, source)`` per export; directories and zips give one per CSV in them."""
+    for path in inputs:
+        if path.is_dir() or path.suffix.lower() == '.zip':
+            for name, data in expand_sources([path]):
+                yield f'{path}/{name}', name, data
+        else:
+            yield path, path.stem, path
+
+
+def run(args, filters, profiler):
+    """Write the reports ``args`` ask for; returns the exit status."""
+    if args.store:
+        # Append only unseen entries, then report on everything stored so far
+        def make_report():
+            store = DraftStore(args.store)
+            added = store.append(load_portfolio(args.inputs, chunksize=args.chunksize))
+            print(f'{args.store}: {added} new draft entries stored')
+            # Entry summaries were computed as each entry was stored
+            return ExposureReport.by_sport(store.load_picks(), entry_summary=store.load_entries(),
+                                           **filters)
+        return 0 if run_report('store', make_report, args.output, args.format, profiler) else 1
+
+    if args.combine:
+        def make_report():
+            portfolio = load_portfolio(args.inputs, chunksize=args.chunksize)
+            return ExposureReport.by_sport(portfolio, **filters)
+        return 0 if run_report('portfolio', make_report, args.output, args.format, profiler) else 1
+
+    # Every other mode writes one report per export
+    exports = list(export_sources(args.inputs))
+    if not exports:
+        print('No draft exports found', file=sys.stderr)
+        return 1
+
+    if args.stream:
+        chunksize = args.chunksize or CHUNKSIZE
+        failed = 0
+        for label, name, source in exports:
+            out_dir = args.output / name if len(exports) > 1 else args.output
+            if not run_report(label, lambda: StreamingExposures.by_sport(source, chunksize),
+                              out_dir, args.format, profiler):
+                failed += 1
+        return 1 if failed else 0
+
+    failed = 0
+    for label, name, source in exports:
+        # One sub-directory per export when reporting on several accounts
+        out_dir = args.output / name if len(exports) > 1 else args.output
+        def make_report():
+            return ExposureReport.by_sport(load_drafts(source, chunksize=args.chunksize), **filters)
+        if not run_report(label, make_report, out_dir, args.format, profiler):
+            failed += 1
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Player x player co-exposure built from a sparse entry x player matrix.
+
+The incidence matrix has one row per draft entry and one column per player.
+A single sparse product gives how many drafts every pair of players shares;
+lift and conditional exposure are then derived from the non-zero pairs only.
+"""
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from .encoding import DraftEncoding
+
+
+def incidence_matrix(df, encoding=None):
+    """Entry x player 0/1 matrix plus the entry and player labels of its axes."""
+    encoding = encoding or DraftEncoding(df)
+    rows, columns = encoding.entry_codes, encoding.player_codes
+    matrix = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, columns)),
+        shape=(encoding.n_entries, encoding.n_players),
+    )
+    # A player listed twice in one entry still counts as one draft
+    matrix.data[:] = 1
+    return matrix, encoding.entries, encoding.players
+
+
+class CoExposure:
+    """Pairwise co-occurrence counts and lift for every drafted player.
+
+    ``co_drafts`` is the sparse (players x players) count of shared drafts;
+    its diagonal is each player's own draft count. Pass the upload's
+    ``encoding`` to reuse its codes.
+    """
+
+    def __init__(self, df, encoding=None):
+        matrix, self.entries, self.players = incidence_matrix(df, encoding)
+        self.n_entries = matrix.shape[0]
+        self.co_drafts = (matrix.T @ matrix).tocsr()
+        self.player_drafts = self.co_drafts.diagonal()
+
+    def pairs(self, min_drafts=1):
+        """Every pair of players drafted together, one row per unordered pair."""
+        co = sparse.triu(self.co_drafts, k=1).tocoo()
+        keep = co.data >= min_drafts
+        a, b, together = co.row[keep], co.col[keep], co.data[keep]
+
+        drafts_a = self.player_drafts[a]
+        drafts_b = self.player_drafts[b]
+        expected = drafts_a * drafts_b / self.n_entries
+        return pd.DataFrame({
+            'Player A': self.players[a],
+            'Player B': self.players[b],
+            'Drafts Together': together,
+            'Expected Together': expected.round(1),
+            'Lift': (together / expected).round(2),
+            'B given A %': (together / drafts_a * 100).round(1),
+            'A given B %': (together / drafts_b * 100).round(1),
+        })
+
+    def top_pairs(self, n=25, min_drafts=3):
+        """Most over-correlated pairs, by lift over independent drafting."""
+        return (
+            self.pairs(min_drafts=min_drafts)
+            .sort_values(['Lift', 'Drafts Together'], ascending=False)
+            .head(n)
+            .reset_index(drop=True)
+        )
+
+    def lift_matrix(self, players=None, top_n=25):
+        """Dense lift matrix for a handful of players (default: most drafted).
+
+        Only the requested sub-block is densified; the diagonal is left empty.
+        """
+        if players is None:
+            codes = np.argsort(-self.player_drafts, kind='stable')[:top_n]
+        else:
+            codes = self.players.get_indexer(players)
+            codes = codes[codes >= 0]
+        block = self.co_drafts[codes][:, codes].toarray().astype(float)
+        drafts = self.player_drafts[codes].astype(float)
+        lift = block * self.n_entries / np.outer(drafts, drafts)
+        np.fill_diagonal(lift, np.nan)
+        names = self.players[codes]
+        return pd.DataFrame(lift, index=names, columns=names)
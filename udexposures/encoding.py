@@ -0,0 +1,41 @@
+"""Integer codes for the draft entries and players of one pick-level frame.
+
+The player index, co-exposure matrix, pick distributions and exposure
+timeline all work on entry x player arrays. ``DraftEncoding`` factorizes the
+two string columns once per upload, so every one of them starts from the
+same codes (and the same sorted labels) instead of re-factorizing.
+"""
+import numpy as np
+import pandas as pd
+
+
+class DraftEncoding:
+    """Entry and player codes aligned with the rows of one frame.
+
+    ``entry_codes`` and ``player_codes`` hold one code per row (-1 where the
+    value is missing); ``entries`` and ``players`` are the sorted labels the
+    codes index into.
+    """
+
+    def __init__(self, df):
+        self.entry_codes, entries = pd.factorize(df['Draft Entry'], sort=True)
+        self.player_codes, players = pd.factorize(df['Player'], sort=True)
+        self.entries = pd.Index(np.asarray(entries, dtype=object), name='Draft Entry')
+        self.players = pd.Index(np.asarray(players, dtype=object), name='Player')
+
+        # Position and team as listed on each player's first pick
+        codes, first_rows = np.unique(self.player_codes, return_index=True)
+        first_rows = first_rows[codes >= 0]
+        self.player_info = pd.DataFrame({
+            'Player': self.players,
+            'Position': np.asarray(df['Position'])[first_rows],
+            'Team': np.asarray(df['Team'])[first_rows],
+        })
+
+    @property
+    def n_entries(self):
+        return len(self.entries)
+
+    @property
+    def n_players(self):
+        return len(self.players)
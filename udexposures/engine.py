@@ -0,0 +1,346 @@
+"""Headless exposure analytics.
+
+Everything the dashboard shows can be computed here without Streamlit:
+sport detection, player/column filters, exposure aggregation, draft
+position and pick distribution metrics and build/stack distributions. ``ExposureReport`` bundles
+them for one set of filters; the individual functions are what the app
+calls as its filters cascade.
+"""
+from functools import cached_property
+
+import pandas as pd
+
+from .adp import PickDistribution
+from .encoding import DraftEncoding
+from .entries import (
+    build_distribution, entry_rows, sport_entry_rows, stack_distribution, summarize_entries,
+    summarize_sports,
+)
+from .ingest import load_drafts
+from .player_index import PlayerIndex
+from .portfolio import load_portfolio
+from .sports import detect_sport, split_sports
+
+# Filter value meaning "no filter", as shown in the dashboard selectboxes
+ALL = 'All'
+
+# ExposureReport filters, in the order the dashboard applies them
+FILTERS = ('players', 'account', 'draft_pool_title', 'position', 'team', 'draft_entry')
+
+# Filters each report panel depends on; a cached panel result only needs to be
+# recomputed when one of these changes. The team and position shares leave out
+# their own filter (see ``ExposureReport.team_distribution``)
+PANEL_DEPENDENCIES = {
+    'summary': FILTERS,
+    'exposures': FILTERS,
+    'team_distribution': tuple(name for name in FILTERS if name != 'team'),
+    'position_distribution': tuple(name for name in FILTERS if name != 'position'),
+    'build_distribution': FILTERS,
+    'stack_distribution': FILTERS,
+    'co_drafted': ('players',),
+    'filtered_pick_distribution': FILTERS,
+}
+
+
+def select_players(df, players, index=None):
+    """Rows of drafts that contain every one of ``players``."""
+    if not players:
+        return df
+    if index is None:
+        index = PlayerIndex(df)
+    return df[index.row_mask(players)]
+
+
+def column_mask(df, column, value):
+    """Boolean row mask for ``column == value``; ``None`` when ``value`` means no filter."""
+    if value is None or value == ALL:
+        return None
+    return (df[column] == value).to_numpy()
+
+
+def filter_mask(df, draft_pool_title=None, position=None, team=None, draft_entry=None,
+                account=None):
+    """Row mask of the dashboard filter bar combined, or ``None`` if none is set."""
+    mask = None
+    for column, value in (('Account', account), ('Draft Pool Title', draft_pool_title),
+                          ('Position', position), ('Team', team), ('Draft Entry', draft_entry)):
+        column_filter = column_mask(df, column, value)
+        if column_filter is not None:
+            mask = column_filter if mask is None else mask & column_filter
+    return mask
+
+
+def draft_positions(entries):
+    """First (lowest) pick number of each draft entry in an entry summary."""
+    return entries['First Pick'].rename('Draft Position').reset_index()
+
+
+def exposure_table(df, total_drafts, single_draft=False):
+    """Per-player draft counts, entry fees and exposure percentage."""
+    if single_draft:
+        return (
+            df
+            .assign(
+                **{
+                    'Total Drafts': 1,
+                    'Total Entry Fees': lambda x: x['Draft Pool Entry Fee'],
+                    'Exposure %': 100.0
+                }
+            )
+            [['Player', 'Position', 'Team', 'Total Drafts', 'Total Entry Fees', 'Exposure %']]
+        )
+
+    exposures = (
+        df.groupby(['Player', 'Position', 'Team'], observed=True)
+        .agg({
+            'Draft Entry': 'count',
+            'Draft Pool Entry Fee': 'sum'
+        })
+        .reset_index()
+        .rename(columns={
+            'Draft Entry': 'Total Drafts',
+            'Draft Pool Entry Fee': 'Total Entry Fees'
+        })
+    )
+
+    # Calculate exposure percentages
+    exposures['Exposure %'] = (exposures['Total Drafts'] / total_drafts * 100).round(1)
+    return exposures.sort_values('Exposure %', ascending=False)
+
+
+def share_of_picks(df, column):
+    """Percentage of picks per value of ``column``, ascending for bar charts."""
+    counts = df[column].value_counts()
+    counts = counts[counts > 0]
+    return (counts / len(df) * 100).round(1).sort_values(ascending=True)
+
+
+class ExposureReport:
+    """Every dashboard metric for one draft export and one set of filters.
+
+    Filters mirror the dashboard: ``players`` keeps drafts that contain all
+    of them, the other filters restrict picks; ``None`` means no filter.
+    ``account`` needs a portfolio frame (see ``udexposures.portfolio``).
+    Entry-level results (first pick, builds, stacks) are rows of the entry
+    summary for the drafts left by the filters; pass ``entry_summary`` to
+    reuse one already computed for ``df``. Pick columns of the exposures
+    table come from the picks left by the filters, re-binned from a
+    ``PickDistribution`` of all of ``df`` (pass ``pick_distribution`` to
+    reuse one), with reach columns against
+    ``field_adp`` (player -> ADP) when given. Filtering and every result are
+    computed lazily on first use and memoized on the instance, so a report
+    can be built up front and only the panels actually shown pay for it.
+    """
+
+    def __init__(self, df, players=None, draft_pool_title=None, position=None,
+                 team=None, draft_entry=None, account=None, sport=None, player_index=None,
+                 entry_summary=None, pick_distribution=None, field_adp=None):
+        self.df = df
+        self.sport = sport or detect_sport(df)
+        self.players = list(players or [])
+        self.draft_entry = draft_entry
+        self.filters = {
+            'players': tuple(sorted(self.players)),
+            'account': account,
+            'draft_pool_title': draft_pool_title,
+            'position': position,
+            'team': team,
+            'draft_entry': draft_entry,
+        }
+        self._player_index = player_index
+        self._entry_summary = entry_summary
+        self._pick_distribution = pick_distribution
+        self.field_adp = field_adp
+
+    @classmethod
+    def by_sport(cls, df, players=None, entry_summary=None, **filters):
+        """One report per sport in ``df``, keyed by sport name.
+
+        Mixed-sport exports are split by draft pool, and the sports' entry
+        summaries are computed in parallel, or taken from ``entry_summary``
+        (every entry of ``df``, any sport) when given. With ``players``,
+        sports that do not have every one of them are left out (no draft of
+        theirs can match); ``KeyError`` if that leaves none.
+        """
+        frames = split_sports(df)
+        indexes = {}
+        if players:
+            indexes = {sport: PlayerIndex(frame) for sport, frame in frames.items()}
+            frames = {sport: frame for sport, frame in frames.items() if not indexes[sport].unknown(players)}
+            if not frames:
+                missing = [player for player in players
+                           if all(index.unknown([player]) for index in indexes.values())]
+                if missing:
+                    raise KeyError(f"Unknown player(s): {', '.join(missing)}")
+                raise KeyError(f"No sport has drafts with all of: {', '.join(players)}")
+        if entry_summary is None:
+            summaries = summarize_sports(frames)
+        else:
+            summaries = {sport: sport_entry_rows(entry_summary, frame, sport) for sport, frame in frames.items()}
+        return {
+            sport: cls(frame, players=players, sport=sport, entry_summary=summaries[sport],
+                       player_index=indexes.get(sport), **filters)
+            for sport, frame in frames.items()
+        }
+
+    @classmethod
+    def from_path(cls, path, chunksize=None, **filters):
+        return cls(load_drafts(path, chunksize=chunksize), **filters)
+
+    @classmethod
+    def from_portfolio(cls, sources, chunksize=None, **filters):
+        """Report over several exports (files, directories or zips) combined."""
+        return cls(load_portfolio(sources, chunksize=chunksize), **filters)
+
+    @cached_property
+    def encoding(self):
+        # Shared by the player index and the pick distribution built from ``df``
+        if self._player_index is not None:
+            return self._player_index.encoding
+        return DraftEncoding(self.df)
+
+    @cached_property
+    def player_index(self):
+        if self._player_index is None:
+            return PlayerIndex(self.df, self.encoding)
+        return self._player_index
+
+    @cached_property
+    def pick_distribution(self):
+        if self._pick_distribution is None:
+            return PickDistribution(self.df, self.encoding)
+        return self._pick_distribution
+
+    def _mask(self, skip=None):
+        """Rows of ``df`` left by every filter but ``skip``, or ``None`` when nothing is filtered."""
+        filters = {name: self.filters[name] for name in FILTERS if name not in ('players', skip)}
+        mask = filter_mask(self.df, **filters)
+        if self.players:
+            players = self.player_index.row_mask(self.players)
+            mask = players if mask is None else players & mask
+        return mask
+
+    @cached_property
+    def row_mask(self):
+        """Rows of ``df`` left by all filters, or ``None`` when nothing is filtered."""
+        return self._mask()
+
+    def _rows_without(self, name):
+        # Picks left by every filter except ``name``
+        if self.filters[name] in (None, ALL):
+            return self.filtered_df
+        mask = self._mask(skip=name)
+        return self.df if mask is None else self.df[mask]
+
+    @cached_property
+    def filtered_df(self):
+        # One row take for every filter combined; unfiltered reports share ``df``
+        if self.row_mask is None:
+            return self.df
+        return self.df[self.row_mask]
+
+    @cached_property
+    def total_drafts(self):
+        return len(self.entry_summary)
+
+    @cached_property
+    def entry_summary(self):
+        if self._entry_summary is None:
+            return summarize_entries(self.df, self.sport)
+        return self._entry_summary
+
+    @cached_property
+    def filtered_entries(self):
+        return entry_rows(self.entry_summary, self.filtered_df)
+
+    @cached_property
+    def filtered_drafts(self):
+        return len(self.filtered_entries)
+
+    @cached_property
+    def draft_positions(self):
+        return draft_positions(self.filtered_entries)
+
+    @cached_property
+    def filtered_pick_distribution(self):
+        if self.row_mask is None:
+            return self.pick_distribution
+        return self.pick_distribution.subset(self.row_mask)
+
+    @cached_property
+    def exposures(self):
+        single_draft = self.draft_entry not in (None, ALL)
+        exposures = exposure_table(self.filtered_df, self.filtered_drafts, single_draft)
+        return self.filtered_pick_distribution.annotate(exposures, self.field_adp)
+
+    @cached_property
+    def team_distribution(self):
+        """Share of picks per team among the picks every other filter leaves.
+
+        The team filter itself is left out, so the chart keeps showing how the
+        selected team compares with the others.
+        """
+        return share_of_picks(self._rows_without('team'), 'Team')
+
+    @cached_property
+    def position_distribution(self):
+        """Share of picks per position, leaving out the position filter like ``team_distribution``."""
+        return share_of_picks(self._rows_without('position'), 'Position')
+
+    @cached_property
+    def build_distribution(self):
+        if self.sport != 'NFL':
+            return pd.Series(dtype='int64')
+        return build_distribution(self.filtered_entries)
+
+    @cached_property
+    def stack_distribution(self):
+        return stack_distribution(self.filtered_entries)
+
+    def summary(self):
+        """Headline metrics shown above the dashboard panels."""
+        total = self.total_drafts
+        filtered = self.filtered_drafts
+        avg_position = self.draft_positions['Draft Position'].mean()
+        return {
+            'sport': self.sport,
+            'total_drafts': int(total),
+            'filtered_drafts': int(filtered),
+            'filtered_pct': round(filtered / total * 100, 1) if total else 0.0,
+            'avg_draft_position': None if pd.isna(avg_position) else round(float(avg_position), 1),
+        }
+
+    @cached_property
+    def co_drafted(self):
+        """Top players drafted alongside the selected players (empty without any)."""
+        if not self.players:
+            return pd.DataFrame()
+        return self.player_index.co_drafted(self.players, limit=25)
+
+    def panel(self, name):
+        """Result of one dashboard panel (see ``PANEL_DEPENDENCIES``) as a plain value.
+
+        Panel results hold no pick-level frames, so they are cheap to keep in
+        a result cache.
+        """
+        if name == 'summary':
+            return self.summary()
+        return getattr(self, name)
+
+    def panel_key(self, name):
+        """Panel name plus the values of just the filters it depends on."""
+        return (name,) + tuple(self.filters[dep] for dep in PANEL_DEPENDENCIES[name])
+
+    def tables(self):
+        """All report tables as DataFrames, keyed by output name."""
+        def distribution(series, label, value):
+            return series.rename_axis(label).rename(value).reset_index()
+
+        return {
+            'exposures': self.exposures,
+            'draft_positions': self.draft_positions,
+            'teams': distribution(self.team_distribution, 'Team', 'Percentage'),
+            'positions': distribution(self.position_distribution, 'Position', 'Percentage'),
+            'builds': distribution(self.build_distribution, 'Build Type', 'Drafts'),
+            'stacks': distribution(self.stack_distribution, 'Stack Type', 'Percentage'),
+        }
@@ -0,0 +1,107 @@
+"""Entry-level summary: one row per draft entry instead of one per pick.
+
+The summary is computed once per upload and every entry-level panel reads
+from it (draft counts, first pick, builds, stacks), so changing a filter
+only selects rows here instead of re-grouping the pick-level frame.
+Per-entry facts only depend on that entry's own picks, so summaries of
+disjoint sets of entries can also be computed separately and concatenated.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .sports import get_sport
+from .stacks import primary_stack_team
+
+ENTRY_COLUMNS = ['Draft Pool', 'Draft Pool Title', 'Draft Pool Entry Fee', 'Account']
+
+
+def position_counts(df, positions):
+    """Entries x positions matrix of pick counts."""
+    return (
+        df.groupby(['Draft Entry', 'Position'], observed=True)
+        .size()
+        .unstack(fill_value=0)
+        .reindex(columns=positions, fill_value=0)
+    )
+
+
+def summarize_entries(df, sport):
+    """Summary table indexed by ``Draft Entry`` for a pick-level frame.
+
+    Columns: pool, title, fee (and account), first pick, number of picks,
+    one count column per position, build type (sports with a build
+    classifier), stack label and primary stacked team.
+    """
+    columns = [col for col in ENTRY_COLUMNS if col in df.columns]
+    grouped = df.groupby('Draft Entry', observed=True)
+    summary = grouped[columns].first()
+    summary['First Pick'] = grouped['Pick Number'].min()
+    summary['Picks'] = grouped.size()
+
+    rules = get_sport(sport)
+    positions = rules.positions
+    summary = summary.join(position_counts(df, positions))
+    summary[positions] = summary[positions].fillna(0).astype('int8')
+
+    if rules.build_classifier is not None:
+        summary['Build'] = rules.build_classifier(summary[positions])
+    summary['Stack'] = rules.stack_classifier(df)
+    summary['Primary Team'] = primary_stack_team(df)
+    return summary
+
+
+def summarize_sports(frames, max_workers=None):
+    """Entry summaries for a dict of sport -> frame (see ``split_sports``).
+
+    Sports are summarized in parallel threads; the grouped and array work
+    releases the GIL for most of its time.
+    """
+    if len(frames) == 1:
+        return {sport: summarize_entries(frame, sport) for sport, frame in frames.items()}
+    with ThreadPoolExecutor(max_workers=max_workers or len(frames)) as pool:
+        futures = {sport: pool.submit(summarize_entries, frame, sport) for sport, frame in frames.items()}
+        return {sport: future.result() for sport, future in futures.items()}
+
+
+def entry_rows(summary, df):
+    """Rows of ``summary`` for the draft entries present in pick-level ``df``."""
+    positions = summary.index.get_indexer(pd.unique(df['Draft Entry']))
+    return summary.iloc[np.sort(positions[positions >= 0])]
+
+
+def sport_entry_rows(summary, df, sport):
+    """Rows of a summary of several sports for the entries of ``df``, one sport's columns.
+
+    Summaries of different sports stored together (see ``store.DraftStore``)
+    share one table; this gives back what ``summarize_entries(df, sport)``
+    would compute, in the same row and column order, without recomputing it.
+    """
+    rules = get_sport(sport)
+    columns = [col for col in ENTRY_COLUMNS if col in summary.columns]
+    columns += ['First Pick', 'Picks'] + list(rules.positions)
+    if rules.build_classifier is not None:
+        columns.append('Build')
+    columns += ['Stack', 'Primary Team']
+    # Entries in the order grouping by Draft Entry gives
+    entries = pd.Series(pd.unique(df['Draft Entry'])).sort_values()
+    positions = summary.index.get_indexer(entries)
+    return summary.iloc[positions[positions >= 0]][columns]
+
+
+def build_distribution(entries):
+    """Number of NFL drafts per build type (2 RB / 3 WR / 2 TE)."""
+    distribution_summary = {
+        "2 RB": (entries['RB'] == 2).sum(),
+        "3 WR": (entries['WR'] >= 3).sum(),
+        "2 TE": (entries['TE'] == 2).sum()
+    }
+    dist_series = pd.Series(distribution_summary)
+    return dist_series[dist_series > 0].sort_values(ascending=True)
+
+
+def stack_distribution(entries):
+    """Percentage of drafts per stack label, ascending for bar charts."""
+    stack_counts = entries['Stack'].value_counts()
+    return (stack_counts / len(entries) * 100).round(1).sort_values(ascending=True)
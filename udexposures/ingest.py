@@ -0,0 +1,157 @@
+"""Ingest stage for Underdog draft exports.
+
+Parses an export once into a compactly typed DataFrame: repeated strings
+become categoricals, ``Pick Number`` is a small integer and ``Picked At`` is a
+parsed datetime. The result also carries the combined ``Player`` column and
+is already restricted to valid draft pools.
+
+Large exports can be read in chunks (``chunksize``): each chunk is
+projected to the required columns and typed before the next one is read,
+so the raw text of the whole file is never held at once.
+"""
+import hashlib
+import io
+
+import pandas as pd
+
+# Columns documented in the README as the required export format
+REQUIRED_COLUMNS = [
+    'First Name',
+    'Last Name',
+    'Position',
+    'Team',
+    'Draft Pool',
+    'Draft Pool Title',
+    'Draft Pool Entry Fee',
+    'Draft Entry',
+    'Pick Number',
+    'Picked At',
+]
+
+# Every draft entry holds this many picks
+ROSTER_SIZE = 6
+
+# Rows per chunk when streaming an export
+CHUNKSIZE = 100_000
+
+# Explicit parse dtypes so pandas never falls back to object columns
+CSV_DTYPES = {
+    'First Name': 'category',
+    'Last Name': 'category',
+    'Position': 'category',
+    'Team': 'category',
+    'Draft Pool': 'category',
+    'Draft Pool Title': 'category',
+    'Draft Pool Entry Fee': 'float64',
+    'Draft Entry': 'category',
+    'Pick Number': 'int16',
+    'Picked At': 'string',
+}
+
+
+def upload_digest(data):
+    """Return a stable content hash for the raw bytes of an upload."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def read_draft_csv(source):
+    """Parse a draft export (path, buffer or bytes) with explicit dtypes."""
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    df = pd.read_csv(source, usecols=REQUIRED_COLUMNS, dtype=CSV_DTYPES)
+    return df[REQUIRED_COLUMNS]
+
+
+def read_draft_chunks(source, chunksize=CHUNKSIZE, columns=REQUIRED_COLUMNS):
+    """Yield typed chunks of an export restricted to ``columns``.
+
+    Chunks are not filtered: a draft pool's validity is only known once all
+    of its picks have been read.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    dtypes = {col: CSV_DTYPES[col] for col in columns}
+    with pd.read_csv(source, usecols=columns, dtype=dtypes, chunksize=chunksize) as reader:
+        for chunk in reader:
+            yield chunk[list(columns)]
+
+
+def parse_picked_at(values):
+    """Parse ``Picked At`` strings into UTC datetimes."""
+    # Exports write timestamps like '2024-09-08 17:03:21 UTC'; dropping the
+    # suffix lets pandas use its fast ISO 8601 parser instead of inferring
+    # the format element by element
+    trimmed = values.str.replace(r'\s*UTC$', '', regex=True)
+    parsed = pd.to_datetime(trimmed, format='ISO8601', errors='coerce', utc=True)
+    if parsed.isna().all() and values.notna().any():
+        parsed = pd.to_datetime(values, errors='coerce', utc=True)
+    return parsed
+
+
+def filter_valid_drafts(df):
+    """Drop draft pools whose pick count is not a multiple of the roster size."""
+    draft_counts = df.groupby('Draft Pool', observed=True).size()
+    valid_drafts = draft_counts[draft_counts % ROSTER_SIZE == 0].index
+    df = df[df['Draft Pool'].isin(valid_drafts)]
+    # Drop categories that only appeared in discarded pools
+    return df.apply(
+        lambda col: col.cat.remove_unused_categories()
+        if isinstance(col.dtype, pd.CategoricalDtype) else col
+    )
+
+
+def add_derived_columns(df):
+    """Add ``Player`` and parse ``Picked At`` in place; returns ``df``."""
+    # Combine First Name and Last Name into a single categorical Player column
+    player = (
+        df['First Name'].astype('string').fillna('') + ' '
+        + df['Last Name'].astype('string').fillna('')
+    )
+    df['Player'] = player.str.strip().astype('category')
+
+    df['Picked At'] = parse_picked_at(df['Picked At'])
+    return df
+
+
+def normalize_drafts(df):
+    """Add the derived columns the dashboard relies on and drop invalid pools."""
+    df = add_derived_columns(df.copy())
+    return filter_valid_drafts(df).reset_index(drop=True)
+
+
+def load_drafts(source, chunksize=None):
+    """Read and normalize a draft export in one step.
+
+    With ``chunksize`` the export is parsed chunk by chunk and the compact
+    chunks are combined before the valid-pool filter, which gives the same
+    frame with a lower peak memory on very large files.
+    """
+    if chunksize is None:
+        return normalize_drafts(read_draft_csv(source))
+    chunks = [add_derived_columns(chunk) for chunk in read_draft_chunks(source, chunksize)]
+    return filter_valid_drafts(concat_drafts(chunks)).reset_index(drop=True)
+
+
+def concat_drafts(frames):
+    """Concatenate normalized frames without losing their categorical dtypes.
+
+    Each categorical column is widened to the union of categories across the
+    frames first, since pandas falls back to object when they differ.
+    """
+    frames = [frame for frame in frames if frame is not None]
+    if not frames:
+        raise ValueError('No draft data to combine')
+    if len(frames) == 1:
+        return frames[0]
+
+    aligned = [frame.copy(deep=False) for frame in frames]
+    for col, dtype in frames[0].dtypes.items():
+        if not isinstance(dtype, pd.CategoricalDtype):
+            continue
+        categories = frames[0][col].cat.categories
+        for frame in frames[1:]:
+            categories = categories.union(frame[col].cat.categories)
+        for frame in aligned:
+            frame[col] = frame[col].cat.set_categories(categories)
+    return pd.concat(aligned, ignore_index=True)
+
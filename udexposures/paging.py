@@ -0,0 +1,64 @@
+"""Server-side sorting, text filtering and paging of result tables.
+
+``TablePager`` wraps one computed table (the exposures table in the
+dashboard) and keeps a row order per sort column, computed the first time
+that column is sorted on. Serving a page is then a substring match over
+pre-lowered labels, a boolean take of that order and one ``iloc`` of just
+the visible rows, so only the page itself is sent to the browser and the
+cost of a page does not grow with the sort or the size of the table.
+"""
+import numpy as np
+import pandas as pd
+
+
+class TablePager:
+    """Sorted, filterable, paged views of one read-only table.
+
+    ``search_column`` is the column the text filter matches against
+    (case-insensitive substring).
+    """
+
+    def __init__(self, table, search_column='Player'):
+        self.table = table.reset_index(drop=True)
+        self._labels = self.table[search_column].astype('string').str.lower()
+        self._orders = {}
+
+    def __len__(self):
+        return len(self.table)
+
+    @property
+    def nbytes(self):
+        usage = self.table.memory_usage(deep=True).sum() + self._labels.memory_usage(deep=True)
+        return int(usage) + sum(order.nbytes for order in self._orders.values())
+
+    def order(self, column=None, ascending=True):
+        """Row positions sorted by ``column`` (stable, missing values last)."""
+        if column is None:
+            return np.arange(len(self.table))
+        key = (column, ascending)
+        if key not in self._orders:
+            # Rank by factorized codes so numbers, strings and categories sort alike
+            codes, _ = pd.factorize(self.table[column], sort=True)
+            codes = codes.astype(np.int64)
+            rank = np.where(codes < 0, len(self.table), codes if ascending else -codes)
+            self._orders[key] = np.argsort(rank, kind='stable')
+        return self._orders[key]
+
+    def view(self, sort_by=None, ascending=True, text=''):
+        """Row positions of the rows matching ``text``, in display order."""
+        order = self.order(sort_by, ascending)
+        text = text.strip().lower()
+        if not text:
+            return order
+        matches = self._labels.str.contains(text, regex=False).fillna(False).to_numpy(dtype=bool)
+        return order[matches[order]]
+
+    def page(self, view, page=1, page_size=50):
+        """Rows of 1-based page ``page`` of a ``view``."""
+        start = (page - 1) * page_size
+        return self.table.iloc[view[start:start + page_size]]
+
+
+def page_count(n_rows, page_size):
+    """Number of pages needed for ``n_rows`` rows (at least one)."""
+    return max(-(-n_rows // page_size), 1)
@@ -0,0 +1,98 @@
+"""Inverted player -> draft entry index.
+
+Built once per upload, the index stores one packed bitset of draft entries
+per player. "Drafts containing all of X, Y, Z" is then a bitwise AND of a
+few rows, and conditional exposure for every other player is a single
+bincount over the picks in the matching drafts.
+"""
+import numpy as np
+import pandas as pd
+
+from .encoding import DraftEncoding
+
+
+class PlayerIndex:
+    """Player -> draft entry bitsets for one pick-level frame.
+
+    ``row_entry`` and ``row_player`` are aligned with the rows of the frame
+    the index was built from, so entry masks can be mapped back to row masks
+    without another pass over the strings. Pass the upload's ``encoding``
+    to reuse its codes.
+    """
+
+    def __init__(self, df, encoding=None):
+        self.encoding = encoding or DraftEncoding(df)
+        self.row_entry, self.entries = self.encoding.entry_codes, self.encoding.entries
+        self.row_player, self.players = self.encoding.player_codes, self.encoding.players
+        self.player_info = self.encoding.player_info
+        self._player_codes = pd.Series(np.arange(len(self.players)), index=self.players)
+
+        # Set bits straight into packed rows (np.packbits bit order) so the
+        # dense players x entries matrix is never materialized
+        n_bytes = (len(self.entries) + 7) // 8
+        self.bitmaps = np.zeros((len(self.players), n_bytes), dtype=np.uint8)
+        np.bitwise_or.at(
+            self.bitmaps.reshape(-1),
+            self.row_player.astype(np.int64) * n_bytes + self.row_entry // 8,
+            (0x80 >> (self.row_entry % 8)).astype(np.uint8),
+        )
+        self.player_drafts = np.bincount(self.row_player, minlength=len(self.players))
+
+    @property
+    def n_entries(self):
+        return len(self.entries)
+
+    def unknown(self, players):
+        """Names among ``players`` that are not in the index."""
+        return [player.strip() for player in players if player.strip() not in self._player_codes.index]
+
+    def player_codes(self, players):
+        """Codes for the given player names; unknown names raise KeyError."""
+        names = [player.strip() for player in players]
+        missing = self.unknown(names)
+        if missing:
+            raise KeyError(f"Unknown player(s): {', '.join(missing)}")
+        return self._player_codes.loc[names].to_numpy()
+
+    def entry_mask(self, players):
+        """Boolean mask over entries that contain every given player."""
+        codes = self.player_codes(players)
+        if len(codes) == 0:
+            return np.ones(self.n_entries, dtype=bool)
+        packed = np.bitwise_and.reduce(self.bitmaps[codes], axis=0)
+        return np.unpackbits(packed, count=self.n_entries).astype(bool)
+
+    def row_mask(self, players):
+        """Boolean mask over the indexed rows whose entry contains every player."""
+        return self.entry_mask(players)[self.row_entry]
+
+    def entry_ids(self, players):
+        """Draft Entry ids that contain every given player."""
+        return self.entries[self.entry_mask(players)]
+
+    def co_drafted(self, players, limit=None):
+        """Conditional exposure of every other player within drafts of ``players``.
+
+        Returns one row per player who appears alongside the selection, sorted
+        by how often, with their exposure inside the selected drafts next to
+        their overall exposure.
+        """
+        entry_mask = self.entry_mask(players)
+        n_selected = int(entry_mask.sum())
+        together = np.bincount(
+            self.row_player[entry_mask[self.row_entry]],
+            minlength=len(self.players),
+        )
+        together[self.player_codes(players)] = 0
+
+        result = self.player_info.assign(**{
+            'Drafts Together': together,
+            'Conditional Exposure %': (together / max(n_selected, 1) * 100).round(1),
+            'Overall Exposure %': (self.player_drafts / self.n_entries * 100).round(1),
+        })
+        result = result[together > 0].sort_values(
+            ['Drafts Together', 'Player'], ascending=[False, True]
+        )
+        if limit is not None:
+            result = result.head(limit)
+        return result.reset_index(drop=True)
@@ -0,0 +1,87 @@
+"""Portfolio mode: several exports (accounts) combined into one frame.
+
+Exports can be given as files, directories of CSVs or zip archives. Each is
+parsed by ``load_drafts`` in a worker process, tagged with an ``Account``
+and combined. Picks that appear in more than one export (overlapping
+downloads) are kept once.
+"""
+import io
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from .ingest import concat_drafts, load_drafts, upload_digest
+
+ACCOUNT_COLUMN = 'Account'
+
+# A pick is identified by its draft entry and pick number
+PICK_KEY = ['Draft Entry', 'Pick Number']
+
+
+def _zip_members(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        for name in sorted(archive.namelist()):
+            if name.lower().endswith('.csv') and not name.startswith('__MACOSX/'):
+                yield Path(name).stem, archive.read(name)
+
+
+def expand_sources(sources):
+    """Flatten paths, directories, zips and (name, bytes) uploads to (account, bytes).
+
+    The account name is the file stem of each CSV.
+    """
+    expanded = []
+    for source in sources:
+        if isinstance(source, tuple):
+            name, data = source
+        else:
+            path = Path(source)
+            if path.is_dir():
+                expanded.extend(expand_sources(sorted(path.glob('*.csv')) + sorted(path.glob('*.zip'))))
+                continue
+            name, data = path.name, path.read_bytes()
+
+        if name.lower().endswith('.zip'):
+            expanded.extend(_zip_members(data))
+        else:
+            expanded.append((Path(name).stem, data))
+    return expanded
+
+
+def portfolio_digest(uploads):
+    """Content hash for a set of (name, bytes) uploads, independent of order."""
+    parts = sorted(f'{name}:{upload_digest(data)}' for name, data in uploads)
+    return upload_digest('|'.join(parts).encode())
+
+
+def _load_account(account, data, chunksize=None):
+    df = load_drafts(data, chunksize=chunksize)
+    df[ACCOUNT_COLUMN] = pd.Categorical([account] * len(df))
+    return df
+
+
+def load_portfolio(sources, max_workers=None, chunksize=None):
+    """Parse every export in parallel and combine them into one portfolio frame.
+
+    ``chunksize`` streams each export in chunks (see ``ingest.load_drafts``).
+    """
+    accounts = expand_sources(sources)
+    if not accounts:
+        raise ValueError('No draft exports found')
+
+    if len(accounts) == 1:
+        frames = [_load_account(*accounts[0], chunksize=chunksize)]
+    else:
+        workers = min(len(accounts), max_workers or os.cpu_count() or 1)
+        names = [account for account, _ in accounts]
+        payloads = [data for _, data in accounts]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            frames = list(pool.map(_load_account, names, payloads, [chunksize] * len(names)))
+
+    portfolio = concat_drafts(frames)
+    # Overlapping exports repeat picks; keep the first export that has each one
+    portfolio = portfolio.drop_duplicates(subset=PICK_KEY, keep='first')
+    return portfolio.reset_index(drop=True)
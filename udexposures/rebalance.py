@@ -0,0 +1,164 @@
+"""Plan the next N drafts to move exposures toward target floors and caps.
+
+Targets are exposure percentages per player, team (share of picks, as in the
+Team Distribution chart) and stack type (share of drafts). For each of those
+levels the upcoming draft slots (one per draft for players and stacks,
+picks per draft for teams) are shared out in proportion to how often each
+item is drafted now, clipped to what its floor requires and its cap allows:
+
+    lower = ceil(floor * (total + added)) - current
+    upper = floor(cap * (total + added)) - current
+    next  = clip(pace * scale, lower, upper), summed to the number of slots
+
+``scale`` is found by bisection over whole arrays and the result rounded by
+largest remainder, so a level with thousands of players solves in a few
+milliseconds. Levels are planned independently: the player plan keeps each
+player within its own targets, not the teams or stacks they belong to.
+"""
+import numpy as np
+import pandas as pd
+
+# Kinds of targets, in the order the dashboard shows them
+TARGET_TYPES = ('Player', 'Team', 'Stack')
+
+# Actions from most to least urgent
+ACTIONS = ['Unreachable', 'Prioritize', 'Avoid', 'Limit', 'On Pace']
+
+
+def _allocate(lower, upper, weights, slots, iterations=64):
+    """Integers within [lower, upper] summing to ``slots`` (when bounds allow),
+    proportional to ``weights`` wherever the bounds do not bind."""
+    def fill(scale):
+        return np.clip(weights * scale, lower, upper)
+
+    low, high = 0.0, 1.0
+    while fill(high).sum() < slots and high < 1e12:
+        high *= 2
+    for _ in range(iterations):
+        mid = (low + high) / 2
+        if fill(mid).sum() < slots:
+            low = mid
+        else:
+            high = mid
+    share = fill(high)
+
+    # Round down, then hand the remaining slots to the largest remainders
+    counts = np.floor(share).astype(np.int64)
+    remainder = share - counts
+    spare = int(min(max(slots - counts.sum(), 0), np.count_nonzero(remainder > 0)))
+    if spare:
+        counts[np.argsort(-remainder, kind='stable')[:spare]] += 1
+    return counts
+
+
+def rebalance(current, total, added, slots=None, floors=None, caps=None):
+    """Plan one level of targets.
+
+    ``current`` is a Series of counts (drafts or picks) per item out of
+    ``total``. The upcoming drafts add ``added`` to that total and bring
+    ``slots`` new counts to share out (default: ``added``), at most ``added``
+    per item. ``floors`` and ``caps`` are Series of target percentages per
+    item; missing values mean no target. Returns one row per item, most
+    urgent actions first.
+    """
+    items = current.index
+    current = current.to_numpy(dtype=np.float64)
+    floors = (floors if floors is not None else pd.Series(dtype=float)).reindex(items).to_numpy(dtype=np.float64)
+    caps = (caps if caps is not None else pd.Series(dtype=float)).reindex(items).to_numpy(dtype=np.float64)
+    slots = added if slots is None else slots
+    capacity = added
+    new_total = total + added
+
+    # Counts the targets allow over the next ``added`` drafts
+    need = np.where(np.isnan(floors), 0, np.ceil(floors / 100 * new_total - 1e-9) - current)
+    allow = np.where(np.isnan(caps), capacity, np.floor(caps / 100 * new_total + 1e-9) - current)
+    upper = np.clip(allow, 0, capacity)
+    lower = np.minimum(np.clip(need, 0, capacity), upper)
+    planned = _allocate(lower, upper, current, slots)
+
+    # Compare against what the current drafting rate would give: floors push items
+    # above it, caps (or other items' floors) hold them below it. Rounding alone
+    # moves an item by less than one
+    pace = current / total * added if total else np.zeros(len(current))
+    projected = (current + planned) / max(new_total, 1) * 100
+    action = np.select(
+        [
+            (need > capacity) | (allow < 0),
+            (lower > pace) & (planned >= pace + 1),
+            (planned == 0) & (pace >= 1),
+            planned <= pace - 1,
+        ],
+        ACTIONS[:-1],
+        default=ACTIONS[-1],
+    )
+
+    plan = pd.DataFrame({
+        items.name or 'Item': items,
+        'Count': current.astype(np.int64),
+        'Exposure %': (current / max(total, 1) * 100).round(1),
+        'Floor %': floors,
+        'Cap %': caps,
+        'Next N': planned,
+        'Next N %': (planned / max(added, 1) * 100).round(1),
+        'Projected %': projected.round(1),
+        'Action': pd.Categorical(action, categories=ACTIONS, ordered=True),
+    })
+    return plan.sort_values(['Action', 'Exposure %'], ascending=[True, False], kind='stable').reset_index(drop=True)
+
+
+def _with_targets(counts, floors, caps, name):
+    """Counts with an object index, plus zero rows for targeted items not in it."""
+    counts = counts.set_axis(counts.index.astype(object))
+    counts = counts.reindex(counts.index.union(floors.index.union(caps.index), sort=False), fill_value=0)
+    return counts.rename_axis(name)
+
+
+def _targets_for(targets, kind):
+    """Floor and cap Series for one target type of a targets table."""
+    if targets is None or len(targets) == 0:
+        return pd.Series(dtype=float), pd.Series(dtype=float)
+    rows = targets[(targets['Type'] == kind) & targets['Name'].notna()].drop_duplicates('Name', keep='last')
+    rows = rows.set_index('Name')
+    return rows['Floor %'].astype(float), rows['Cap %'].astype(float)
+
+
+def plan_rebalance(report, n_drafts, targets=None, player_cap=None, exposures=None):
+    """Player, team and stack plans for the next ``n_drafts`` drafts of a report.
+
+    ``targets`` is a table with ``Type`` (one of ``TARGET_TYPES``), ``Name``,
+    ``Floor %`` and ``Cap %`` columns; ``player_cap`` caps every player
+    without an explicit cap. Current exposures are those of the report's
+    filtered drafts; pass its ``exposures`` table if it is already at hand.
+    Returns a dict of target type -> plan (see ``rebalance``).
+    """
+    exposures = report.exposures if exposures is None else exposures
+    entries = report.filtered_entries
+    total = report.filtered_drafts
+    # Picks the filters keep per draft (a full roster without a Position/Team filter)
+    picks_per_draft = len(report.filtered_df) / total if total else 0
+    new_picks = int(round(n_drafts * picks_per_draft))
+    plans = {}
+
+    # Players: in at most one slot of each upcoming draft
+    floors, caps = _targets_for(targets, 'Player')
+    drafted = exposures.groupby('Player', observed=True)['Total Drafts'].sum()
+    drafted = _with_targets(drafted, floors, caps, 'Player')
+    if player_cap is not None:
+        caps = caps.reindex(drafted.index).fillna(player_cap)
+    plan = rebalance(drafted, total, n_drafts, new_picks, floors, caps)
+    info = exposures.drop_duplicates('Player').astype({'Player': object}).set_index('Player')
+    plans['Player'] = plan.join(info[['Position', 'Team']], on='Player')[
+        ['Player', 'Position', 'Team'] + list(plan.columns[1:])
+    ]
+
+    # Teams: share of picks
+    floors, caps = _targets_for(targets, 'Team')
+    picks = report.filtered_df['Team'].value_counts()
+    picks = _with_targets(picks[picks > 0], floors, caps, 'Team')
+    plans['Team'] = rebalance(picks, int(picks.sum()), new_picks, floors=floors, caps=caps)
+
+    # Stack types: exactly one per draft
+    floors, caps = _targets_for(targets, 'Stack')
+    stacks = _with_targets(entries['Stack'].value_counts(), floors, caps, 'Stack')
+    plans['Stack'] = rebalance(stacks, total, n_drafts, floors=floors, caps=caps)
+    return plans
@@ -0,0 +1,66 @@
+"""Bookkeeping for serving many dashboard sessions from one process.
+
+Uploads, their indexes and panel results live in process-wide caches that
+every session reads from, keyed by the upload's content hash. A browser tab
+that is closed never says so, so ``SessionTracker`` records which upload each
+session last looked at and when. Uploads held only by sessions that have
+been idle for too long can then be dropped from the shared caches, while an
+upload still open in another session stays.
+
+Limits come from the environment so a deployment can size them to its host:
+
+- ``UDEXPOSURES_SESSION_MB``: cached results per upload, in MB (default 256)
+- ``UDEXPOSURES_IDLE_MINUTES``: idle time before a session's data is dropped
+  (default 30)
+"""
+import os
+import threading
+import time
+
+SESSION_MB = 256
+IDLE_MINUTES = 30
+
+
+def session_limits(environ=None):
+    """``(result bytes per session, idle seconds)`` from the environment."""
+    environ = os.environ if environ is None else environ
+    session_mb = float(environ.get('UDEXPOSURES_SESSION_MB', SESSION_MB))
+    idle_minutes = float(environ.get('UDEXPOSURES_IDLE_MINUTES', IDLE_MINUTES))
+    return int(session_mb * 1024 ** 2), idle_minutes * 60
+
+
+class SessionTracker:
+    """Last activity and current upload of every session; thread-safe."""
+
+    def __init__(self, idle_seconds=IDLE_MINUTES * 60, clock=time.monotonic):
+        self.idle_seconds = idle_seconds
+        self._clock = clock
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def touch(self, session_id, upload=None):
+        """Record that ``session_id`` just ran with ``upload`` (``None``: none)."""
+        with self._lock:
+            self._sessions[session_id] = (upload, self._clock())
+
+    def evict_idle(self):
+        """Forget idle sessions; returns the uploads no remaining session holds."""
+        now = self._clock()
+        with self._lock:
+            idle = [sid for sid, (_, seen) in self._sessions.items() if now - seen > self.idle_seconds]
+            released = {self._sessions.pop(sid)[0] for sid in idle}
+            held = {upload for upload, _ in self._sessions.values()}
+        return sorted(upload for upload in released - held if upload is not None)
+
+    def stats(self):
+        """Session counts, for display."""
+        with self._lock:
+            uploads = {upload for upload, _ in self._sessions.values() if upload is not None}
+            return {
+                'sessions': len(self._sessions),
+                'uploads': len(uploads),
+                'idle_seconds': self.idle_seconds,
+            }
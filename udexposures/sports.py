@@ -0,0 +1,189 @@
+"""Registry of sport definitions: positions, roster size and classifiers.
+
+Each sport is a ``Sport`` registered with ``register_sport``. Registration
+compiles a position -> sports bitmask table, so detecting the sport of a
+frame (or of every draft pool in it) is a lookup over the categorical
+Position codes instead of a chain of set comparisons. Supporting a new
+sport only takes another ``register_sport`` call, e.g.::
+
+    register_sport(Sport('MLB', ['P', 'IF', 'OF'], classify_mlb_stacks,
+                         logo_file='mlb_logos.csv'))
+"""
+import numpy as np
+import pandas as pd
+
+from .ingest import ROSTER_SIZE
+from .stacks import classify_nba_stacks, classify_nfl_stacks, classify_nhl_stacks
+from .teams import LOGO_FILES
+
+
+class Sport:
+    """Rules for one sport's drafts.
+
+    ``stack_classifier`` takes a pick-level frame and returns stack labels
+    indexed by ``Draft Entry``; ``build_classifier`` (optional) takes the
+    entries x positions count frame and returns one build label per row.
+    ``logo_file`` names the bundled team metadata file.
+    """
+
+    def __init__(self, name, positions, stack_classifier, build_classifier=None,
+                 roster_size=ROSTER_SIZE, logo_file=None):
+        self.name = name
+        self.positions = list(positions)
+        self.stack_classifier = stack_classifier
+        self.build_classifier = build_classifier
+        self.roster_size = roster_size
+        self.logo_file = logo_file
+
+    def __repr__(self):
+        return f'Sport({self.name!r}, {self.positions!r})'
+
+
+# Registration order is detection priority: NBA and NHL share 'C', so a
+# pool drafted entirely at 'C' reads as NBA
+SPORTS = {}
+_position_bits = {}
+
+
+def register_sport(sport):
+    """Add ``sport`` to the registry (after every sport already registered)."""
+    if sport.name in SPORTS:
+        raise ValueError(f'Sport {sport.name!r} is already registered')
+    bit = 1 << len(SPORTS)
+    SPORTS[sport.name] = sport
+    for position in sport.positions:
+        _position_bits[position] = _position_bits.get(position, 0) | bit
+    if sport.logo_file:
+        LOGO_FILES[sport.name] = sport.logo_file
+    return sport
+
+
+def get_sport(name):
+    if name not in SPORTS:
+        raise KeyError(f'Unknown sport {name!r}')
+    return SPORTS[name]
+
+
+def all_positions():
+    """Every registered position, in registration order."""
+    return list(dict.fromkeys(pos for sport in SPORTS.values() for pos in sport.positions))
+
+
+def _position_codes(positions):
+    """Integer codes and their labels for a Position column (-1 for missing)."""
+    if isinstance(positions.dtype, pd.CategoricalDtype):
+        return positions.cat.codes.to_numpy(), positions.cat.categories
+    return pd.factorize(positions)
+
+
+def _sport_names(masks):
+    """Name of the first registered sport set in each mask (``None`` for 0)."""
+    names = np.array(list(SPORTS) + [None], dtype=object)
+    masks = np.asarray(masks, dtype=np.int64)
+    lowest = masks & -masks
+    index = np.where(masks > 0, np.log2(np.maximum(lowest, 1)).astype(np.int64), len(SPORTS))
+    return names[index]
+
+
+def _compatible_sports(position_codes, categories):
+    """Bitmask of sports that list every position present in the codes."""
+    table = np.array([_position_bits.get(pos, 0) for pos in categories], dtype=np.int64)
+    present = np.bincount(position_codes[position_codes >= 0], minlength=len(categories)) > 0
+    return int(np.bitwise_and.reduce(table[present], initial=(1 << len(SPORTS)) - 1))
+
+
+def detect_sport(df):
+    """Name of the first sport whose positions cover every position in ``df``."""
+    codes, categories = _position_codes(df['Position'])
+    sport = _sport_names([_compatible_sports(codes, categories)])[0]
+    if sport is None:
+        raise ValueError('Invalid position data in CSV')
+    return sport
+
+
+def detect_pool_sports(df):
+    """Sport of every draft pool, as a Series indexed by ``Draft Pool``.
+
+    Pools whose positions match no registered sport get ``None``.
+    """
+    pos_codes, categories = _position_codes(df['Position'])
+    pool_codes, pools = pd.factorize(df['Draft Pool'])
+    table = np.array([_position_bits.get(pos, 0) for pos in categories], dtype=np.int64)
+
+    # AND the sport bits of each distinct (pool, position) pair into its pool
+    has_pos = (pos_codes >= 0) & (pool_codes >= 0)
+    pairs = np.unique(pool_codes[has_pos].astype(np.int64) * len(categories) + pos_codes[has_pos])
+    masks = np.full(len(pools), (1 << len(SPORTS)) - 1, dtype=np.int64)
+    np.bitwise_and.at(masks, pairs // len(categories), table[pairs % len(categories)])
+    return pd.Series(_sport_names(masks), index=pd.Index(pools, name='Draft Pool'), name='Sport')
+
+
+def split_sports(df):
+    """Picks of ``df`` grouped by sport, detected per draft pool.
+
+    Returns a dict of sport name -> frame in registration order. Pools that
+    match no sport, or whose pick count is not a multiple of their sport's
+    roster size, are left out; a frame where no pool matches raises
+    ``ValueError``.
+    """
+    pool_sports = detect_pool_sports(df)
+    pool_picks = df.groupby('Draft Pool', observed=True).size()
+    sport_of_row = df['Draft Pool'].map(pool_sports).astype(object)
+    frames = {}
+    for name in pool_sports.dropna().unique():
+        sport = SPORTS[name]
+        pools = pool_sports.index[pool_sports.to_numpy() == name]
+        pools = pools[(pool_picks.reindex(pools, fill_value=0) % sport.roster_size == 0).to_numpy()]
+        rows = (sport_of_row == name).to_numpy() & df['Draft Pool'].isin(pools).to_numpy()
+        if rows.all():
+            frames[name] = df
+        elif rows.any():
+            frames[name] = df[rows]
+    if not frames:
+        raise ValueError('Invalid position data in CSV')
+    return {name: frames[name] for name in SPORTS if name in frames}
+
+
+def nfl_build_type(positions):
+    """Build label for one NFL draft from its position counts."""
+    if positions.get('QB', 0) != 1:  # Must have exactly 1 QB
+        return 'Invalid'
+    elif positions.get('RB', 0) == 2 and positions.get('WR', 0) == 2 and positions.get('TE', 0) == 1:
+        return '2 RB Build'
+    elif positions.get('RB', 0) == 1 and positions.get('WR', 0) == 3 and positions.get('TE', 0) == 1:
+        return '3 WR Build'
+    elif positions.get('TE', 0) == 2:
+        return '2 TE Build'
+    else:
+        return 'Other'
+
+
+def classify_nfl_builds(counts):
+    """``nfl_build_type`` for every row of an entries x positions count frame."""
+    qb, rb, wr, te = (counts[pos].to_numpy() for pos in ['QB', 'RB', 'WR', 'TE'])
+    return np.select(
+        [
+            qb != 1,
+            (rb == 2) & (wr == 2) & (te == 1),
+            (rb == 1) & (wr == 3) & (te == 1),
+            te == 2,
+        ],
+        ['Invalid', '2 RB Build', '3 WR Build', '2 TE Build'],
+        default='Other',
+    )
+
+
+NFL = register_sport(Sport(
+    'NFL', ['QB', 'RB', 'WR', 'TE'], classify_nfl_stacks,
+    build_classifier=classify_nfl_builds, logo_file='nfl_logos.csv',
+))
+NBA = register_sport(Sport(
+    'NBA', ['PG', 'SG', 'SF', 'PF', 'C'], classify_nba_stacks, logo_file='nba_logos.csv',
+))
+NHL = register_sport(Sport(
+    'NHL', ['C', 'LW', 'RW', 'D', 'G'], classify_nhl_stacks, logo_file='nhl_logos.csv',
+))
+
+NFL_POSITIONS = NFL.positions
+NBA_POSITIONS = NBA.positions
+NHL_POSITIONS = NHL.positions
@@ -0,0 +1,180 @@
+"""Columnar stack classification.
+
+Each classifier takes a pick-level frame (one row per pick) and returns a
+Series of stack labels indexed by ``Draft Entry``, matching what
+``groupby('Draft Entry').apply(analyze_stacks)`` produced in the dashboard.
+All three sports share one grouped pass that counts picks per
+(entry, team, position); labels are then assigned with array operations.
+"""
+import numpy as np
+import pandas as pd
+
+
+class StackCounts:
+    """Pick counts per observed (entry, team) pair.
+
+    ``pair_entry`` and ``pair_team`` hold the entry and team code of each
+    pair, ``counts`` is a (pairs x positions) matrix and ``positions`` names
+    its columns. Picks without a team are kept in their own pair with
+    ``pair_team == -1`` so per-entry totals still see them.
+    """
+
+    def __init__(self, df):
+        entry_codes, self.entries = pd.factorize(df['Draft Entry'], sort=True)
+        team_codes, self.teams = pd.factorize(df['Team'], sort=True)
+        pos_codes, positions = pd.factorize(df['Position'], sort=True)
+        self.positions = list(positions)
+
+        n_teams = len(self.teams) + 1
+        n_pos = len(self.positions) + 1
+        # Shift so picks without a team/position get code 0 instead of -1
+        pair_key = entry_codes.astype(np.int64) * n_teams + (team_codes + 1)
+        pair_keys, pair_index = np.unique(pair_key, return_inverse=True)
+
+        counts = np.bincount(
+            pair_index * n_pos + (pos_codes + 1),
+            minlength=len(pair_keys) * n_pos,
+        ).reshape(len(pair_keys), n_pos)
+
+        self.pair_entry = pair_keys // n_teams
+        self.pair_team = pair_keys % n_teams - 1
+        self.pair_total = counts.sum(axis=1)
+        self.counts = counts[:, 1:]
+
+    @property
+    def n_entries(self):
+        return len(self.entries)
+
+    def position(self, *names):
+        """Per-pair pick count summed over the given positions."""
+        total = np.zeros(len(self.pair_entry), dtype=np.int64)
+        for name in names:
+            if name in self.positions:
+                total += self.counts[:, self.positions.index(name)]
+        return total
+
+    def per_entry(self, values):
+        """Sum a per-pair array up to one value per entry."""
+        return np.bincount(
+            self.pair_entry, weights=values, minlength=self.n_entries
+        ).astype(np.int64)
+
+    def labels(self, labels):
+        """Wrap per-entry labels in a Series indexed like groupby output."""
+        index = pd.Index(self.entries, name='Draft Entry')
+        return pd.Series(labels, index=index, dtype=object)
+
+
+def classify_nfl_stacks(df):
+    """Label each entry by how many pass catchers share its QB's team."""
+    sc = StackCounts(df)
+    qb = sc.position('QB')
+    qb_per_entry = sc.per_entry(qb)
+
+    # With exactly one QB, only its pair contributes; teamless QBs never stack
+    has_team = sc.pair_team >= 0
+    stack_count = sc.per_entry(np.where(has_team, qb * (sc.pair_total - qb), 0))
+
+    labels = np.select(
+        [
+            qb_per_entry != 1,
+            stack_count == 0,
+            stack_count == 1,
+            stack_count == 2,
+        ],
+        ['Invalid', 'Naked QB', 'Skinny', 'Double'],
+        default='Triple+',
+    )
+    return sc.labels(labels)
+
+
+def _top_team_counts(sc, depth=3):
+    """Largest per-team pick counts for each entry, padded with zeros."""
+    has_team = sc.pair_team >= 0
+    pair_entry = sc.pair_entry[has_team]
+    pair_total = sc.pair_total[has_team]
+
+    # Sort pairs by entry, then by descending count, and rank within entry
+    order = np.lexsort((-pair_total, pair_entry))
+    pair_entry = pair_entry[order]
+    pair_total = pair_total[order]
+    starts = np.searchsorted(pair_entry, pair_entry, side='left')
+    rank = np.arange(len(pair_entry)) - starts
+
+    top = np.zeros((sc.n_entries, depth), dtype=np.int64)
+    keep = rank < depth
+    top[pair_entry[keep], rank[keep]] = pair_total[keep]
+    n_teams = np.bincount(pair_entry, minlength=sc.n_entries)
+    return top, n_teams
+
+
+def classify_nba_stacks(df):
+    """Label each entry by the shape of its team distribution (e.g. '3-2-1')."""
+    sc = StackCounts(df)
+    top, n_teams = _top_team_counts(sc)
+    first, second, third = top[:, 0], top[:, 1], top[:, 2]
+
+    labels = np.select(
+        [
+            n_teams == 6,
+            (first == 3) & (second == 3),
+            (first == 3) & (second == 2),
+            first == 3,
+            (first == 2) & (second == 2) & (third == 2),
+            (first == 2) & (second == 2),
+            first == 2,
+        ],
+        ['6 Unique', '3-3', '3-2-1', '3-1-1-1', '2-2-2', '2-2-1-1', '2-1-1-1-1'],
+        default='Other',
+    )
+    return sc.labels(labels)
+
+
+def classify_nhl_stacks(df):
+    """Label each entry by its strongest skater stack (goalies ignored)."""
+    sc = StackCounts(df)
+    has_team = sc.pair_team >= 0
+    c = sc.position('C') > 0
+    w = sc.position('LW', 'RW') > 0
+    d = sc.position('D') > 0
+
+    # Per-team stack: 0 none, 1 C-W, 2 C-D, 3 W-D, 4 C-W-D
+    team_stack = np.select(
+        [c & w & d, c & w, c & d, w & d],
+        [4, 1, 2, 3],
+        default=0,
+    )
+    team_stack[~has_team] = 0
+
+    # A C-W-D stack wins outright; otherwise the first stacked team in team
+    # order decides, since all other stack names tie on length
+    has_cwd = sc.per_entry(team_stack == 4) > 0
+    stacked = np.flatnonzero(team_stack > 0)
+    first_stack = np.zeros(sc.n_entries, dtype=np.int64)
+    entries, first = np.unique(sc.pair_entry[stacked], return_index=True)
+    first_stack[entries] = team_stack[stacked[first]]
+    first_stack[has_cwd] = 4
+
+    names = np.array(['No Stack', 'C-W', 'C-D', 'W-D', 'C-W-D'], dtype=object)
+    return sc.labels(names[first_stack])
+
+
+def primary_stack_team(df):
+    """Team with the most picks in each entry, or ``None`` if no team has two.
+
+    Ties go to the first team in team order.
+    """
+    sc = StackCounts(df)
+    has_team = sc.pair_team >= 0
+    pair_entry = sc.pair_entry[has_team]
+    pair_team = sc.pair_team[has_team]
+    pair_total = sc.pair_total[has_team]
+
+    order = np.lexsort((-pair_total, pair_entry))
+    entries, first = np.unique(pair_entry[order], return_index=True)
+    top = order[first]
+
+    teams = np.full(sc.n_entries, None, dtype=object)
+    stacked = pair_total[top] >= 2
+    teams[entries[stacked]] = np.asarray(sc.teams, dtype=object)[pair_team[top][stacked]]
+    return sc.labels(teams)
@@ -0,0 +1,126 @@
+"""Persistent local store for incremental imports.
+
+Picks and per-entry summaries are kept as Parquet part files under one
+directory. Appending an export only writes the picks of draft entries the
+store has not seen, plus summaries for just those entries, so a weekly
+re-download of the full history costs a diff instead of a rebuild. Reading
+the portfolio back is a columnar read of the parts.
+"""
+from pathlib import Path
+
+import pandas as pd
+
+from .entries import summarize_entries
+from .ingest import concat_drafts
+from .sports import all_positions, split_sports
+
+PICKS_DIR = 'picks'
+ENTRIES_DIR = 'entries'
+
+
+class DraftStore:
+    """Append-only Parquet store rooted at ``root``."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.picks_dir = self.root / PICKS_DIR
+        self.entries_dir = self.root / ENTRIES_DIR
+
+    def _parts(self, directory):
+        return sorted(directory.glob('part-*.parquet'))
+
+    def _next_part(self):
+        existing = [int(path.stem.split('-')[1]) for path in self._parts(self.picks_dir)]
+        return f'part-{max(existing, default=-1) + 1:05d}.parquet'
+
+    def _drop_orphans(self):
+        # A picks part without its entries part is left by an interrupted
+        # append; its entries are still unknown and are stored again
+        for path in self._parts(self.picks_dir):
+            if not (self.entries_dir / path.name).exists():
+                path.unlink()
+
+    def _read(self, directory, columns=None):
+        parts = [pd.read_parquet(path, columns=columns) for path in self._parts(directory)]
+        return concat_drafts(parts) if parts else None
+
+    def known_entries(self):
+        """Draft Entry ids already stored (reads a single column)."""
+        entries = self._read(self.entries_dir, columns=['Draft Entry'])
+        if entries is None:
+            return pd.Index([], name='Draft Entry')
+        return pd.Index(entries['Draft Entry'].astype(str).unique(), name='Draft Entry')
+
+    def load_picks(self):
+        """Every stored pick as one normalized frame (``None`` when empty)."""
+        return self._read(self.picks_dir)
+
+    def load_entries(self):
+        """Per-entry summaries of every stored entry, indexed by ``Draft Entry``."""
+        entries = self._read(self.entries_dir)
+        if entries is None:
+            return None
+        entries = entries.set_index('Draft Entry')
+        # Parts written for another sport have no columns for these positions
+        counts = [pos for pos in all_positions() if pos in entries.columns]
+        entries[counts] = entries[counts].fillna(0).astype('int8')
+        return entries
+
+    def append(self, df, sport=None):
+        """Store the picks of entries not seen before; returns how many entries were new.
+
+        Only picks of pools that ``split_sports`` accepts are stored, so an
+        unfinished draft (or a pool of no known sport) is left out and picked
+        up again by a later append once it is complete.
+        """
+        self._drop_orphans()
+        known = self.known_entries()
+        new = df[~df['Draft Entry'].astype(str).isin(known)]
+        if new.empty:
+            return 0
+
+        if sport is None:
+            # Mixed-sport exports are summarized one sport at a time
+            try:
+                frames = split_sports(new)
+            except ValueError:
+                # Nothing new but pools that are still skipped
+                if len(known):
+                    return 0
+                raise
+            new = concat_drafts(list(frames.values()))
+            entries = pd.concat([summarize_entries(frame, name) for name, frame in frames.items()])
+            entries = entries.reset_index()
+        else:
+            entries = summarize_entries(new, sport).reset_index()
+        new = new.apply(
+            lambda col: col.cat.remove_unused_categories()
+            if isinstance(col.dtype, pd.CategoricalDtype) else col
+        )
+
+        self.picks_dir.mkdir(parents=True, exist_ok=True)
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+        part = self._next_part()
+        tmp = f'{part}.tmp'
+        # Both parts are written under temporary names first, so a failed
+        # write leaves no part behind and the append is retried in full
+        new.to_parquet(self.picks_dir / tmp, index=False)
+        entries.to_parquet(self.entries_dir / tmp, index=False)
+        (self.picks_dir / tmp).rename(self.picks_dir / part)
+        (self.entries_dir / tmp).rename(self.entries_dir / part)
+        return len(entries)
+
+    def compact(self):
+        """Rewrite all parts as a single part each for picks and entries."""
+        picks = self.load_picks()
+        entries = self._read(self.entries_dir)
+        if picks is None:
+            return
+        old_parts = self._parts(self.picks_dir) + self._parts(self.entries_dir)
+        tmp = 'compact.parquet.tmp'
+        picks.to_parquet(self.picks_dir / tmp, index=False)
+        entries.to_parquet(self.entries_dir / tmp, index=False)
+        for path in old_parts:
+            path.unlink()
+        (self.picks_dir / tmp).rename(self.picks_dir / 'part-00000.parquet')
+        (self.entries_dir / tmp).rename(self.entries_dir / 'part-00000.parquet')
@@ -0,0 +1,213 @@
+"""Exposure aggregates computed by streaming over an export.
+
+``StreamingExposures`` never keeps picks around. A first pass reads only
+``Draft Pool`` (and ``Position``, to detect each pool's sport) to count
+picks per pool, which decides which pools are valid. A second pass drops
+picks from invalid pools chunk by chunk and folds the rest into running
+per-player and per-entry totals. Memory is bounded by the
+chunk size plus the number of distinct players and entries, not by the
+number of rows.
+"""
+import io
+
+import pandas as pd
+
+from .ingest import CHUNKSIZE, ROSTER_SIZE, read_draft_chunks
+from .sports import SPORTS, detect_pool_sports, detect_sport
+
+# Picked At and Draft Pool Title are not needed for these aggregates
+STREAM_COLUMNS = [
+    'First Name',
+    'Last Name',
+    'Position',
+    'Team',
+    'Draft Pool',
+    'Draft Pool Entry Fee',
+    'Draft Entry',
+    'Pick Number',
+]
+PLAYER_KEY = ['Player', 'Position', 'Team']
+
+# Partial aggregates are merged into the running totals every this many chunks
+MERGE_EVERY = 8
+
+
+def _string_index(agg):
+    # Chunks carry their own categories; plain strings merge across chunks
+    if isinstance(agg.index, pd.MultiIndex):
+        agg.index = agg.index.set_levels([level.astype('string') for level in agg.index.levels])
+    else:
+        agg.index = agg.index.astype('string')
+    return agg
+
+
+def count_pool_picks(source, chunksize=CHUNKSIZE):
+    """Picks per ``Draft Pool``, reading only that column."""
+    counts = pd.Series(dtype='int64')
+    for chunk in read_draft_chunks(source, chunksize, columns=['Draft Pool']):
+        pool_picks = _string_index(chunk.groupby('Draft Pool', observed=True).size())
+        counts = counts.add(pool_picks, fill_value=0)
+    return counts.astype('int64')
+
+
+def scan_pools(source, chunksize=CHUNKSIZE):
+    """Picks and sport of every ``Draft Pool``, reading only Draft Pool and Position.
+
+    Returns a frame indexed by ``Draft Pool`` with ``Picks`` and ``Sport``
+    columns (``None`` for pools of no registered sport, as in
+    ``detect_pool_sports``).
+    """
+    counts = pd.Series(dtype='int64')
+    pairs = []
+    for chunk in read_draft_chunks(source, chunksize, columns=['Draft Pool', 'Position']):
+        pool_picks = _string_index(chunk.groupby('Draft Pool', observed=True).size())
+        counts = counts.add(pool_picks, fill_value=0)
+        # Each pool's sport only depends on which positions it holds
+        pairs.append(chunk.astype('string').drop_duplicates())
+        if len(pairs) > MERGE_EVERY:
+            pairs = [pd.concat(pairs).drop_duplicates()]
+    pools = counts.astype('int64').rename('Picks').rename_axis('Draft Pool').to_frame()
+    if not pairs:
+        return pools.assign(Sport=pd.Series(dtype=object))
+    pool_sports = detect_pool_sports(pd.concat(pairs))
+    pools['Sport'] = pool_sports.reindex(pools.index).astype(object)
+    return pools
+
+
+class StreamingExposures:
+    """Running exposure totals fed one pick-level chunk at a time.
+
+    ``valid_pools`` must be known up front (see ``count_pool_picks``);
+    picks from other pools are ignored. ``sport`` names the sport of those
+    pools when known; otherwise ``summary`` detects it from the positions.
+    """
+
+    def __init__(self, valid_pools, sport=None):
+        self.valid_pools = pd.Index(valid_pools, dtype='string')
+        self.sport = sport
+        self._players = []
+        self._entries = []
+
+    def update(self, chunk):
+        """Fold one chunk of picks into the running totals."""
+        chunk = chunk[chunk['Draft Pool'].astype('string').isin(self.valid_pools)]
+        player = (
+            chunk['First Name'].astype('string').fillna('') + ' '
+            + chunk['Last Name'].astype('string').fillna('')
+        ).str.strip()
+        chunk = chunk.assign(Player=player)
+
+        players = chunk.groupby(PLAYER_KEY, observed=True).agg(
+            picks=('Draft Entry', 'size'),
+            fees=('Draft Pool Entry Fee', 'sum'),
+        )
+        entries = chunk.groupby('Draft Entry', observed=True).agg(
+            first_pick=('Pick Number', 'min'),
+        )
+        self._players.append(_string_index(players))
+        self._entries.append(_string_index(entries))
+        if len(self._players) > MERGE_EVERY:
+            self._compact()
+
+    @staticmethod
+    def _merge(parts, how):
+        if len(parts) == 1:
+            return parts
+        merged = pd.concat(parts)
+        return [merged.groupby(level=list(range(merged.index.nlevels))).agg(how)]
+
+    def _compact(self):
+        self._players = self._merge(self._players, 'sum')
+        self._entries = self._merge(self._entries, 'min')
+
+    @classmethod
+    def from_source(cls, source, chunksize=CHUNKSIZE):
+        """Aggregate an export (path, seekable buffer or bytes) in two passes."""
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+        pool_picks = count_pool_picks(source, chunksize)
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        totals = cls(pool_picks.index[pool_picks % ROSTER_SIZE == 0])
+        for chunk in read_draft_chunks(source, chunksize, columns=STREAM_COLUMNS):
+            totals.update(chunk)
+        return totals
+
+    @classmethod
+    def by_sport(cls, source, chunksize=CHUNKSIZE):
+        """Totals per sport of an export, keyed by sport name.
+
+        Like ``ExposureReport.by_sport``, the sport is detected per draft
+        pool, so mixed-sport exports give one entry per sport. A pool is
+        valid when its pick count is a multiple of its sport's roster size;
+        ``ValueError`` if no pool is valid. Both passes read the export once,
+        whatever the number of sports.
+        """
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+        pools = scan_pools(source, chunksize)
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        totals = {}
+        for name, sport in SPORTS.items():
+            of_sport = pools[(pools['Sport'] == name).to_numpy()]
+            valid = of_sport.index[(of_sport['Picks'] % sport.roster_size == 0).to_numpy()]
+            if len(valid):
+                totals[name] = cls(valid, sport=name)
+        if not totals:
+            raise ValueError('Invalid position data in CSV')
+        for chunk in read_draft_chunks(source, chunksize, columns=STREAM_COLUMNS):
+            for sport_totals in totals.values():
+                sport_totals.update(chunk)
+        return totals
+
+    def draft_positions(self):
+        """First pick of every entry in a valid pool."""
+        if not self._entries:
+            return pd.DataFrame(columns=['Draft Entry', 'Draft Position'])
+        self._compact()
+        return (
+            self._entries[0]['first_pick']
+            .rename('Draft Position')
+            .rename_axis('Draft Entry')
+            .reset_index()
+        )
+
+    @property
+    def total_drafts(self):
+        if not self._entries:
+            return 0
+        self._compact()
+        return len(self._entries[0])
+
+    def exposures(self):
+        """Per-player table matching ``engine.exposure_table`` without filters."""
+        columns = ['Player', 'Position', 'Team', 'Total Drafts', 'Total Entry Fees', 'Exposure %']
+        if not self._players:
+            return pd.DataFrame(columns=columns)
+        self._compact()
+        exposures = (
+            self._players[0]
+            .reset_index()
+            .rename(columns={'picks': 'Total Drafts', 'fees': 'Total Entry Fees'})
+        )
+        exposures['Exposure %'] = (exposures['Total Drafts'] / self.total_drafts * 100).round(1)
+        return exposures[columns].sort_values('Exposure %', ascending=False)
+
+    def summary(self):
+        """Headline metrics in the shape of ``ExposureReport.summary``."""
+        total = self.total_drafts
+        avg_position = self.draft_positions()['Draft Position'].mean()
+        return {
+            'sport': self.sport or detect_sport(self.exposures()),
+            'total_drafts': int(total),
+            'filtered_drafts': int(total),
+            'filtered_pct': 100.0 if total else 0.0,
+            'avg_draft_position': None if pd.isna(avg_position) else round(float(avg_position), 1),
+        }
+
+    def tables(self):
+        return {
+            'exposures': self.exposures(),
+            'draft_positions': self.draft_positions(),
+        }
@@ -0,0 +1,85 @@
+"""Team metadata (names, colors, logos) from the logo files bundled with the package.
+
+Each sport's file is read at most once per process, and only when that sport
+is requested; every session of the dashboard shares the same read-only
+tables and color maps. Refreshing from GitHub is never implicit: call
+``refresh_team_metadata`` to replace the bundled copy with the remote one.
+"""
+import threading
+from pathlib import Path
+from types import MappingProxyType
+
+import pandas as pd
+
+# Installed with the package as package data (see pyproject.toml)
+DATA_DIR = Path(__file__).resolve().parent / 'data'
+REMOTE_BASE_URL = 'https://raw.githubusercontent.com/louissherman/UDexposures/main/udexposures/data/'
+
+LOGO_FILES = {
+    'NFL': 'nfl_logos.csv',
+    'NBA': 'nba_logos.csv',
+    'NHL': 'nhl_logos.csv',
+    'MLB': 'mlb_logos.csv',
+}
+
+# Default to white if a team is not found
+DEFAULT_COLOR = '#FFFFFF'
+
+# The logo files name the same fields differently; map them onto one schema
+COLUMN_ALIASES = {
+    'team_name': 'name',
+    'team_full': 'name',
+    'Color': 'color',
+    'primary': 'color',
+    'secondary': 'secondary_color',
+    'URL': 'logo',
+}
+COLUMNS = ['name', 'color', 'secondary_color', 'logo']
+
+_registry = {}
+_colors = {}
+_lock = threading.Lock()
+
+
+def _read_logo_file(source):
+    raw = pd.read_csv(source).rename(columns=COLUMN_ALIASES)
+    meta = raw.reindex(columns=['Team'] + COLUMNS)
+    # Files without abbreviations (MLB) are keyed by the full team name
+    meta['Team'] = meta['Team'].fillna(meta['name'])
+    return meta.set_index('Team')
+
+
+def _sport_key(sport):
+    sport = sport.upper()
+    if sport not in LOGO_FILES:
+        raise KeyError(f'No team metadata for sport {sport!r}')
+    return sport
+
+
+def team_metadata(sport):
+    """Team metadata for one sport, indexed by team abbreviation."""
+    sport = _sport_key(sport)
+    with _lock:
+        if sport not in _registry:
+            _registry[sport] = _read_logo_file(DATA_DIR / LOGO_FILES[sport])
+        return _registry[sport]
+
+
+def team_colors(sport):
+    """Read-only mapping of team abbreviation to primary color."""
+    sport = _sport_key(sport)
+    meta = team_metadata(sport)
+    with _lock:
+        if sport not in _colors:
+            _colors[sport] = MappingProxyType(dict(zip(meta.index, meta['color'].fillna(DEFAULT_COLOR))))
+        return _colors[sport]
+
+
+def refresh_team_metadata(sport, base_url=REMOTE_BASE_URL):
+    """Re-download a sport's logo file and replace the in-memory copy."""
+    sport = _sport_key(sport)
+    meta = _read_logo_file(base_url + LOGO_FILES[sport])
+    with _lock:
+        _registry[sport] = meta
+        _colors.pop(sport, None)
+    return meta
@@ -0,0 +1,192 @@
+"""Player exposure over time, from each draft's ``Picked At``.
+
+A draft is dated by its first pick. ``ExposureTimeline`` sorts the drafts by
+date once and keeps one sorted (player, draft rank) key per player-draft
+pair. Every view is then array arithmetic over those keys:
+
+- "as of" snapshots are a binary search per player for the cutoff rank
+- daily/weekly buckets are one bincount over player x bucket
+- rolling N-draft windows are differences of per-player cumulative counts
+
+so nothing is re-filtered or re-grouped per date, bucket or window.
+"""
+import numpy as np
+import pandas as pd
+
+from .encoding import DraftEncoding
+
+# Bucket sizes accepted by ExposureTimeline.buckets
+FREQUENCIES = {'D': 'Daily', 'W': 'Weekly'}
+
+
+def _bucket_starts(times, freq):
+    """Start of the day ('D') or Monday-based week ('W') of each time."""
+    days = times.floor('D')
+    if freq == 'D':
+        return days
+    if freq == 'W':
+        return days - pd.to_timedelta(days.weekday, unit='D')
+    raise ValueError(f'Unknown bucket frequency {freq!r}; use one of {list(FREQUENCIES)}')
+
+
+class ExposureTimeline:
+    """Dated drafts and per-player draft ranks for one pick-level frame.
+
+    Drafts without any parseable ``Picked At`` are left out. Pass the
+    upload's ``encoding`` to reuse its codes.
+    """
+
+    def __init__(self, df, encoding=None):
+        encoding = encoding or DraftEncoding(df)
+        entry_codes, entries = encoding.entry_codes, encoding.entries
+        player_codes, self.players = encoding.player_codes, encoding.players
+        self.player_info = encoding.player_info
+
+        # Date every draft by its first pick, then rank the drafts by date. Work on
+        # the integer timestamps: tz-aware values would go through Python objects
+        picked = pd.DatetimeIndex(df['Picked At'])
+        undated = np.iinfo(np.int64).max
+        stamps = np.where(picked.isna(), undated, picked.asi8)
+        started = (
+            pd.Series(stamps[entry_codes >= 0]).groupby(entry_codes[entry_codes >= 0]).min()
+            .reindex(np.arange(len(entries)), fill_value=undated)
+            .to_numpy()
+        )
+        dated = started != undated
+        order = np.flatnonzero(dated)[np.argsort(started[dated], kind='stable')]
+        rank = np.full(len(entries), -1, dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        self.entries = pd.Index(entries[order], name='Draft Entry')
+        times = pd.DatetimeIndex(started[order].astype(f'datetime64[{picked.unit}]'), name='Drafted At')
+        self.entry_times = times.tz_localize('UTC').tz_convert(picked.tz) if picked.tz else times
+
+        # One sorted key per player and draft: player * n_entries + draft rank
+        pick_rank = np.where(entry_codes >= 0, rank[entry_codes], -1)
+        keep = (pick_rank >= 0) & (player_codes >= 0)
+        keys = np.sort(player_codes[keep].astype(np.int64) * self.n_entries + pick_rank[keep])
+        self._keys = keys[np.r_[True, keys[1:] != keys[:-1]]] if len(keys) else keys
+        self._starts = np.searchsorted(self._keys, np.arange(len(self.players) + 1) * self.n_entries)
+        self.player_drafts = np.diff(self._starts)
+
+    @property
+    def n_entries(self):
+        return len(self.entries)
+
+    @property
+    def start(self):
+        return self.entry_times[0] if self.n_entries else None
+
+    @property
+    def end(self):
+        return self.entry_times[-1] if self.n_entries else None
+
+    def player_codes(self, players):
+        """Codes of the given players; names not in the timeline are skipped."""
+        codes = self.players.get_indexer(list(players))
+        return codes[codes >= 0]
+
+    def top_players(self, n=5):
+        """The ``n`` most drafted players, most drafted first."""
+        return list(self.players[np.argsort(-self.player_drafts, kind='stable')[:n]])
+
+    def drafts_as_of(self, when):
+        """Number of drafts started at or before ``when``."""
+        when = pd.Timestamp(when)
+        if when.tzinfo is None and self.entry_times.tz is not None:
+            when = when.tz_localize(self.entry_times.tz)
+        return int(self.entry_times.searchsorted(when, side='right'))
+
+    def snapshot(self, when):
+        """Exposure table as it stood at ``when`` (drafts started up to then).
+
+        Same columns as ``engine.exposure_table`` minus entry fees, plus the
+        change against the full timeline.
+        """
+        cutoff = self.drafts_as_of(when)
+        bounds = np.arange(len(self.players)) * self.n_entries
+        drafts = np.searchsorted(self._keys, bounds + cutoff) - self._starts[:-1]
+        exposure = (drafts / max(cutoff, 1) * 100).round(1)
+        overall = (self.player_drafts / max(self.n_entries, 1) * 100).round(1)
+        result = self.player_info.assign(**{
+            'Total Drafts': drafts,
+            'Exposure %': exposure,
+            'Change Since %': (overall - exposure).round(1),
+        })
+        return (
+            result[drafts > 0]
+            .sort_values(['Exposure %', 'Player'], ascending=[False, True])
+            .reset_index(drop=True)
+        )
+
+    def draft_counts(self, freq='D'):
+        """Number of drafts started in each day or week."""
+        return (
+            pd.Series(1, index=_bucket_starts(self.entry_times, freq))
+            .groupby(level=0).sum()
+            .rename('Drafts')
+            .rename_axis('Period')
+        )
+
+    def buckets(self, freq='D', players=None, cumulative=False):
+        """Exposure % per day or week, one column per player (default: all).
+
+        Each value is the share of that period's drafts containing the player;
+        with ``cumulative`` it is the share of all drafts up to the period's end.
+        """
+        bucket, periods = pd.factorize(_bucket_starts(self.entry_times, freq), sort=True)
+        key_player = self._keys // max(self.n_entries, 1)
+        key_bucket = bucket[self._keys % max(self.n_entries, 1)]
+        if players is None:
+            codes = np.arange(len(self.players))
+            column = key_player
+        else:
+            # Map the requested players to columns and drop every other key
+            codes = self.player_codes(players)
+            lookup = np.full(len(self.players), -1)
+            lookup[codes] = np.arange(len(codes))
+            column = lookup[key_player]
+            key_bucket = key_bucket[column >= 0]
+            column = column[column >= 0]
+
+        # One bincount over player x bucket
+        counts = np.bincount(
+            column * len(periods) + key_bucket, minlength=len(codes) * len(periods)
+        ).reshape(len(codes), len(periods)).T
+        drafts = np.bincount(bucket, minlength=len(periods))
+        if cumulative:
+            counts = counts.cumsum(axis=0)
+            drafts = drafts.cumsum()
+
+        return pd.DataFrame(
+            (counts / np.maximum(drafts, 1)[:, None] * 100).round(1),
+            index=periods.rename('Period'),
+            columns=self.players[codes],
+        )
+
+    def rolling(self, players, window=100, max_points=500):
+        """Exposure % over the last ``window`` drafts, after every draft.
+
+        Indexed by the start time of the draft closing each window; windows
+        are shorter than ``window`` until that many drafts exist. At most
+        ``max_points`` evenly spaced windows are returned.
+        """
+        codes = self.player_codes(players)
+        n = self.n_entries
+        if n == 0 or len(codes) == 0:
+            return pd.DataFrame(index=pd.DatetimeIndex([], name='Drafted At'), columns=self.players[codes])
+
+        # Per-player running count of drafts containing the player, by draft rank
+        hits = np.zeros((len(codes), n + 1), dtype=np.int64)
+        for row, code in enumerate(codes):
+            hits[row, self._keys[self._starts[code]:self._starts[code + 1]] - code * n + 1] = 1
+        running = hits.cumsum(axis=1)
+
+        closes = np.unique(np.linspace(0, n - 1, min(n, max_points)).round().astype(np.int64))
+        opens = np.maximum(closes + 1 - window, 0)
+        in_window = running[:, closes + 1] - running[:, opens]
+        exposure = in_window / (closes + 1 - opens) * 100
+        return pd.DataFrame(
+            exposure.T.round(1),
+            index=self.entry_times[closes],
+            columns=self.players[codes],
+        )